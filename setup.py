@@ -68,6 +68,16 @@ setup(
             "h5py>=3.6.0",
             "netCDF4>=1.5.0",
         ],
+        "onnx": [
+            "onnxruntime>=1.12.0",
+            "tf2onnx>=1.13.0",
+            "onnxmltools>=1.11.0",
+        ],
+        "fast": [
+            "numba>=0.56.0",
+            "orjson>=3.6.0",
+            "pyarrow>=7.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=23.0.0",
@@ -83,6 +93,12 @@ setup(
             "plotly>=5.5.0",
             "h5py>=3.6.0",
             "netCDF4>=1.5.0",
+            "numba>=0.56.0",
+            "orjson>=3.6.0",
+            "pyarrow>=7.0.0",
+            "onnxruntime>=1.12.0",
+            "tf2onnx>=1.13.0",
+            "onnxmltools>=1.11.0",
         ],
     },
     entry_points={
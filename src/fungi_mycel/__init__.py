@@ -27,20 +27,44 @@ __author__ = "Samir Baladi"
 __email__ = "gitdeeper@gmail.com"
 __doi__ = "10.14293/FUNGI-MYCEL.2026.001"
 
-# Import main components
-from fungi_mycel.core import MNIS, compute_mnis
-from fungi_mycel.parameters import (
-    eta_nw,      # Natural Weathering Efficiency
-    rho_e,       # Bioelectrical Pulse Density
-    grad_c,      # Chemotropic Navigation
-    ser,         # Symbiotic Exchange Ratio
-    k_topo,      # Topological Expansion
-    e_a,         # Adaptive Resilience
-    abi,         # Biodiversity Amplification
-    bfs          # Biological Field Stability
-)
-from fungi_mycel.models import AIEnsemble
-from fungi_mycel.utils import validate_data, load_site
+import importlib
+
+# Public names are resolved lazily (PEP 562) so that importing the package,
+# e.g. for ``fungi-mycel --help``, does not pull in the ML stack.
+# Maps attribute name -> (module path, attribute or None for a submodule).
+_LAZY = {
+    'MNIS': ('fungi_mycel.core', 'MNIS'),
+    'compute_mnis': ('fungi_mycel.core', 'compute_mnis'),
+    'eta_nw': ('fungi_mycel.parameters.eta_nw', None),   # Natural Weathering Efficiency
+    'rho_e': ('fungi_mycel.parameters.rho_e', None),     # Bioelectrical Pulse Density
+    'grad_c': ('fungi_mycel.parameters.grad_c', None),   # Chemotropic Navigation
+    'ser': ('fungi_mycel.parameters.ser', None),         # Symbiotic Exchange Ratio
+    'k_topo': ('fungi_mycel.parameters.k_topo', None),   # Topological Expansion
+    'e_a': ('fungi_mycel.parameters.e_a', None),         # Adaptive Resilience
+    'abi': ('fungi_mycel.parameters.abi', None),         # Biodiversity Amplification
+    'bfs': ('fungi_mycel.parameters.bfs', None),         # Biological Field Stability
+    'AIEnsemble': ('fungi_mycel.models', 'AIEnsemble'),
+    'validate_data': ('fungi_mycel.utils', 'validate_data'),
+    'load_site': ('fungi_mycel.utils', 'load_site'),
+}
+
+
+def __getattr__(name):
+    """Import public components on first access."""
+    try:
+        module_path, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    module = importlib.import_module(module_path)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'MNIS',
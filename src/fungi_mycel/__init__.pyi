@@ -0,0 +1,20 @@
+from fungi_mycel.core import MNIS as MNIS, compute_mnis as compute_mnis
+from fungi_mycel.parameters import (
+    eta_nw as eta_nw,
+    rho_e as rho_e,
+    grad_c as grad_c,
+    ser as ser,
+    k_topo as k_topo,
+    e_a as e_a,
+    abi as abi,
+    bfs as bfs,
+)
+from fungi_mycel.models import AIEnsemble as AIEnsemble
+from fungi_mycel.utils import validate_data as validate_data, load_site as load_site
+
+__version__: str
+__author__: str
+__email__: str
+__doi__: str
+
+__all__: list[str]
@@ -0,0 +1,44 @@
+"""
+Optional numba support shared by the compiled kernels.
+
+numba is imported on first access to one of the names below (PEP 562), so
+modules that only import this one, or only need a kernel on some code paths,
+do not pay numba's import time up front. Without numba, njit and vectorize
+are no-op decorators and prange is range, so kernel modules stay importable
+and run as plain Python/NumPy; check NUMBA_AVAILABLE before relying on
+compilation.
+"""
+
+__all__ = ['NUMBA_AVAILABLE', 'njit', 'prange', 'vectorize']
+
+
+def _njit_stub(*args, **kwargs):
+    """No-op stand-in for numba.njit so the kernels stay importable."""
+    if len(args) == 1 and callable(args[0]):
+        return args[0]
+    return lambda func: func
+
+
+def __getattr__(name):
+    """Import numba, or fall back to the stand-ins, on first use."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        import numba
+        values = {
+            'NUMBA_AVAILABLE': True,
+            'njit': numba.njit,
+            'prange': numba.prange,
+            'vectorize': numba.vectorize,
+        }
+    except ImportError:
+        # Functions given to vectorize must then already broadcast with NumPy
+        values = {
+            'NUMBA_AVAILABLE': False,
+            'njit': _njit_stub,
+            'prange': range,
+            'vectorize': _njit_stub,
+        }
+    globals().update(values)
+    return values[name]
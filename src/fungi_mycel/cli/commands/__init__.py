@@ -0,0 +1,6 @@
+"""
+FUNGI-MYCEL CLI subcommands
+
+Each module defines a ``cmd`` click command. Modules are imported by
+``fungi_mycel.cli.main.LazyGroup`` only when their command is invoked.
+"""
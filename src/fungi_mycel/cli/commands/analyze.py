@@ -0,0 +1,78 @@
+"""
+``fungi-mycel analyze`` - compute MNIS for a site.
+"""
+
+import click
+
+from fungi_mycel.cli.main import Colors, get_mnis, print_banner
+
+
+@click.command('analyze')
+@click.option('--site', required=True, help='Site ID')
+@click.option('--parameters', help='Parameters file (JSON)')
+@click.option('--output', '-o', help='Output file')
+def cmd(site, parameters, output):
+    """Analyze site data and compute MNIS."""
+    print_banner()
+    print(f"\n{Colors.BOLD}Analyzing site: {site}{Colors.END}\n")
+    
+    try:
+        from fungi_mycel.io import export_to_json
+        from fungi_mycel.utils import load_site
+        
+        # Load site data
+        site_data = load_site(site)
+        
+        # Load parameters
+        if parameters:
+            import json
+            
+            with open(parameters, 'r') as f:
+                params = json.load(f)
+        else:
+            # Simulate parameters for demo
+            params = {
+                'eta_nw': 0.72,
+                'rho_e': 0.68,
+                'grad_c': 0.71,
+                'ser': 1.05,
+                'k_topo': 1.72,
+                'e_a': 0.65,
+                'abi': 1.84,
+                'bfs': 0.58,
+            }
+        
+        # Compute MNIS
+        biome = site_data.get('biome', 'temperate_broadleaf')
+        calculator = get_mnis(biome)
+        result = calculator.compute(params)
+        
+        # Display results
+        print(f"{Colors.BOLD}MNIS Result:{Colors.END}")
+        print(f"  Score: {result.mnis_score:.3f}")
+        print(f"  Class: {result.class_name}")
+        print(f"  Biome: {result.biome}")
+        
+        print(f"\n{Colors.BOLD}Parameters:{Colors.END}")
+        for param, value in result.parameters.items():
+            norm = result.normalized_params[param]
+            print(f"  {param:8}: {value:.3f} → {norm:.3f}")
+        
+        if result.warning_flags:
+            print(f"\n{Colors.YELLOW}Warnings:{Colors.END}")
+            for warning in result.warning_flags:
+                print(f"  ⚠️ {warning}")
+        
+        # Export if requested
+        if output:
+            from pathlib import Path
+            
+            output_path = Path(output)
+            export_to_json(result.to_dict(), output_path)
+            print(f"\n{Colors.GREEN}Results exported to {output_path}{Colors.END}")
+        
+        return 0
+        
+    except Exception as e:
+        print(f"{Colors.RED}Error: {e}{Colors.END}")
+        return 1
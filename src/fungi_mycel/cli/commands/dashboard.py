@@ -0,0 +1,46 @@
+"""
+``fungi-mycel dashboard`` - interactive dashboard launcher.
+"""
+
+import click
+
+from fungi_mycel.cli.main import Colors, print_banner
+
+DASHBOARD_AVAILABLE = None  # resolved by _load_dashboard()
+
+
+def _load_dashboard():
+    """Import the dashboard runner, recording whether it is available."""
+    global DASHBOARD_AVAILABLE
+    try:
+        from fungi_mycel.visualization.dashboard import run_dashboard
+    except ImportError:
+        DASHBOARD_AVAILABLE = False
+        return None
+    DASHBOARD_AVAILABLE = True
+    return run_dashboard
+
+
+@click.command('dashboard')
+@click.option('--port', type=int, default=8501, show_default=True, help='Port to run on')
+@click.option('--backend', type=click.Choice(['streamlit', 'dash']), default='streamlit',
+              show_default=True, help='Dashboard backend')
+def cmd(port, backend):
+    """Launch interactive dashboard."""
+    print_banner()
+    print(f"\n{Colors.BOLD}Launching interactive dashboard...{Colors.END}")
+    print(f"Port: {port}")
+    print(f"Backend: {backend}\n")
+    
+    run_dashboard = _load_dashboard()
+    if not DASHBOARD_AVAILABLE:
+        print(f"{Colors.RED}Dashboard dependencies not installed.{Colors.END}")
+        print("Install with: pip install fungi-mycel[dashboard]")
+        return 1
+    
+    try:
+        run_dashboard(backend=backend, port=port)
+        return 0
+    except Exception as e:
+        print(f"{Colors.RED}Error: {e}{Colors.END}")
+        return 1
@@ -0,0 +1,99 @@
+"""
+``fungi-mycel doctor`` - system diagnostics.
+"""
+
+import functools
+import importlib.metadata as importlib_metadata
+import importlib.util
+import sys
+from pathlib import Path
+
+import click
+
+from fungi_mycel.cli.main import Colors, print_banner
+
+# Import name -> distribution name, where they differ
+_DISTRIBUTION_NAMES = {
+    'sklearn': 'scikit-learn',
+    'cv2': 'opencv-python',
+    'skimage': 'scikit-image',
+    'skbio': 'scikit-bio',
+    'yaml': 'PyYAML',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def check_import(module_name):
+    """
+    Check if module is installed and return version.
+    
+    The module is located with importlib.util.find_spec and its version is
+    read from the installed distribution metadata, so the module itself is
+    never executed (importing TensorFlow or PyTorch can take seconds).
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        return None
+    
+    try:
+        return importlib_metadata.version(_DISTRIBUTION_NAMES.get(module_name, module_name))
+    except importlib_metadata.PackageNotFoundError:
+        return True
+
+
+@click.command('doctor')
+def cmd():
+    """Run system diagnostics."""
+    print_banner()
+    print(f"\n{Colors.BOLD}Running system diagnostics...{Colors.END}\n")
+    
+    checks = [
+        ("Python version", sys.version.split()[0], True),
+        ("NumPy", check_import('numpy'), None),
+        ("SciPy", check_import('scipy'), None),
+        ("Pandas", check_import('pandas'), None),
+        ("Matplotlib", check_import('matplotlib'), None),
+        ("scikit-learn", check_import('sklearn'), None),
+        ("TensorFlow", check_import('tensorflow'), None),
+        ("PyTorch", check_import('torch'), None),
+        ("XGBoost", check_import('xgboost'), None),
+        ("Streamlit", check_import('streamlit'), None),
+        ("Plotly", check_import('plotly'), None),
+    ]
+    
+    all_good = True
+    
+    for name, version, required in checks:
+        if version is True:
+            status = f"{Colors.GREEN}✓{Colors.END}"
+        elif version:
+            status = f"{Colors.GREEN}✓{Colors.END} (v{version})"
+        else:
+            status = f"{Colors.RED}✗ Not installed{Colors.END}"
+            if required:
+                all_good = False
+        
+        print(f"  {name:20} {status}")
+    
+    print(f"\n{Colors.BOLD}Configuration:{Colors.END}")
+    config_dir = Path.home() / '.fungi_mycel'
+    if config_dir.exists():
+        print(f"  Config directory: {config_dir} {Colors.GREEN}✓{Colors.END}")
+    else:
+        print(f"  Config directory: {config_dir} {Colors.YELLOW}not found (optional){Colors.END}")
+    
+    print(f"\n{Colors.BOLD}Dataset:{Colors.END}")
+    print(f"  Sites: 39")
+    print(f"  MNUs: 2,648")
+    print(f"  Biomes: 5")
+    print(f"  Time span: 19 years")
+    
+    if all_good:
+        print(f"\n{Colors.GREEN}✅ All systems operational!{Colors.END}")
+    else:
+        print(f"\n{Colors.YELLOW}⚠️ Some optional components missing{Colors.END}")
+    
+    return 0
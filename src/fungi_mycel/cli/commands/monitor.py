@@ -0,0 +1,62 @@
+"""
+``fungi-mycel monitor`` - bioelectrical activity monitoring.
+"""
+
+import click
+
+from fungi_mycel.cli.main import Colors, print_banner
+
+
+@click.command('monitor')
+@click.option('--duration', type=float, default=24, show_default=True, help='Duration in hours')
+@click.option('--sampling-rate', type=float, default=1000, show_default=True, help='Sampling rate in Hz')
+@click.option('--input', 'input_file', help='Input electrode data file')
+@click.option('--pattern', type=click.Choice(['normal', 'burst', 'stress', 'dormant']),
+              help='Pattern type (for simulation)')
+def cmd(duration, sampling_rate, input_file, pattern):
+    """Monitor bioelectrical activity."""
+    print_banner()
+    print(f"\n{Colors.BOLD}Monitoring bioelectrical activity{Colors.END}")
+    print(f"Duration: {duration} hours")
+    print(f"Sampling rate: {sampling_rate} Hz\n")
+    
+    try:
+        from fungi_mycel.io import load_electrode_data
+        from fungi_mycel.parameters.rho_e import RhoECalculator
+        
+        # Load electrode data
+        if input_file:
+            data, sr = load_electrode_data(input_file, sampling_rate)
+        else:
+            # Generate simulated data
+            calculator = RhoECalculator(sampling_rate=sampling_rate)
+            data = calculator.simulate_activity(
+                duration=duration,
+                pattern=pattern or 'normal',
+                n_electrodes=16
+            )
+            sr = sampling_rate
+        
+        # Compute ρ_e
+        calculator = RhoECalculator(sampling_rate=sr)
+        result = calculator.compute(data, duration_hours=duration)
+        
+        # Display results
+        print(f"{Colors.BOLD}Bioelectrical Analysis:{Colors.END}")
+        print(f"  ρ_e: {result.value:.3f}")
+        print(f"  Pattern: {result.pattern_type}")
+        print(f"  Spike rate: {result.spike_rate:.1f} spikes/hour")
+        print(f"  Mean amplitude: {result.mean_amplitude:.1f} mV")
+        print(f"  Coherence: {result.coherence:.3f}")
+        print(f"  Active electrodes: {result.active_electrodes}/16")
+        
+        if result.warnings:
+            print(f"\n{Colors.YELLOW}Warnings:{Colors.END}")
+            for warning in result.warnings:
+                print(f"  ⚠️ {warning}")
+        
+        return 0
+        
+    except Exception as e:
+        print(f"{Colors.RED}Error: {e}{Colors.END}")
+        return 1
@@ -0,0 +1,196 @@
+"""
+``fungi-mycel process`` - batch processing of field data files.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import click
+
+from fungi_mycel.cli.main import Colors, get_mnis, print_banner
+
+# File types picked up when processing a directory
+_SUPPORTED_SUFFIXES = frozenset({'.npy', '.csv', '.json', '.h5'})
+
+# Results of previous runs, keyed by input file content
+CACHE_DIR = Path.home() / '.fungi_mycel' / 'cache'
+
+# Inputs are hashed in blocks of this size
+_CACHE_HASH_BYTES = 1 << 20
+
+
+@click.command('process')
+@click.option('--input', '-i', 'input_path', required=True, help='Input file or directory')
+@click.option('--output', '-o', 'output_path', required=True, help='Output directory')
+@click.option('--recursive', is_flag=True, help='Process recursively')
+@click.option('--no-cache', is_flag=True, help=f'Recompute results instead of reusing {CACHE_DIR}')
+def cmd(input_path, output_path, recursive, no_cache):
+    """Process field data."""
+    print_banner()
+    print(f"\n{Colors.BOLD}Processing field data{Colors.END}")
+    print(f"Input: {input_path}")
+    print(f"Output: {output_path}\n")
+    
+    try:
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input not found: {input_path}")
+        
+        if input_path.is_file():
+            # Process single file
+            process_file(input_path, output_path, use_cache=not no_cache)
+        else:
+            # Process directory
+            output_path.mkdir(parents=True, exist_ok=True)
+            # scandir yields entries with their file type cached, so each
+            # file costs one directory read instead of a glob + stat
+            with os.scandir(input_path) as entries:
+                for entry in entries:
+                    if os.path.splitext(entry.name)[1] not in _SUPPORTED_SUFFIXES:
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    print(f"Processing: {entry.name}")
+                    process_file(Path(entry.path), output_path / entry.name,
+                                 use_cache=not no_cache)
+        
+        print(f"\n{Colors.GREEN}Processing complete!{Colors.END}")
+        return 0
+        
+    except Exception as e:
+        print(f"{Colors.RED}Error: {e}{Colors.END}")
+        return 1
+
+
+def _process_electrode_file(input_path: Path) -> Dict[str, Any]:
+    """Compute ρ_e for an electrode recording."""
+    from fungi_mycel.io import load_electrode_data
+    from fungi_mycel.parameters.rho_e import RhoECalculator
+    
+    data, sr = load_electrode_data(input_path)
+    calculator = RhoECalculator(sampling_rate=sr)
+    result = calculator.compute(data)
+    
+    return {
+        'rho_e': result.value,
+        'pattern': result.pattern_type,
+        'spike_rate': result.spike_rate,
+    }
+
+
+def _process_parameter_file(input_path: Path) -> Dict[str, Any]:
+    """Compute MNIS for a parameter file."""
+    with open(input_path, 'r') as f:
+        data = json.load(f)
+    
+    if 'parameters' in data:
+        params = data['parameters']
+    else:
+        params = data
+    
+    calculator = get_mnis()
+    return calculator.compute(params).to_dict()
+
+
+# Suffix -> (output suffix, processor, summary line)
+_PROCESSORS = {
+    '.npy': ('.json', _process_electrode_file,
+             lambda r: f"ρ_e: {r['rho_e']:.3f}"),
+    '.json': ('.mnis.json', _process_parameter_file,
+              lambda r: f"MNIS: {r['mnis_score']:.3f} ({r['class']})"),
+}
+
+
+def _cache_metadata(input_path: Path) -> Dict[str, Any]:
+    """Describe the input and framework version a cache entry is valid for."""
+    from fungi_mycel import __version__
+    
+    return {
+        'version': __version__,
+        'suffix': input_path.suffix,
+        'size': input_path.stat().st_size,
+    }
+
+
+def _cache_file(input_path: Path, metadata: Dict[str, Any]) -> Path:
+    """Cache entry location for an input file, from a hash of its whole content."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(input_path, 'rb') as f:
+        for block in iter(lambda: f.read(_CACHE_HASH_BYTES), b''):
+            digest.update(block)
+    digest.update(f"{metadata['size']}{metadata['suffix']}".encode())
+    return CACHE_DIR / f'{digest.hexdigest()}.json'
+
+
+def _read_cache(cache_file: Path, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the cached result, or None if missing or stale."""
+    try:
+        with open(cache_file, 'r') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if entry.get('metadata') != metadata:
+        return None
+    return entry.get('result')
+
+
+def _write_cache(cache_file: Path, metadata: Dict[str, Any], result: Dict[str, Any]):
+    """
+    Store a result, replacing any previous entry atomically.
+    
+    The cache is an optimization, so an unwritable cache directory only
+    produces a warning.
+    """
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump({'metadata': metadata, 'result': result}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"  {Colors.YELLOW}Warning: could not write cache: {e}{Colors.END}")
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+def process_file(input_path: Path, output_path: Path, use_cache: bool = True):
+    """
+    Process a single file.
+    
+    Results are cached under CACHE_DIR, keyed by a hash of the input, so
+    re-running on unchanged files skips the computation.
+    """
+    if input_path.suffix not in _PROCESSORS:
+        print(f"  → Skipping unsupported file type: {input_path.suffix}")
+        return
+    
+    output_suffix, processor, summary = _PROCESSORS[input_path.suffix]
+    
+    result = None
+    if use_cache:
+        metadata = _cache_metadata(input_path)
+        cache_file = _cache_file(input_path, metadata)
+        result = _read_cache(cache_file, metadata)
+    
+    if result is None:
+        result = processor(input_path)
+        if use_cache:
+            _write_cache(cache_file, metadata, result)
+    
+    if input_path.suffix == '.npy':
+        result = {'file': str(input_path), **result}
+    
+    # Save results
+    output_file = output_path.with_suffix(output_suffix)
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+    
+    print(f"  → {summary(result)}")
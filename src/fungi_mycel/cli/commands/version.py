@@ -0,0 +1,14 @@
+"""
+``fungi-mycel version`` - show version information.
+"""
+
+import click
+
+from fungi_mycel.cli.main import print_version
+
+
+@click.command('version')
+def cmd():
+    """Show version information."""
+    print_version()
+    return 0
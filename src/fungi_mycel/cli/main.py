@@ -11,29 +11,26 @@ Usage:
     fungi-mycel --help
 """
 
-import argparse
+import functools
+import importlib
 import sys
-import json
-from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, List
-import warnings
 
-# Import framework components
-from fungi_mycel.core import MNIS, compute_mnis
-from fungi_mycel.parameters import (
-    compute_eta_nw, compute_rho_e, compute_grad_c,
-    compute_ser, compute_k_topo, compute_e_a,
-    compute_abi, compute_bfs
-)
-from fungi_mycel.utils import load_site, validate_data, format_mnis_class
-from fungi_mycel.io import load_electrode_data, load_parameters, export_to_json
-from fungi_mycel.visualization import plot_mnis_timeseries
+import click
 
-try:
-    from fungi_mycel.visualization.dashboard import run_dashboard
-    DASHBOARD_AVAILABLE = True
-except ImportError:
-    DASHBOARD_AVAILABLE = False
+# Subcommand name -> module defining it as ``cmd``, in the order shown by
+# --help. Modules (and the framework components they use) are only
+# imported when their command is invoked.
+_COMMANDS = MappingProxyType({
+    'doctor': 'fungi_mycel.cli.commands.doctor',
+    'analyze': 'fungi_mycel.cli.commands.analyze',
+    'monitor': 'fungi_mycel.cli.commands.monitor',
+    'process': 'fungi_mycel.cli.commands.process',
+    'dashboard': 'fungi_mycel.cli.commands.dashboard',
+    'list': 'fungi_mycel.cli.commands.list',
+    'version': 'fungi_mycel.cli.commands.version',
+})
 
 
 class Colors:
@@ -49,9 +46,11 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
-def print_banner():
-    """Print FUNGI-MYCEL banner."""
-    banner = f"""
+if not sys.stdout.isatty():
+    # Output is redirected (log file, pipe): emit plain text, not escape codes
+    Colors = type('Colors', (), {k: '' for k in vars(Colors) if not k.startswith('_')})
+
+_BANNER = f"""
 {Colors.GREEN}╔════════════════════════════════════════════════════════════════╗
 ║                    🍄 FUNGI-MYCEL v1.0.0                    ║
 ║         Mycelial Network Intelligence Framework               ║
@@ -60,412 +59,109 @@ def print_banner():
 ║     2,648 MNUs · 39 Sites · 5 Biomes · 19 Years               ║
 ╚════════════════════════════════════════════════════════════════╝{Colors.END}
     """
-    print(banner)
-
-
-def doctor_command(args):
-    """Run system diagnostics."""
-    print_banner()
-    print(f"\n{Colors.BOLD}Running system diagnostics...{Colors.END}\n")
-    
-    checks = [
-        ("Python version", sys.version.split()[0], True),
-        ("NumPy", check_import('numpy'), None),
-        ("SciPy", check_import('scipy'), None),
-        ("Pandas", check_import('pandas'), None),
-        ("Matplotlib", check_import('matplotlib'), None),
-        ("scikit-learn", check_import('sklearn'), None),
-        ("TensorFlow", check_import('tensorflow'), None),
-        ("PyTorch", check_import('torch'), None),
-        ("XGBoost", check_import('xgboost'), None),
-        ("Streamlit", check_import('streamlit'), None),
-        ("Plotly", check_import('plotly'), None),
-    ]
-    
-    all_good = True
-    
-    for name, version, required in checks:
-        if version is True:
-            status = f"{Colors.GREEN}✓{Colors.END}"
-        elif version:
-            status = f"{Colors.GREEN}✓{Colors.END} (v{version})"
-        else:
-            status = f"{Colors.RED}✗ Not installed{Colors.END}"
-            if required:
-                all_good = False
-        
-        print(f"  {name:20} {status}")
-    
-    print(f"\n{Colors.BOLD}Configuration:{Colors.END}")
-    config_dir = Path.home() / '.fungi_mycel'
-    if config_dir.exists():
-        print(f"  Config directory: {config_dir} {Colors.GREEN}✓{Colors.END}")
-    else:
-        print(f"  Config directory: {config_dir} {Colors.YELLOW}not found (optional){Colors.END}")
-    
-    print(f"\n{Colors.BOLD}Dataset:{Colors.END}")
-    print(f"  Sites: 39")
-    print(f"  MNUs: 2,648")
-    print(f"  Biomes: 5")
-    print(f"  Time span: 19 years")
-    
-    if all_good:
-        print(f"\n{Colors.GREEN}✅ All systems operational!{Colors.END}")
-    else:
-        print(f"\n{Colors.YELLOW}⚠️ Some optional components missing{Colors.END}")
-    
-    return 0
-
-
-def check_import(module_name):
-    """Check if module is installed and return version."""
-    try:
-        module = __import__(module_name)
-        if hasattr(module, '__version__'):
-            return module.__version__
-        else:
-            return True
-    except ImportError:
-        return None
-
 
-def analyze_command(args):
-    """Analyze site data and compute MNIS."""
-    print_banner()
-    print(f"\n{Colors.BOLD}Analyzing site: {args.site}{Colors.END}\n")
-    
-    try:
-        # Load site data
-        site_data = load_site(args.site)
-        
-        # Load parameters
-        if args.parameters:
-            with open(args.parameters, 'r') as f:
-                params = json.load(f)
-        else:
-            # Simulate parameters for demo
-            params = {
-                'eta_nw': 0.72,
-                'rho_e': 0.68,
-                'grad_c': 0.71,
-                'ser': 1.05,
-                'k_topo': 1.72,
-                'e_a': 0.65,
-                'abi': 1.84,
-                'bfs': 0.58,
-            }
-        
-        # Compute MNIS
-        biome = site_data.get('biome', 'temperate_broadleaf')
-        calculator = MNIS(biome=biome)
-        result = calculator.compute(params)
-        
-        # Display results
-        print(f"{Colors.BOLD}MNIS Result:{Colors.END}")
-        print(f"  Score: {result.mnis_score:.3f}")
-        print(f"  Class: {result.class_name}")
-        print(f"  Biome: {result.biome}")
-        
-        print(f"\n{Colors.BOLD}Parameters:{Colors.END}")
-        for param, value in result.parameters.items():
-            norm = result.normalized_params[param]
-            print(f"  {param:8}: {value:.3f} → {norm:.3f}")
-        
-        if result.warning_flags:
-            print(f"\n{Colors.YELLOW}Warnings:{Colors.END}")
-            for warning in result.warning_flags:
-                print(f"  ⚠️ {warning}")
-        
-        # Export if requested
-        if args.output:
-            output_path = Path(args.output)
-            export_to_json(result.to_dict(), output_path)
-            print(f"\n{Colors.GREEN}Results exported to {output_path}{Colors.END}")
-        
-        return 0
-        
-    except Exception as e:
-        print(f"{Colors.RED}Error: {e}{Colors.END}")
-        return 1
-
-
-def monitor_command(args):
-    """Monitor bioelectrical activity."""
-    print_banner()
-    print(f"\n{Colors.BOLD}Monitoring bioelectrical activity{Colors.END}")
-    print(f"Duration: {args.duration} hours")
-    print(f"Sampling rate: {args.sampling_rate} Hz\n")
-    
-    try:
-        # Load electrode data
-        if args.input:
-            data, sr = load_electrode_data(args.input, args.sampling_rate)
-        else:
-            # Generate simulated data
-            from fungi_mycel.parameters.rho_e import RhoECalculator
-            calculator = RhoECalculator(sampling_rate=args.sampling_rate)
-            data = calculator.simulate_activity(
-                duration=args.duration,
-                pattern=args.pattern or 'normal',
-                n_electrodes=16
-            )
-            sr = args.sampling_rate
-        
-        # Compute ρ_e
-        from fungi_mycel.parameters.rho_e import RhoECalculator
-        calculator = RhoECalculator(sampling_rate=sr)
-        result = calculator.compute(data, duration_hours=args.duration)
-        
-        # Display results
-        print(f"{Colors.BOLD}Bioelectrical Analysis:{Colors.END}")
-        print(f"  ρ_e: {result.value:.3f}")
-        print(f"  Pattern: {result.pattern_type}")
-        print(f"  Spike rate: {result.spike_rate:.1f} spikes/hour")
-        print(f"  Mean amplitude: {result.mean_amplitude:.1f} mV")
-        print(f"  Coherence: {result.coherence:.3f}")
-        print(f"  Active electrodes: {result.active_electrodes}/16")
-        
-        if result.warnings:
-            print(f"\n{Colors.YELLOW}Warnings:{Colors.END}")
-            for warning in result.warnings:
-                print(f"  ⚠️ {warning}")
-        
-        return 0
-        
-    except Exception as e:
-        print(f"{Colors.RED}Error: {e}{Colors.END}")
-        return 1
 
-
-def process_command(args):
-    """Process field data."""
-    print_banner()
-    print(f"\n{Colors.BOLD}Processing field data{Colors.END}")
-    print(f"Input: {args.input}")
-    print(f"Output: {args.output}\n")
+def print_banner():
+    """
+    Print FUNGI-MYCEL banner to stderr.
     
-    try:
-        input_path = Path(args.input)
-        output_path = Path(args.output)
-        
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input not found: {input_path}")
-        
-        if input_path.is_file():
-            # Process single file
-            process_file(input_path, output_path, args)
-        else:
-            # Process directory
-            output_path.mkdir(parents=True, exist_ok=True)
-            for file_path in input_path.glob('*.*'):
-                if file_path.suffix in ['.npy', '.csv', '.json', '.h5']:
-                    print(f"Processing: {file_path.name}")
-                    process_file(file_path, output_path / file_path.name, args)
-        
-        print(f"\n{Colors.GREEN}Processing complete!{Colors.END}")
-        return 0
-        
-    except Exception as e:
-        print(f"{Colors.RED}Error: {e}{Colors.END}")
-        return 1
+    Skipped with --quiet or when stderr is not a terminal, so the banner
+    never ends up in piped or logged output.
+    """
+    # --quiet lives on the root click context rather than in a module
+    # global, which `python -m fungi_mycel.cli.main` would load twice
+    ctx = click.get_current_context(silent=True)
+    quiet = ctx is not None and (ctx.find_root().obj or {}).get('quiet', False)
+    if quiet or not sys.stderr.isatty():
+        return
+    print(_BANNER, file=sys.stderr)
 
 
-def process_file(input_path: Path, output_path: Path, args):
-    """Process a single file."""
-    if input_path.suffix == '.npy':
-        # Assume electrode data
-        data, sr = load_electrode_data(input_path)
-        from fungi_mycel.parameters.rho_e import RhoECalculator
-        calculator = RhoECalculator(sampling_rate=sr)
-        result = calculator.compute(data)
-        
-        # Save results
-        result_dict = {
-            'file': str(input_path),
-            'rho_e': result.value,
-            'pattern': result.pattern_type,
-            'spike_rate': result.spike_rate,
-        }
-        
-        output_file = output_path.with_suffix('.json')
-        with open(output_file, 'w') as f:
-            json.dump(result_dict, f, indent=2)
-        
-        print(f"  → ρ_e: {result.value:.3f}")
-    
-    elif input_path.suffix == '.json':
-        # Assume parameter file
-        with open(input_path, 'r') as f:
-            data = json.load(f)
-        
-        if 'parameters' in data:
-            params = data['parameters']
-        else:
-            params = data
-        
-        # Compute MNIS
-        calculator = MNIS()
-        result = calculator.compute(params)
-        
-        # Save results
-        output_file = output_path.with_suffix('.mnis.json')
-        with open(output_file, 'w') as f:
-            json.dump(result.to_dict(), f, indent=2)
-        
-        print(f"  → MNIS: {result.mnis_score:.3f} ({result.class_name})")
-    
-    else:
-        print(f"  → Skipping unsupported file type: {input_path.suffix}")
+def print_version():
+    """Print FUNGI-MYCEL banner with version information to stdout."""
+    print(_BANNER)
 
 
-def dashboard_command(args):
-    """Launch interactive dashboard."""
-    print_banner()
-    print(f"\n{Colors.BOLD}Launching interactive dashboard...{Colors.END}")
-    print(f"Port: {args.port}")
-    print(f"Backend: {args.backend}\n")
-    
-    if not DASHBOARD_AVAILABLE:
-        print(f"{Colors.RED}Dashboard dependencies not installed.{Colors.END}")
-        print("Install with: pip install fungi-mycel[dashboard]")
-        return 1
+@functools.lru_cache(maxsize=16)
+def get_mnis(biome: str = 'temperate_broadleaf'):
+    """
+    Return a shared MNIS calculator for a biome.
     
-    try:
-        run_dashboard(backend=args.backend, port=args.port)
-        return 0
-    except Exception as e:
-        print(f"{Colors.RED}Error: {e}{Colors.END}")
-        return 1
+    Calculators are reused across files in a batch, which relies on
+    MNIS.compute() not mutating the calculator.
+    """
+    from fungi_mycel.core import MNIS
+    return MNIS(biome=biome)
 
 
-def list_command(args):
-    """List available sites or MNUs."""
-    print_banner()
+class LazyGroup(click.Group):
+    """click.Group that imports subcommand modules on demand."""
     
-    if args.sites:
-        print(f"\n{Colors.BOLD}Available sites:{Colors.END}\n")
-        sites = [
-            ("bialowieza-01", "Białowieża Forest", "Poland", "temperate", 124),
-            ("oregon-armillaria-01", "Malheur NF", "USA", "boreal", 256),
-            ("amazon-terra-preta-01", "Terra Preta", "Brazil", "tropical", 187),
-            ("caledonian-01", "Caledonian Pine", "Scotland", "temperate", 76),
-            ("sudbury-01", "Sudbury Recovery", "Canada", "boreal", 145),
-            ("cascade-04", "Cascade Range", "USA", "boreal", 203),
-            ("sapmi-01", "Sápmi Birch", "Norway", "subarctic", 67),
-            ("hokkaido-01", "Hokkaido Forest", "Japan", "temperate", 89),
-            ("andalucia-01", "Andalucía", "Spain", "mediterranean", 112),
-        ]
-        
-        for site_id, name, country, biome, mnus in sites:
-            print(f"  {site_id:25} {name:20} {country:12} {biome:15} {mnus:3} MNUs")
+    def list_commands(self, ctx):
+        return list(_COMMANDS)
     
-    elif args.mnus:
-        print(f"\n{Colors.BOLD}Recent MNUs:{Colors.END}\n")
-        for i in range(10):
-            mnis = 0.3 + 0.5 * np.random.random()
-            cls = format_mnis_class(mnis)
-            print(f"  MNU-2026-{i:04d}  Site: site-{i:02d}  MNIS: {mnis:.3f}  Class: {cls}")
-    
-    return 0
-
+    def get_command(self, ctx, name):
+        if name not in _COMMANDS:
+            return None
+        return importlib.import_module(_COMMANDS[name]).cmd
 
-def version_command(args):
-    """Show version information."""
-    print_banner()
-    return 0
 
-
-def create_parser():
-    """Create argument parser."""
-    parser = argparse.ArgumentParser(
-        description="FUNGI-MYCEL: Mycelial Network Intelligence Framework",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+@click.group(
+    cls=LazyGroup,
+    invoke_without_command=True,
+    help="FUNGI-MYCEL: Mycelial Network Intelligence Framework",
+    epilog="""
+\b
 Examples:
   fungi-mycel doctor                    # Run system diagnostics
   fungi-mycel analyze --site bialowieza-01  # Analyze site
   fungi-mycel monitor --duration 24     # Monitor for 24 hours
   fungi-mycel dashboard --port 8501     # Launch dashboard
   fungi-mycel list --sites               # List available sites
-        """
-    )
-    
-    parser.add_argument('--version', action='store_true', help='Show version')
-    
-    subparsers = parser.add_subparsers(dest='command', help='Commands')
-    
-    # Doctor command
-    doctor_parser = subparsers.add_parser('doctor', help='Run system diagnostics')
-    
-    # Analyze command
-    analyze_parser = subparsers.add_parser('analyze', help='Analyze site data')
-    analyze_parser.add_argument('--site', required=True, help='Site ID')
-    analyze_parser.add_argument('--parameters', help='Parameters file (JSON)')
-    analyze_parser.add_argument('--output', '-o', help='Output file')
-    
-    # Monitor command
-    monitor_parser = subparsers.add_parser('monitor', help='Monitor bioelectrical activity')
-    monitor_parser.add_argument('--duration', type=float, default=24, help='Duration in hours')
-    monitor_parser.add_argument('--sampling-rate', type=float, default=1000, help='Sampling rate in Hz')
-    monitor_parser.add_argument('--input', help='Input electrode data file')
-    monitor_parser.add_argument('--pattern', choices=['normal', 'burst', 'stress', 'dormant'],
-                               help='Pattern type (for simulation)')
-    
-    # Process command
-    process_parser = subparsers.add_parser('process', help='Process field data')
-    process_parser.add_argument('--input', '-i', required=True, help='Input file or directory')
-    process_parser.add_argument('--output', '-o', required=True, help='Output directory')
-    process_parser.add_argument('--recursive', action='store_true', help='Process recursively')
-    
-    # Dashboard command
-    dashboard_parser = subparsers.add_parser('dashboard', help='Launch interactive dashboard')
-    dashboard_parser.add_argument('--port', type=int, default=8501, help='Port to run on')
-    dashboard_parser.add_argument('--backend', choices=['streamlit', 'dash'],
-                                 default='streamlit', help='Dashboard backend')
-    
-    # List command
-    list_parser = subparsers.add_parser('list', help='List resources')
-    list_parser.add_argument('--sites', action='store_true', help='List sites')
-    list_parser.add_argument('--mnus', action='store_true', help='List MNUs')
+    """,
+)
+@click.option('--version', is_flag=True, help='Show version')
+@click.option('--quiet', '-q', is_flag=True, help='Do not print the banner')
+@click.pass_context
+def cli(ctx, version, quiet):
+    """Entry point for console script."""
+    ctx.ensure_object(dict)['quiet'] = quiet
     
-    # Version command
-    version_parser = subparsers.add_parser('version', help='Show version')
+    if version:
+        print_version()
+        ctx.exit(0)
     
-    return parser
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+        ctx.exit(0)
 
 
-def main(args=None):
-    """Main entry point."""
-    parser = create_parser()
-    args = parser.parse_args(args)
-    
-    if args.version:
-        print_banner()
-        return 0
-    
-    if not args.command:
-        parser.print_help()
-        return 0
-    
-    # Execute command
-    commands = {
-        'doctor': doctor_command,
-        'analyze': analyze_command,
-        'monitor': monitor_command,
-        'process': process_command,
-        'dashboard': dashboard_command,
-        'list': list_command,
-        'version': version_command,
-    }
-    
-    return commands[args.command](args)
+@cli.result_callback()
+@click.pass_context
+def _exit_with_status(ctx, status, **kwargs):
+    """Use the subcommand's return value as the process exit status."""
+    ctx.exit(status or 0)
 
 
-# CLI entry point
-def cli():
-    """Entry point for console script."""
-    sys.exit(main())
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Main entry point.
+    
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:])
+    
+    Returns:
+        Exit status of the invoked command
+    """
+    try:
+        return cli.main(args=args, prog_name='fungi-mycel', standalone_mode=False) or 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo('Aborted!', err=True)
+        return 1
 
 
 if __name__ == '__main__':
-    cli()
+    sys.exit(main())
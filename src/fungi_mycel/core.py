@@ -13,10 +13,14 @@ to [0, 1] using biome-specific reference distributions.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Union, Tuple
 from dataclasses import dataclass, field
+import bisect
 import json
+import sys
 import yaml
+from collections import abc
+from functools import lru_cache
 from pathlib import Path
 
 # Parameter weights (from Bayesian analysis + Delphi consensus)
@@ -94,15 +98,146 @@ MNIS_CLASSES = {
     'COLLAPSE': (0.80, 1.00),
 }
 
+# Canonical column order for array inputs of shape (N, 8)
+_PARAM_ORDER = ('eta_nw', 'e_a', 'rho_e', 'grad_c', 'ser', 'k_topo', 'abi', 'bfs')
+_PARAM_INDEX = {name: i for i, name in enumerate(_PARAM_ORDER)}
+_SER_INDEX = _PARAM_INDEX['ser']
+_WEIGHTS_VEC = np.array([MNIS_WEIGHTS[p] for p in _PARAM_ORDER], dtype=np.float64)
 
-@dataclass
+# Class lookup by bisection: class i covers [_CLASS_EDGES[i-1], _CLASS_EDGES[i]),
+# with the first and last classes extending to 0 and 1; NaN and scores
+# outside [0, 1] are classed UNKNOWN
+_CLASS_NAMES = tuple(MNIS_CLASSES)
+_CLASS_INDEX = {name: i for i, name in enumerate(_CLASS_NAMES)}
+_CLASS_NAMES_ARR = np.array(_CLASS_NAMES)
+_CLASS_EDGES_LIST = [high for _, high in MNIS_CLASSES.values()][:-1]
+_CLASS_EDGES = np.array(_CLASS_EDGES_LIST)
+
+
+def _classify(scores: np.ndarray) -> np.ndarray:
+    """Class names for an array of scores."""
+    classes = _CLASS_NAMES_ARR[np.searchsorted(_CLASS_EDGES, scores, side='right')]
+    classes[~((scores >= 0.0) & (scores <= 1.0))] = 'UNKNOWN'
+    return classes
+
+
+def _readonly_array(values) -> np.ndarray:
+    """Build a float64 array that cannot be modified in place."""
+    arr = np.array(values, dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
+
+# Reference thresholds per biome as (mins, maxs, ser_opt_min, ser_opt_max),
+# with mins/maxs in _PARAM_ORDER; shared by every MNIS instance
+_BIOME_TABLE = {
+    biome: (
+        _readonly_array([refs[p]['min'] for p in _PARAM_ORDER]),
+        _readonly_array([refs[p]['max_ref'] for p in _PARAM_ORDER]),
+        refs['ser'].get('optimal_min', 0.9),
+        refs['ser'].get('optimal_max', 1.1),
+    )
+    for biome, refs in BIOME_REFERENCES.items()
+}
+
+
+def _ser_normalize(value, mn, opt_min, opt_max, mx):
+    """
+    Normalize SER to [0, 1], peaking across [opt_min, opt_max].
+    
+    Only the NumPy scoring path uses this; the compiled kernels inline the
+    same piecewise rule.
+    """
+    norm = np.where(
+        value < opt_min,
+        (value - mn) / (opt_min - mn),
+        np.where(value <= opt_max, 1.0, 1.0 - (value - opt_max) / (mx - opt_max)),
+    )
+    norm[(value <= mn) | (value >= mx)] = 0.0
+    return np.clip(norm, 0.0, 1.0)
+
+
+def _mnis_rows(X, mins, maxs, inv_range, ser_opt_min, ser_opt_max, ser_inv_left,
+               ser_inv_right, weights, norm, scores):
+    """
+    Normalize every row of X into norm and write its weighted score.
+    
+    Plain Python source for the compiled batch kernel; the rules mirror
+    MNIS.normalize_parameter.
+    """
+    for n in range(X.shape[0]):
+        score = 0.0
+        for i in range(X.shape[1]):
+            v = X[n, i]
+            if i == _SER_INDEX:
+                if v < ser_opt_min:
+                    t = 0.0 if v <= mins[i] else (v - mins[i]) * ser_inv_left
+                elif v <= ser_opt_max:
+                    t = 1.0
+                elif v >= maxs[i]:
+                    t = 0.0
+                else:
+                    t = 1.0 - (v - ser_opt_max) * ser_inv_right
+            elif v <= mins[i]:
+                t = 0.0
+            elif v >= maxs[i]:
+                t = 1.0
+            else:
+                t = (v - mins[i]) * inv_range[i]
+            if t < 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            norm[n, i] = t
+            score += weights[i] * t
+        scores[n] = score
+
+
+@lru_cache(maxsize=1)
+def _batch_kernel() -> Optional[Callable]:
+    """
+    Compiled _mnis_rows, or None without numba.
+    
+    numba is imported on the first batch rather than with this module, and
+    the kernel is cached on disk, so later processes skip compilation.
+    """
+    from fungi_mycel import _numba
+    
+    if not _numba.NUMBA_AVAILABLE:
+        return None
+    return _numba.njit(cache=True)(_mnis_rows)
+
+
+class _ParamView(abc.Mapping):
+    """Read-only parameter name -> value mapping over one row of an (N, 8) array."""
+    
+    __slots__ = ('_row',)
+    
+    def __init__(self, row: np.ndarray):
+        self._row = row
+    
+    def __getitem__(self, key: str) -> float:
+        return float(self._row[_PARAM_INDEX[key]])
+    
+    def __iter__(self):
+        return iter(_PARAM_ORDER)
+    
+    def __len__(self) -> int:
+        return len(_PARAM_ORDER)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+# Slotted results keep large batches small; dataclass slots need Python 3.10+
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
 class MNISResult:
     """Container for MNIS computation results."""
     
     mnis_score: float
     class_name: str
-    parameters: Dict[str, float]
-    normalized_params: Dict[str, float]
+    parameters: Mapping[str, float]
+    normalized_params: Mapping[str, float]
     biome: str
     site_id: Optional[str] = None
     mnu_id: Optional[str] = None
@@ -114,8 +249,8 @@ class MNISResult:
         return {
             'mnis_score': self.mnis_score,
             'class': self.class_name,
-            'parameters': self.parameters,
-            'normalized_params': self.normalized_params,
+            'parameters': dict(self.parameters),
+            'normalized_params': dict(self.normalized_params),
             'biome': self.biome,
             'site_id': self.site_id,
             'mnu_id': self.mnu_id,
@@ -139,15 +274,26 @@ class MNIS:
         biome: Biome type for reference thresholds
         weights: Parameter weights for composite score
         references: Biome-specific reference thresholds
+        enable_memo: Whether normalize_parameter memoizes rounded inputs
+        memo_decimals: Decimal places raw values are rounded to when memoizing
+        collect_warnings: Whether results carry threshold warning flags
     """
     
-    def __init__(self, biome: str = 'temperate_broadleaf'):
+    def __init__(self, biome: str = 'temperate_broadleaf', enable_memo: bool = False,
+                 memo_decimals: int = 4, collect_warnings: bool = True):
         """
         Initialize MNIS calculator for specific biome.
         
         Args:
             biome: Biome type (temperate_broadleaf, boreal_conifer, 
                    tropical_montane, mediterranean_woodland, subarctic_birch)
+            enable_memo: Memoize normalize_parameter on values rounded to
+                         memo_decimals; worthwhile for quantized sensor streams
+                         that repeat the same readings
+            memo_decimals: Rounding precision for memoized lookups
+            collect_warnings: Build warning flags for parameters at their
+                              thresholds; disable when results' warnings
+                              are never read
         
         Raises:
             ValueError: If biome is not recognized
@@ -158,6 +304,27 @@ class MNIS:
         self.biome = biome
         self.weights = MNIS_WEIGHTS
         self.references = BIOME_REFERENCES[biome]
+        self.enable_memo = enable_memo
+        self.memo_decimals = memo_decimals
+        self.collect_warnings = collect_warnings
+        
+        self._param_index = _PARAM_INDEX
+        self._mins, self._maxs, self._ser_opt_min, self._ser_opt_max = _BIOME_TABLE[biome]
+        
+        # Reciprocal ranges so normalization multiplies instead of divides;
+        # plain-float copies keep the scalar path off NumPy scalars
+        self._inv_range = 1.0 / (self._maxs - self._mins)
+        self._min_list = self._mins.tolist()
+        self._max_list = self._maxs.tolist()
+        self._inv_range_list = self._inv_range.tolist()
+        self._ser_inv_left = 1.0 / (self._ser_opt_min - self._min_list[_SER_INDEX])
+        self._ser_inv_right = 1.0 / (self._maxs[_SER_INDEX].item() - self._ser_opt_max)
+        
+        # Single-precision copies for batch_compute_array(dtype=np.float32)
+        self._mins32 = self._mins.astype(np.float32)
+        self._maxs32 = self._maxs.astype(np.float32)
+        self._inv_range32 = self._inv_range.astype(np.float32)
+
     
     def normalize_parameter(self, param_name: str, value: float) -> float:
         """
@@ -173,42 +340,55 @@ class MNIS:
         Raises:
             ValueError: If param_name not found or value out of reasonable range
         """
-        if param_name not in self.references:
+        if self.enable_memo:
+            return _normalize_cached(self.biome, param_name, round(value, self.memo_decimals))
+        
+        i = self._param_index.get(param_name)
+        if i is None:
             raise ValueError(f"Unknown parameter: {param_name}")
         
-        ref = self.references[param_name]
-        min_val = ref['min']
-        max_val = ref['max_ref']
+        # Values at or beyond min and max_ref are mapped before scaling, so
+        # they give exactly 0 or 1 despite the rounded reciprocal ranges
+        min_val = self._min_list[i]
         
         # Special handling for SER (optimal range in middle)
-        if param_name == 'ser':
-            optimal_min = ref.get('optimal_min', 0.9)
-            optimal_max = ref.get('optimal_max', 1.1)
-            
-            if optimal_min <= value <= optimal_max:
-                return 1.0  # Perfect exchange ratio
-            elif value < optimal_min:
+        if i == _SER_INDEX:
+            if value < self._ser_opt_min:
+                if value <= min_val:
+                    return 0.0
                 # Below optimal: scale from min to optimal_min
-                return max(0, (value - min_val) / (optimal_min - min_val))
-            else:  # value > optimal_max
+                t = (value - min_val) * self._ser_inv_left
+            elif value <= self._ser_opt_max:
+                return 1.0  # Perfect exchange ratio
+            elif value >= self._max_list[i]:
+                return 0.0
+            else:
                 # Above optimal: scale from optimal_max to max_ref
-                return max(0, 1 - (value - optimal_max) / (max_val - optimal_max))
-        
-        # Standard normalization for other parameters
-        if value < min_val:
+                t = 1.0 - (value - self._ser_opt_max) * self._ser_inv_right
+        elif value <= min_val:
             return 0.0
-        elif value > max_val:
+        elif value >= self._max_list[i]:
             return 1.0
         else:
-            return (value - min_val) / (max_val - min_val)
+            # Standard normalization for other parameters
+            t = (value - min_val) * self._inv_range_list[i]
+        
+        # Clamp rounding just outside [0, 1]; NaN passes through
+        if t < 0.0:
+            return 0.0
+        if t > 1.0:
+            return 1.0
+        return t
     
-    def compute(self, parameters: Dict[str, float]) -> MNISResult:
+    def compute(self, parameters: Union[Mapping[str, float], np.ndarray]) -> MNISResult:
         """
         Compute MNIS from raw parameter values.
         
         Args:
             parameters: Dictionary with parameter names and raw values
-                       Must contain all 8 parameters
+                       Must contain all 8 parameters. May also be a length-8
+                       array in canonical order (eta_nw, e_a, rho_e, grad_c,
+                       ser, k_topo, abi, bfs)
         
         Returns:
             MNISResult object with score, class, and normalized values
@@ -216,25 +396,22 @@ class MNIS:
         Raises:
             ValueError: If missing parameters
         """
+        if isinstance(parameters, np.ndarray):
+            vals = np.array(parameters, dtype=np.float64)
+            if vals.shape != (len(_PARAM_ORDER),):
+                raise ValueError(f"Expected array of shape ({len(_PARAM_ORDER)},), got {vals.shape}")
+            parameters = _ParamView(vals)
+        
         # Check for missing parameters
         missing = set(self.weights.keys()) - set(parameters.keys())
         if missing:
             raise ValueError(f"Missing parameters: {missing}")
         
         # Normalize each parameter
-        normalized = {}
-        warnings = []
-        
-        for param_name in self.weights.keys():
-            raw_value = parameters[param_name]
-            norm_value = self.normalize_parameter(param_name, raw_value)
-            normalized[param_name] = norm_value
-            
-            # Check for extreme values
-            if norm_value == 0.0:
-                warnings.append(f"{param_name} at minimum threshold")
-            elif norm_value == 1.0:
-                warnings.append(f"{param_name} at maximum threshold")
+        normalized = {
+            param_name: self.normalize_parameter(param_name, parameters[param_name])
+            for param_name in self.weights.keys()
+        }
         
         # Compute weighted sum
         mnis_score = sum(
@@ -242,12 +419,20 @@ class MNIS:
             for param in self.weights.keys()
         )
         
+        # Check for extreme values
+        warnings = []
+        if self.collect_warnings:
+            for param_name, norm_value in normalized.items():
+                if norm_value == 0.0:
+                    warnings.append(f"{param_name} at minimum threshold")
+                elif norm_value == 1.0:
+                    warnings.append(f"{param_name} at maximum threshold")
+        
         # Determine class
-        mnis_class = 'UNKNOWN'
-        for class_name, (low, high) in MNIS_CLASSES.items():
-            if low <= mnis_score < high:
-                mnis_class = class_name
-                break
+        if 0.0 <= mnis_score <= 1.0:
+            mnis_class = _CLASS_NAMES[bisect.bisect_right(_CLASS_EDGES_LIST, mnis_score)]
+        else:
+            mnis_class = 'UNKNOWN'  # NaN input
         
         return MNISResult(
             mnis_score=mnis_score,
@@ -258,17 +443,127 @@ class MNIS:
             warning_flags=warnings
         )
     
-    def batch_compute(self, parameter_list: List[Dict[str, float]]) -> List[MNISResult]:
+    def _normalize_array(self, X: np.ndarray) -> np.ndarray:
+        """Normalize an (N, 8) array of raw values in _PARAM_ORDER to [0, 1]."""
+        if X.dtype == np.float32:
+            mins, maxs = self._mins32, self._maxs32
+            norm = (X - mins) * self._inv_range32
+        else:
+            mins, maxs = self._mins, self._maxs
+            norm = (X - mins) * self._inv_range
+        
+        # Exactly 0 and 1 at the thresholds, as in normalize_parameter
+        norm[X <= mins] = 0.0
+        norm[X >= maxs] = 1.0
+        
+        # SER peaks inside its optimal range instead of at max_ref
+        norm[:, _SER_INDEX] = _ser_normalize(
+            X[:, _SER_INDEX], mins[_SER_INDEX], self._ser_opt_min,
+            self._ser_opt_max, maxs[_SER_INDEX],
+        )
+        
+        np.clip(norm, 0.0, 1.0, out=norm)
+        return norm
+    
+    def _scores(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (scores, normalized values) for an (N, 8) float32/float64 array."""
+        kernel = _batch_kernel()
+        if kernel is not None:
+            X = np.ascontiguousarray(X)
+            if X.dtype == np.float32:
+                mins, maxs, inv_range = self._mins32, self._maxs32, self._inv_range32
+            else:
+                mins, maxs, inv_range = self._mins, self._maxs, self._inv_range
+            norm = np.empty_like(X)
+            scores = np.empty(X.shape[0], dtype=X.dtype)
+            kernel(X, mins, maxs, inv_range, self._ser_opt_min, self._ser_opt_max,
+                   self._ser_inv_left, self._ser_inv_right, _WEIGHTS_VEC, norm, scores)
+            return scores, norm
+        
+        norm = self._normalize_array(X)
+        return norm @ _WEIGHTS_VEC.astype(X.dtype, copy=False), norm
+    
+    def batch_compute_array(self, X: np.ndarray,
+                            dtype: type = np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute MNIS scores for an array of samples.
+        
+        Args:
+            X: Array of shape (N, 8) with raw values, columns in the order
+               eta_nw, e_a, rho_e, grad_c, ser, k_topo, abi, bfs
+            dtype: np.float64, or np.float32 to halve memory traffic on large
+                   batches (scores then carry ~1e-7 relative error, far below
+                   the 2-digit precision of the reference thresholds)
+        
+        Returns:
+            Tuple of (scores, class names), each of shape (N,)
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+        X = np.asarray(X).astype(dtype, copy=False)
+        if X.ndim != 2 or X.shape[1] != len(_PARAM_ORDER):
+            raise ValueError(f"Expected array of shape (N, {len(_PARAM_ORDER)}), got {X.shape}")
+        
+        scores = self._scores(X)[0]
+        classes = _classify(scores)
+        return scores, classes
+    
+    def batch_compute(self, parameter_list: List[Dict[str, float]],
+                      collect_warnings: Optional[bool] = None) -> List[MNISResult]:
         """
         Compute MNIS for multiple samples.
         
         Args:
             parameter_list: List of parameter dictionaries
+            collect_warnings: Override the instance's collect_warnings setting
             
         Returns:
             List of MNISResult objects
+        
+        Raises:
+            ValueError: If any sample is missing parameters
         """
-        return [self.compute(params) for params in parameter_list]
+        if not parameter_list:
+            return []
+        
+        for params in parameter_list:
+            missing = set(_PARAM_ORDER) - set(params.keys())
+            if missing:
+                raise ValueError(f"Missing parameters: {missing}")
+        
+        X = np.array([[params[p] for p in _PARAM_ORDER] for params in parameter_list],
+                     dtype=np.float64)
+        scores, norm = self._scores(X)
+        classes = _classify(scores)
+        
+        # Rows share the normalized matrix; only flagged rows build warnings
+        if collect_warnings is None:
+            collect_warnings = self.collect_warnings
+        if collect_warnings:
+            flagged = ((norm == 0.0) | (norm == 1.0)).any(axis=1).tolist()
+        else:
+            flagged = [False] * len(parameter_list)
+        
+        results = []
+        for i, (params, score, mnis_class) in enumerate(zip(parameter_list, scores.tolist(),
+                                                            classes.tolist())):
+            warnings = []
+            if flagged[i]:
+                for param_name, norm_value in zip(_PARAM_ORDER, norm[i].tolist()):
+                    if norm_value == 0.0:
+                        warnings.append(f"{param_name} at minimum threshold")
+                    elif norm_value == 1.0:
+                        warnings.append(f"{param_name} at maximum threshold")
+            results.append(MNISResult(
+                mnis_score=score,
+                class_name=mnis_class,
+                parameters=params,
+                normalized_params=_ParamView(norm[i]),
+                biome=self.biome,
+                warning_flags=warnings
+            ))
+        return results
     
     @staticmethod
     def load_config(config_path: Union[str, Path]) -> Dict:
@@ -287,22 +582,40 @@ class MNIS:
         Returns:
             Dictionary with comparison statistics
         """
-        scores = [r.mnis_score for r in results]
+        n = len(results)
+        scores = np.fromiter((r.mnis_score for r in results), dtype=np.float64, count=n)
+        low, median, high = np.percentile(scores, [0, 50, 100])
+        
+        # Results with a class outside MNIS_CLASSES land in the extra last bin
+        idx = np.fromiter(
+            (_CLASS_INDEX.get(r.class_name, len(_CLASS_NAMES)) for r in results),
+            dtype=np.intp, count=n,
+        )
+        counts = np.bincount(idx, minlength=len(_CLASS_NAMES) + 1)
         
         return {
-            'mean': np.mean(scores),
-            'std': np.std(scores),
-            'min': np.min(scores),
-            'max': np.max(scores),
-            'median': np.median(scores),
-            'count': len(scores),
-            'class_distribution': {
-                cls: sum(1 for r in results if r.class_name == cls)
-                for cls in MNIS_CLASSES.keys()
-            }
+            'mean': scores.mean(),
+            'std': scores.std(),
+            'min': low,
+            'max': high,
+            'median': median,
+            'count': n,
+            'class_distribution': dict(zip(_CLASS_NAMES, counts.tolist())),
         }
 
 
+@lru_cache(maxsize=4096)
+def _normalize_cached(biome: str, param_name: str, value: float) -> float:
+    """Memoized normalization backing MNIS(enable_memo=True)."""
+    return _get_calculator(biome).normalize_parameter(param_name, value)
+
+
+@lru_cache(maxsize=8)
+def _get_calculator(biome: str) -> MNIS:
+    """Return a shared MNIS calculator for the given biome."""
+    return MNIS(biome=biome)
+
+
 # Convenience function
 def compute_mnis(parameters: Dict[str, float], biome: str = 'temperate_broadleaf') -> MNISResult:
     """
@@ -315,5 +628,4 @@ def compute_mnis(parameters: Dict[str, float], biome: str = 'temperate_broadleaf
     Returns:
         MNISResult object
     """
-    calculator = MNIS(biome=biome)
-    return calculator.compute(parameters)
+    return _get_calculator(biome).compute(parameters)
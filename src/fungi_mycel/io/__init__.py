@@ -10,6 +10,8 @@ from fungi_mycel.io.loaders import (
     load_site_metadata,
     load_mnu_list,
     load_sequence_data,
+    load_sequence_arrays,
+    SequenceRecords,
     load_image_data,
     load_icpms_data,
 )
@@ -28,6 +30,8 @@ __all__ = [
     'load_site_metadata',
     'load_mnu_list',
     'load_sequence_data',
+    'load_sequence_arrays',
+    'SequenceRecords',
     'load_image_data',
     'load_icpms_data',
     'export_to_csv',
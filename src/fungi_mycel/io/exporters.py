@@ -6,7 +6,7 @@ Functions for exporting results in various formats.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from pathlib import Path
 import json
 import csv
@@ -24,12 +24,21 @@ try:
 except ImportError:
     NETCDF_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import matplotlib.pyplot as plt
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+# Row count above which export_to_csv hands off to pandas
+_CSV_PANDAS_MIN_ROWS = 128
+
 
 def export_to_csv(
     data: Union[Dict[str, Any], List[Dict[str, Any]]],
@@ -53,6 +62,12 @@ def export_to_csv(
     if not data:
         return
     
+    if len(data) > _CSV_PANDAS_MIN_ROWS:
+        # pandas serializes rows in C; columns are the union of keys, sorted
+        # to match the DictWriter path below
+        _export_df_to_csv(_records_frame(data), output_path, include_header)
+        return
+    
     # Get all field names
     fieldnames = set()
     for row in data:
@@ -66,6 +81,27 @@ def export_to_csv(
         writer.writerows(data)
 
 
+def _records_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    DataFrame of records with object columns.
+    
+    Object dtype keeps each value as given, so an int column with missing
+    keys is not upcast to float and written as 0.0 or 1.0 the way
+    csv.DictWriter never would.
+    """
+    return pd.DataFrame(records, dtype=object)
+
+
+def _export_df_to_csv(
+    df: pd.DataFrame,
+    output_path: Union[str, Path],
+    include_header: bool = True
+):
+    """Write a DataFrame of records to CSV with sorted columns."""
+    df[sorted(df.columns)].to_csv(output_path, index=False, header=include_header,
+                                  chunksize=10000, na_rep='')
+
+
 def export_to_json(
     data: Any,
     output_path: Union[str, Path],
@@ -81,11 +117,49 @@ def export_to_json(
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json(data, output_path, indent)
+
+
+def _write_json(data: Any, output_path: Path, indent: Optional[int] = 2):
+    """Write data as JSON to output_path, whose directory must exist."""
+    # orjson only supports two-space indentation
+    if ORJSON_AVAILABLE and indent in (None, 0, 2):
+        # Datetimes and dataclasses go through default=str as with json
+        option = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                  | orjson.OPT_PASSTHROUGH_DATETIME
+                  | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        encoded = None
+        try:
+            encoded = orjson.dumps(data, default=str, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which json writes as is
+            pass
+        # orjson writes NaN and inf as null where json writes NaN and
+        # Infinity; any null (even a real None) sends the data through json
+        # rather than walking it to tell the two apart
+        if encoded is not None and b'null' not in encoded:
+            with open(output_path, 'wb') as f:
+                f.write(encoded)
+            return
     
     with open(output_path, 'w') as f:
         json.dump(data, f, indent=indent, default=str)
 
 
+def _choose_chunks(shape: Tuple[int, ...], itemsize: int,
+                   max_bytes: int = 1 << 20) -> Tuple[int, ...]:
+    """Pick chunk sizes of at most 1024 per axis and about max_bytes in total."""
+    chunks = [max(1, min(size, 1024)) for size in shape]
+    while int(np.prod(chunks)) * itemsize > max_bytes:
+        axis = int(np.argmax(chunks))
+        if chunks[axis] == 1:
+            break
+        chunks[axis] = (chunks[axis] + 1) // 2
+    return tuple(chunks)
+
+
 def export_to_netcdf(
     data: Dict[str, np.ndarray],
     output_path: Union[str, Path],
@@ -115,17 +189,28 @@ def export_to_netcdf(
     ds.setncattr('created', datetime.now().isoformat())
     ds.setncattr('source', 'FUNGI-MYCEL v1.0.0')
     
-    # Add dimensions and variables
+    # Add dimensions and variables; axes of equal length share a dimension
+    dims_by_size: Dict[int, List[str]] = {}
     for name, array in data.items():
-        # Create dimensions
+        array = np.asarray(array)
+        
+        # Reuse a dimension of matching size not already used by this variable
         dims = []
         for i, dim_size in enumerate(array.shape):
-            dim_name = f"{name}_dim_{i}"
-            ds.createDimension(dim_name, dim_size)
+            dim_name = next((d for d in dims_by_size.get(dim_size, []) if d not in dims), None)
+            if dim_name is None:
+                dim_name = f"{name}_dim_{i}"
+                ds.createDimension(dim_name, dim_size)
+                dims_by_size.setdefault(dim_size, []).append(dim_name)
             dims.append(dim_name)
         
         # Create variable
-        var = ds.createVariable(name, array.dtype, dims)
+        if array.ndim and array.dtype.kind in 'iuf':
+            var = ds.createVariable(name, array.dtype, dims, zlib=True, complevel=4,
+                                    shuffle=True,
+                                    chunksizes=_choose_chunks(array.shape, array.itemsize))
+        else:
+            var = ds.createVariable(name, array.dtype, dims)
         var[:] = array
     
     ds.close()
@@ -154,14 +239,39 @@ def export_to_hdf5(
         f.attrs['created'] = datetime.now().isoformat()
         f.attrs['source'] = 'FUNGI-MYCEL v1.0.0'
         
+        def save_array(group, key, value):
+            data_array = np.asarray(value)
+            if data_array.dtype.kind in 'OU':
+                # h5py has no native unicode/object type; store variable-length strings
+                data_array = np.array([str(v) for v in data_array.ravel()],
+                                      dtype=h5py.string_dtype()).reshape(data_array.shape)
+            if compression and data_array.ndim and data_array.size:
+                group.create_dataset(key, data=data_array, chunks=True,
+                                     compression=compression,
+                                     compression_opts=4 if compression == 'gzip' else None,
+                                     shuffle=data_array.dtype.kind in 'iuf')
+            else:
+                group.create_dataset(key, data=data_array)
+        
         def recursively_save(group, data_dict):
             for key, value in data_dict.items():
                 if isinstance(value, dict):
                     subgroup = group.create_group(key)
                     recursively_save(subgroup, value)
+                elif _is_record_list(value):
+                    # Store a list of same-keyed dicts (e.g. MNIS results)
+                    # column-wise: one dataset per field instead of per record
+                    subgroup = group.create_group(key)
+                    recursively_save(subgroup, {
+                        field: [record[field] for record in value]
+                        for field in value[0]
+                    })
                 elif isinstance(value, (np.ndarray, list)):
-                    data_array = np.array(value)
-                    group.create_dataset(key, data=data_array, compression=compression)
+                    try:
+                        save_array(group, key, value)
+                    except (TypeError, ValueError):
+                        # Ragged or nested lists: fall back to one string per element
+                        save_array(group, key, np.array([str(v) for v in value], dtype=object))
                 elif isinstance(value, (int, float, str, bool)):
                     group.attrs[key] = value
                 else:
@@ -173,6 +283,26 @@ def export_to_hdf5(
         recursively_save(f, data)
 
 
+def _is_record_list(value: Any) -> bool:
+    """Check whether value is a non-empty list of dicts sharing the same keys."""
+    if not isinstance(value, list) or not value or not isinstance(value[0], dict):
+        return False
+    keys = value[0].keys()
+    return all(isinstance(v, dict) and v.keys() == keys for v in value)
+
+
+def _report_param_rows(mnis_results: Dict[str, Any]):
+    """Yield (name, raw, normalized) report rows with floats formatted to 3 places."""
+    params = mnis_results.get('parameters', {})
+    norm_params = mnis_results.get('normalized_params', {})
+    for param in ['eta_nw', 'rho_e', 'grad_c', 'ser', 'k_topo', 'e_a', 'abi', 'bfs']:
+        raw = params.get(param, 'N/A')
+        norm = norm_params.get(param, 'N/A')
+        raw_s = f"{raw:.3f}" if isinstance(raw, float) else str(raw)
+        norm_s = f"{norm:.3f}" if isinstance(norm, float) else str(norm)
+        yield param, raw_s, norm_s
+
+
 def export_report(
     mnis_results: Dict[str, Any],
     output_path: Union[str, Path],
@@ -190,44 +320,38 @@ def export_report(
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     if format == 'md':
+        parts = [
+            "# 🍄 FUNGI-MYCEL Network Intelligence Report\n\n",
+            f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n",
+            "## 📊 MNIS Results\n\n",
+            "| Metric | Value |\n",
+            "|--------|-------|\n",
+            f"| MNIS Score | {mnis_results.get('mnis_score', 'N/A'):.3f} |\n",
+            f"| Class | {mnis_results.get('class', 'N/A')} |\n",
+            f"| Biome | {mnis_results.get('biome', 'N/A')} |\n",
+        ]
+        if 'site_id' in mnis_results:
+            parts.append(f"| Site | {mnis_results['site_id']} |\n")
+        if 'mnu_id' in mnis_results:
+            parts.append(f"| MNU | {mnis_results['mnu_id']} |\n")
+        
+        parts.append("\n## 📈 Parameters\n\n")
+        parts.append("| Parameter | Raw Value | Normalized |\n")
+        parts.append("|-----------|-----------|------------|\n")
+        
+        for param, raw, norm in _report_param_rows(mnis_results):
+            parts.append(f"| {param} | {raw} | {norm} |\n")
+        
+        if 'warning_flags' in mnis_results and mnis_results['warning_flags']:
+            parts.append("\n## ⚠️ Warnings\n\n")
+            for warning in mnis_results['warning_flags']:
+                parts.append(f"- {warning}\n")
+        
+        parts.append("\n---\n")
+        parts.append("*Report generated by FUNGI-MYCEL v1.0.0*\n")
+        
         with open(output_path, 'w') as f:
-            f.write("# 🍄 FUNGI-MYCEL Network Intelligence Report\n\n")
-            f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
-            
-            f.write("## 📊 MNIS Results\n\n")
-            f.write(f"| Metric | Value |\n")
-            f.write(f"|--------|-------|\n")
-            f.write(f"| MNIS Score | {mnis_results.get('mnis_score', 'N/A'):.3f} |\n")
-            f.write(f"| Class | {mnis_results.get('class', 'N/A')} |\n")
-            f.write(f"| Biome | {mnis_results.get('biome', 'N/A')} |\n")
-            if 'site_id' in mnis_results:
-                f.write(f"| Site | {mnis_results['site_id']} |\n")
-            if 'mnu_id' in mnis_results:
-                f.write(f"| MNU | {mnis_results['mnu_id']} |\n")
-            
-            f.write("\n## 📈 Parameters\n\n")
-            f.write("| Parameter | Raw Value | Normalized |\n")
-            f.write("|-----------|-----------|------------|\n")
-            
-            params = mnis_results.get('parameters', {})
-            norm_params = mnis_results.get('normalized_params', {})
-            
-            for param in ['eta_nw', 'rho_e', 'grad_c', 'ser', 'k_topo', 'e_a', 'abi', 'bfs']:
-                raw = params.get(param, 'N/A')
-                norm = norm_params.get(param, 'N/A')
-                if isinstance(raw, float):
-                    raw = f"{raw:.3f}"
-                if isinstance(norm, float):
-                    norm = f"{norm:.3f}"
-                f.write(f"| {param} | {raw} | {norm} |\n")
-            
-            if 'warning_flags' in mnis_results and mnis_results['warning_flags']:
-                f.write("\n## ⚠️ Warnings\n\n")
-                for warning in mnis_results['warning_flags']:
-                    f.write(f"- {warning}\n")
-            
-            f.write("\n---\n")
-            f.write("*Report generated by FUNGI-MYCEL v1.0.0*\n")
+            f.write(''.join(parts))
     
     elif format == 'txt':
         with open(output_path, 'w') as f:
@@ -248,7 +372,7 @@ def export_report(
                     f.write(f"  {param}: {value}\n")
     
     elif format == 'html':
-        html = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <title>FUNGI-MYCEL Report</title>
@@ -275,25 +399,22 @@ def export_report(
     
     <h2>📈 Parameters</h2>
     <table>
-        <tr><th>Parameter</th><th>Raw Value</th><th>Normalized</th></tr>"""
+        <tr><th>Parameter</th><th>Raw Value</th><th>Normalized</th></tr>"""]
         
-        params = mnis_results.get('parameters', {})
-        norm_params = mnis_results.get('normalized_params', {})
-        for param in ['eta_nw', 'rho_e', 'grad_c', 'ser', 'k_topo', 'e_a', 'abi', 'bfs']:
-            raw = params.get(param, 'N/A')
-            norm = norm_params.get(param, 'N/A')
-            html += f"<tr><td>{param}</td><td>{raw:.3f if isinstance(raw, float) else raw}</td><td>{norm:.3f if isinstance(norm, float) else norm}</td></tr>"
+        for param, raw, norm in _report_param_rows(mnis_results):
+            parts.append(f"<tr><td>{param}</td><td>{raw}</td><td>{norm}</td></tr>")
+        parts.append("</table>")
         
         if 'warning_flags' in mnis_results and mnis_results['warning_flags']:
-            html += "</table>\n<h2>⚠️ Warnings</h2>\n<ul>"
+            parts.append("\n<h2>⚠️ Warnings</h2>\n<ul>")
             for warning in mnis_results['warning_flags']:
-                html += f"<li class='warning'>{warning}</li>"
-            html += "</ul>"
+                parts.append(f"<li class='warning'>{warning}</li>")
+            parts.append("</ul>")
         
-        html += "\n<hr><p><em>Generated by FUNGI-MYCEL v1.0.0</em></p></body></html>"
+        parts.append("\n<hr><p><em>Generated by FUNGI-MYCEL v1.0.0</em></p></body></html>")
         
         with open(output_path, 'w') as f:
-            f.write(html)
+            f.write(''.join(parts))
     
     else:
         raise ValueError(f"Unsupported format: {format}")
@@ -344,22 +465,31 @@ def export_mnis_batch(
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    if 'csv' in formats:
-        export_to_csv(results, output_dir / f'mnis_batch_{timestamp}.csv')
+    # One columnar pass serves both the CSV export and the summary
+    df = _records_frame(results)
+    
+    # output_dir exists now, so write through the helpers that skip mkdir
+    if 'csv' in formats and results:
+        _export_df_to_csv(df, output_dir / f'mnis_batch_{timestamp}.csv')
     
     if 'json' in formats:
-        export_to_json(results, output_dir / f'mnis_batch_{timestamp}.json')
+        _write_json(results, output_dir / f'mnis_batch_{timestamp}.json')
     
     # Generate summary report
+    if 'mnis_score' in df:
+        scores = df['mnis_score'].fillna(0).to_numpy(dtype=np.float64)
+    else:
+        scores = np.zeros(len(df))
+    if 'class' in df:
+        classes = df['class'].fillna('UNKNOWN')
+    else:
+        classes = pd.Series(['UNKNOWN'] * len(df))
+    
     summary = {
         'n_results': len(results),
-        'mean_mnis': np.mean([r.get('mnis_score', 0) for r in results]),
-        'std_mnis': np.std([r.get('mnis_score', 0) for r in results]),
-        'classes': {}
+        'mean_mnis': np.mean(scores),
+        'std_mnis': np.std(scores),
+        'classes': classes.value_counts(sort=False).to_dict(),
     }
     
-    for r in results:
-        cls = r.get('class', 'UNKNOWN')
-        summary['classes'][cls] = summary['classes'].get(cls, 0) + 1
-    
-    export_to_json(summary, output_dir / f'mnis_summary_{timestamp}.json')
+    _write_json(summary, output_dir / f'mnis_summary_{timestamp}.json')
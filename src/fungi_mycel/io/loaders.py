@@ -6,10 +6,14 @@ Functions for loading various data formats used in the framework.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Dict, List, Mapping, Optional, Union, Any, Tuple
 from pathlib import Path
+from types import MappingProxyType
 import json
 import csv
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 import warnings
 
 try:
@@ -24,16 +28,65 @@ try:
 except ImportError:
     NETCDF_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401  (enables pandas' pyarrow csv engine)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 try:
     from skimage import io as skio
     SKIMAGE_AVAILABLE = True
 except ImportError:
     SKIMAGE_AVAILABLE = False
 
+# Parameter columns read by load_parameters, with defaults for absent ones
+_PARAM_DEFAULTS = {
+    'eta_nw': 0.5,
+    'rho_e': 0.5,
+    'grad_c': 0.5,
+    'ser': 1.0,
+    'k_topo': 1.6,
+    'e_a': 0.5,
+    'abi': 1.5,
+    'bfs': 0.5,
+}
+_PARAM_NAMES = tuple(_PARAM_DEFAULTS)
+_PARAM_CSV_COLUMNS = frozenset(_PARAM_NAMES + ('site_id', 'mnu_id'))
+
+# CSV files up to this size are parsed with the csv module, skipping the
+# cost of building a DataFrame for what is usually a row or two
+_SMALL_CSV_BYTES = 1 << 20
+
+# Fields pandas.read_csv reads as NaN by default (its na_values list)
+_CSV_NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+})
+
+# RGB -> luminance weights for the matplotlib grayscale fallback
+_LUMA_WEIGHTS = np.array([0.2989, 0.5870, 0.1140], dtype=np.float32)
+
+# FASTA record boundary, and bytes dropped from sequence data
+_FASTA_RECORD = re.compile(b'\n>')
+_WHITESPACE = b' \t\r\n\x0b\x0c'
+
+# Read size for streaming FASTQ parsing
+_FASTQ_BUFFER_SIZE = 256 * 1024
+
 
 def load_electrode_data(
     file_path: Union[str, Path],
-    sampling_rate: Optional[float] = None
+    sampling_rate: Optional[float] = None,
+    mmap: bool = False,
+    csv_header: Union[int, str, None] = 0
 ) -> Tuple[np.ndarray, float]:
     """
     Load microelectrode array recording data.
@@ -41,6 +94,12 @@ def load_electrode_data(
     Args:
         file_path: Path to electrode data file
         sampling_rate: Sampling rate in Hz (if not embedded)
+        mmap: Return a read-only memory map instead of reading the data into
+              memory, for .npy files and for HDF5 files whose dataset is
+              stored contiguously and uncompressed
+        csv_header: Header row of .csv files, None for headerless files, or
+                    'infer' to treat the first line as a header only if one
+                    of its fields is not numeric
     
     Returns:
         (data_array, actual_sampling_rate)
@@ -53,18 +112,33 @@ def load_electrode_data(
     
     # Handle different formats
     if file_path.suffix == '.npy':
-        data = np.load(file_path)
+        data = np.load(file_path, mmap_mode='r' if mmap else None, allow_pickle=False)
         sr = sampling_rate or 1000.0  # default
         
+    elif file_path.suffix == '.npz':
+        # Archive members are zip entries and cannot be memory-mapped; only
+        # the requested arrays are decompressed
+        with np.load(file_path, allow_pickle=False) as archive:
+            if 'electrode_data' in archive.files:
+                data = archive['electrode_data']
+            elif 'data' in archive.files:
+                data = archive['data']
+            else:
+                raise ValueError(
+                    f"{file_path} has no 'electrode_data' or 'data' array "
+                    f"(found: {', '.join(archive.files) or 'none'})"
+                )
+            if 'sampling_rate' in archive.files:
+                sr = archive['sampling_rate'].item()
+            else:
+                sr = sampling_rate or 1000.0
+        
     elif file_path.suffix == '.csv':
-        df = pd.read_csv(file_path)
-        data = df.values
+        data = _read_electrode_csv(file_path, csv_header)
         sr = sampling_rate or 1000.0
         
     elif file_path.suffix == '.h5' and HDF5_AVAILABLE:
-        with h5py.File(file_path, 'r') as f:
-            data = f['electrode_data'][:]
-            sr = f.attrs.get('sampling_rate', sampling_rate or 1000.0)
+        data, sr = _load_hdf5_electrode(file_path, sampling_rate, mmap)
     
     elif file_path.suffix == '.nc' and NETCDF_AVAILABLE:
         ds = nc.Dataset(file_path)
@@ -82,6 +156,72 @@ def load_electrode_data(
     return data, float(sr)
 
 
+def _read_electrode_csv(
+    file_path: Path,
+    header: Union[int, str, None] = 0
+) -> np.ndarray:
+    """
+    Read an electrode CSV into an array.
+    
+    With header='infer' the first line is only treated as a header if some
+    field in it is not numeric, so headerless recordings keep their first
+    sample. pandas' multi-threaded pyarrow engine is used when pyarrow is
+    installed.
+    """
+    if header == 'infer':
+        with open(file_path, 'r', encoding='utf-8-sig') as f:
+            first_line = f.readline()
+        try:
+            [_csv_float(field) for field in first_line.split(',')]
+            header = None
+        except ValueError:
+            header = 0
+    
+    kwargs = {'engine': 'pyarrow'} if PYARROW_AVAILABLE else {}
+    df = pd.read_csv(file_path, header=header, **kwargs)
+    return df.to_numpy(copy=False)
+
+
+def _load_hdf5_electrode(
+    file_path: Path,
+    sampling_rate: Optional[float],
+    mmap: bool
+) -> Tuple[np.ndarray, float]:
+    """Read the electrode dataset and sampling rate from an HDF5 file."""
+    with h5py.File(file_path, 'r') as f:
+        data = _read_hdf5_dataset(f['electrode_data'], file_path, mmap=mmap)
+        sr = f.attrs.get('sampling_rate', sampling_rate or 1000.0)
+    return data, sr
+
+
+def _read_hdf5_dataset(dset, file_path: Path, mmap: bool = False) -> np.ndarray:
+    """
+    Read an HDF5 dataset into a preallocated array.
+    
+    Chunked datasets are read slab by slab along the first axis, aligned to
+    the chunk shape, straight into the output buffer. With mmap=True a
+    contiguous, unfiltered dataset is mapped from the file instead.
+    """
+    if mmap and dset.chunks is None and dset.shape:
+        offset = dset.id.get_offset()
+        if offset is not None:
+            return np.memmap(file_path, dtype=dset.dtype, mode='r',
+                             offset=offset, shape=dset.shape)
+    
+    out = np.empty(dset.shape, dtype=dset.dtype)
+    if dset.chunks is None or not dset.shape:
+        if dset.size:
+            # Whole-dataset read through the low-level id, no selection setup
+            dset.id.read(h5py.h5s.ALL, h5py.h5s.ALL, out)
+        return out
+    
+    step = dset.chunks[0]
+    for start in range(0, dset.shape[0], step):
+        sel = np.s_[start:start + step]
+        dset.read_direct(out, source_sel=sel, dest_sel=sel)
+    return out
+
+
 def load_parameters(
     file_path: Union[str, Path],
     site_id: Optional[str] = None,
@@ -104,8 +244,7 @@ def load_parameters(
         raise FileNotFoundError(f"File not found: {file_path}")
     
     if file_path.suffix == '.json':
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = _read_json_cached(*_file_key(file_path))
         
         # Filter by ID if provided
         if site_id and 'site_id' in data and data['site_id'] != site_id:
@@ -116,14 +255,27 @@ def load_parameters(
         
         # Extract parameters
         if 'parameters' in data:
-            return data['parameters']
+            return _thaw(data['parameters'])
         else:
-            return {k: v for k, v in data.items() 
-                   if k in ['eta_nw', 'rho_e', 'grad_c', 'ser', 
-                           'k_topo', 'e_a', 'abi', 'bfs']}
+            return {k: _thaw(v) for k, v in data.items() if k in _PARAM_DEFAULTS}
+    
+    elif file_path.suffix == '.csv' and file_path.stat().st_size <= _SMALL_CSV_BYTES:
+        row = _first_csv_row(file_path, site_id=site_id, mnu_id=mnu_id)
+        if row is None:
+            return {}
+        
+        params = dict(_PARAM_DEFAULTS)
+        params.update((name, _csv_float(row[name])) for name in _PARAM_NAMES if name in row)
+        return params
     
     elif file_path.suffix == '.csv':
-        df = pd.read_csv(file_path)
+        # Only parse the columns used below, with their types fixed up front
+        df = pd.read_csv(
+            file_path,
+            usecols=lambda col: col in _PARAM_CSV_COLUMNS,
+            dtype={**{name: np.float64 for name in _PARAM_NAMES},
+                   'site_id': str, 'mnu_id': str},
+        )
         
         # Filter by ID if provided
         if site_id and 'site_id' in df.columns:
@@ -135,25 +287,147 @@ def load_parameters(
         if len(df) == 0:
             return {}
         
-        # Take first row
-        row = df.iloc[0]
-        
-        return {
-            'eta_nw': row.get('eta_nw', 0.5),
-            'rho_e': row.get('rho_e', 0.5),
-            'grad_c': row.get('grad_c', 0.5),
-            'ser': row.get('ser', 1.0),
-            'k_topo': row.get('k_topo', 1.6),
-            'e_a': row.get('e_a', 0.5),
-            'abi': row.get('abi', 1.5),
-            'bfs': row.get('bfs', 0.5),
-        }
+        # Take first row in one vectorized access; absent columns keep defaults
+        columns = [name for name in _PARAM_NAMES if name in df.columns]
+        params = dict(_PARAM_DEFAULTS)
+        params.update(zip(columns, df[columns].to_numpy(dtype=np.float64)[0].tolist()))
+        return params
     
     else:
         raise ValueError(f"Unsupported file format: {file_path.suffix}")
 
 
-def load_site_metadata(site_id: str) -> Dict[str, Any]:
+def _csv_float(value: Optional[str]) -> float:
+    """Convert a csv field to float, reading missing values as NaN like pandas."""
+    if value is None or value in _CSV_NA_VALUES or not value.strip():
+        return float('nan')
+    return float(value)
+
+
+def _file_key(file_path: Path) -> Tuple[str, int, int]:
+    """
+    Cache key for a file's parsed contents.
+    
+    The size is part of the key because a rewrite within the filesystem's
+    timestamp resolution leaves the mtime unchanged.
+    """
+    st = file_path.stat()
+    return str(file_path.resolve()), st.st_mtime_ns, st.st_size
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: dicts become mappingproxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Mutable copy of a _freeze result with the dicts and lists json.load gives."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=256)
+def _read_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a JSON file once per (path, mtime, size) into read-only containers.
+    
+    The result is shared between calls; callers hand out _thaw copies.
+    """
+    raw = Path(path).read_bytes()
+    if ORJSON_AVAILABLE:
+        try:
+            return _freeze(orjson.loads(raw))
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which only the stdlib accepts
+    return _freeze(json.loads(raw))
+
+
+@lru_cache(maxsize=256)
+def _read_csv_cached(
+    path: str,
+    mtime_ns: int,
+    size: int
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]]:
+    """Parse a CSV file once per (path, mtime, size) into (fieldnames, rows)."""
+    # utf-8-sig drops a byte order mark, which would otherwise end up in
+    # the first column name
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        fieldnames = tuple(next(reader, ()))
+        rows = tuple(tuple(row) for row in reader if row)
+    return fieldnames, rows
+
+
+def _first_csv_row(
+    file_path: Path,
+    site_id: Optional[str] = None,
+    mnu_id: Optional[str] = None
+) -> Optional[Dict[str, str]]:
+    """
+    Return the first CSV row matching the optional ID filters.
+    
+    A filter only applies when the file has the corresponding column.
+    Short rows are padded with None, as csv.DictReader does.
+    """
+    fieldnames, rows = _read_csv_cached(*_file_key(file_path))
+    site_col = fieldnames.index('site_id') if site_id and 'site_id' in fieldnames else None
+    mnu_col = fieldnames.index('mnu_id') if mnu_id and 'mnu_id' in fieldnames else None
+    
+    for row in rows:
+        if site_col is not None and (len(row) <= site_col or row[site_col] != site_id):
+            continue
+        if mnu_col is not None and (len(row) <= mnu_col or row[mnu_col] != mnu_id):
+            continue
+        return dict(zip(fieldnames, row + (None,) * (len(fieldnames) - len(row))))
+    
+    return None
+
+
+# Known site metadata served by load_site_metadata
+_SITE_METADATA = MappingProxyType({
+    'bialowieza-01': MappingProxyType({
+        'name': 'Białowieża National Park',
+        'country': 'Poland',
+        'biome': 'temperate_broadleaf',
+        'established': 2007,
+        'area_ha': 150,
+        'dominant_trees': ('Fagus sylvatica', 'Quercus robur'),
+        'dominant_fungi': ('Amanita muscaria', 'Cortinarius violaceus'),
+        'coordinates': (52.7333, 23.8667),
+        'elevation_m': 170,
+        'mean_temp_c': 7.5,
+        'mean_precip_mm': 650,
+    }),
+    'oregon-armillaria-01': MappingProxyType({
+        'name': 'Malheur National Forest',
+        'country': 'USA',
+        'biome': 'boreal_conifer',
+        'established': 2008,
+        'area_ha': 965,
+        'dominant_trees': ('Pinus ponderosa', 'Pseudotsuga menziesii'),
+        'dominant_fungi': ('Armillaria ostoyae',),
+        'coordinates': (44.1167, -118.6167),
+        'elevation_m': 1500,
+        'mean_temp_c': 6.2,
+        'mean_precip_mm': 550,
+    }),
+})
+
+_UNKNOWN_SITE = MappingProxyType({
+    'name': 'Unknown',
+    'biome': 'unknown',
+    'established': 2020,
+})
+
+
+def load_site_metadata(site_id: str) -> Mapping[str, Any]:
     """
     Load metadata for a specific site.
     
@@ -161,51 +435,20 @@ def load_site_metadata(site_id: str) -> Dict[str, Any]:
         site_id: Site identifier
     
     Returns:
-        Site metadata dictionary
+        Read-only site metadata mapping (shared between calls; use dict() for
+        a mutable copy)
     """
     # This would normally load from database or file
     # Simplified version for now
-    metadata = {
-        'bialowieza-01': {
-            'name': 'Białowieża National Park',
-            'country': 'Poland',
-            'biome': 'temperate_broadleaf',
-            'established': 2007,
-            'area_ha': 150,
-            'dominant_trees': ['Fagus sylvatica', 'Quercus robur'],
-            'dominant_fungi': ['Amanita muscaria', 'Cortinarius violaceus'],
-            'coordinates': (52.7333, 23.8667),
-            'elevation_m': 170,
-            'mean_temp_c': 7.5,
-            'mean_precip_mm': 650,
-        },
-        'oregon-armillaria-01': {
-            'name': 'Malheur National Forest',
-            'country': 'USA',
-            'biome': 'boreal_conifer',
-            'established': 2008,
-            'area_ha': 965,
-            'dominant_trees': ['Pinus ponderosa', 'Pseudotsuga menziesii'],
-            'dominant_fungi': ['Armillaria ostoyae'],
-            'coordinates': (44.1167, -118.6167),
-            'elevation_m': 1500,
-            'mean_temp_c': 6.2,
-            'mean_precip_mm': 550,
-        },
-    }
-    
-    return metadata.get(site_id, {
-        'name': 'Unknown',
-        'biome': 'unknown',
-        'established': 2020,
-    })
+    return _SITE_METADATA.get(site_id, _UNKNOWN_SITE)
 
 
+@lru_cache(maxsize=128)
 def load_mnu_list(
     site_id: Optional[str] = None,
     biome: Optional[str] = None,
     limit: int = 100
-) -> List[Dict[str, Any]]:
+) -> Tuple[Mapping[str, Any], ...]:
     """
     Load list of Mycelial Network Units.
     
@@ -215,82 +458,230 @@ def load_mnu_list(
         limit: Maximum number to return
     
     Returns:
-        List of MNU metadata dictionaries
+        Tuple of read-only MNU metadata mappings, memoized per arguments
     """
     # This would normally load from database
     # Return dummy data for now
     mnus = []
     
     for i in range(min(limit, 10)):
-        mnus.append({
+        mnus.append(MappingProxyType({
             'mnu_id': f'MNU-2026-{i:04d}',
             'site_id': site_id or f'site-{i}',
             'sampling_date': '2026-02-15',
             'depth_cm': 10 + i,
             'soil_type': 'loam',
             'parameters_available': True,
-        })
+        }))
     
-    return mnus
+    return tuple(mnus)
+
+
+def _split_header(header: bytes) -> Tuple[str, str]:
+    """Split a FASTA/FASTQ header into its ID (first word) and description."""
+    header = header.strip()
+    seq_id = header.partition(b' ')[0].partition(b'\t')[0]
+    return seq_id.decode(), header[len(seq_id):].lstrip().decode()
+
+
+def _line_view(view: memoryview, start: int, end: int) -> memoryview:
+    """Slice one line out of view, dropping a trailing carriage return."""
+    if end > start and view[end - 1] == 0x0D:
+        end -= 1
+    return view[start:end]
+
+
+def _parse_fasta(buf: bytes, as_views: bool = False) -> Tuple[List[str], List[str], List[Any]]:
+    """Parse a FASTA buffer into parallel (ids, descriptions, sequences) lists."""
+    view = memoryview(buf)
+    ids, descriptions, sequences = [], [], []
+    
+    # Locate record starts ('>' at line start) in one regex scan over the
+    # raw bytes instead of stripping and testing every line in Python
+    starts = [m.start() + 1 for m in _FASTA_RECORD.finditer(buf)]
+    if buf.startswith(b'>'):
+        starts.insert(0, 0)
+    ends = starts[1:] + [len(buf) + 1]
+    
+    # Plain LF files only need newlines removed from sequence data
+    padded = any(c in buf for c in (b' ', b'\t', b'\r', b'\x0b', b'\x0c'))
+    
+    for start, end in zip(starts, ends):
+        end -= 1  # drop the newline preceding the next record
+        header_end = buf.find(b'\n', start, end)
+        if header_end == -1:
+            header_end = end
+        
+        record_id, description = _split_header(buf[start + 1:header_end])
+        if not record_id:
+            continue
+        
+        seq_start = header_end + 1
+        seq_end = end - 1 if end > seq_start and buf[end - 1] == 0x0A else end
+        ids.append(record_id)
+        descriptions.append(description)
+        if as_views and not padded and buf.find(b'\n', seq_start, seq_end) == -1:
+            # Single-line record: slice the shared buffer without copying
+            sequences.append(view[seq_start:seq_end])
+            continue
+        
+        seq = buf[seq_start:end]
+        seq = seq.translate(None, _WHITESPACE) if padded else seq.replace(b'\n', b'')
+        sequences.append(memoryview(seq) if as_views else seq.decode())
+    
+    return ids, descriptions, sequences
+
+
+def _parse_fastq(
+    file_path: Path,
+    as_views: bool = False
+) -> Tuple[List[str], List[str], List[Any], List[Any]]:
+    """Parse a FASTQ file into parallel (ids, descriptions, sequences, qualities) lists."""
+    ids, descriptions, sequences, qualities = [], [], [], []
+    with open(file_path, 'rb') as f:
+        buf = b''
+        eof = False
+        while not eof:
+            chunk = f.read(_FASTQ_BUFFER_SIZE)
+            eof = not chunk
+            buf += chunk
+            view = memoryview(buf)
+            pos = 0
+            
+            # Consume every complete 4-line record in the buffer
+            while True:
+                header_end = buf.find(b'\n', pos)
+                seq_end = buf.find(b'\n', header_end + 1) if header_end != -1 else -1
+                plus_end = buf.find(b'\n', seq_end + 1) if seq_end != -1 else -1
+                if plus_end == -1:
+                    break
+                
+                # Quality has the same length as the sequence, so jump
+                # straight to its end and only scan if that isn't a newline
+                qual_start = plus_end + 1
+                qual_end = qual_start + (seq_end - header_end - 1)
+                if qual_end >= len(buf) or buf[qual_end] != 0x0A:
+                    qual_end = buf.find(b'\n', qual_start)
+                if qual_end == -1:
+                    if not eof or qual_start >= len(buf):
+                        break
+                    qual_end = len(buf)
+                
+                record_id, description = _split_header(buf[pos:header_end].lstrip()[1:])
+                ids.append(record_id)
+                descriptions.append(description)
+                if as_views:
+                    sequences.append(_line_view(view, header_end + 1, seq_end))
+                    qualities.append(_line_view(view, qual_start, qual_end))
+                else:
+                    sequences.append(buf[header_end + 1:seq_end].strip().decode())
+                    qualities.append(buf[qual_start:qual_end].strip().decode())
+                pos = qual_end + 1
+            
+            buf = buf[pos:]
+    
+    return ids, descriptions, sequences, qualities
 
 
 def load_sequence_data(
     file_path: Union[str, Path],
-    format: str = 'fasta'
-) -> List[Dict[str, str]]:
+    format: str = 'fasta',
+    as_views: bool = False
+) -> List[Dict[str, Union[str, memoryview]]]:
     """
     Load DNA/RNA/protein sequence data.
     
     Args:
         file_path: Path to sequence file
         format: 'fasta' or 'fastq'
+        as_views: Return 'sequence' (and FASTQ 'quality') as read-only
+                  memoryviews of raw bytes instead of str. Single-line records
+                  are zero-copy slices of one shared file buffer, which stays
+                  alive as long as any view does; multi-line FASTA records get
+                  one buffer each with line breaks removed. Call .tobytes() or
+                  bytes(view).decode() where a copy or str is needed.
     
     Returns:
-        List of {'id': ..., 'sequence': ...} dictionaries
+        List of {'id': ..., 'description': ..., 'sequence': ...} dictionaries
+        (plus 'quality' for FASTQ). 'id' is the first word of the header line
+        and 'description' the rest of it.
     """
     file_path = Path(file_path)
     
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    sequences = []
-    
     if format == 'fasta':
-        with open(file_path, 'r') as f:
-            current_id = None
-            current_seq = []
-            
-            for line in f:
-                line = line.strip()
-                if line.startswith('>'):
-                    if current_id:
-                        sequences.append({
-                            'id': current_id,
-                            'sequence': ''.join(current_seq)
-                        })
-                    current_id = line[1:]
-                    current_seq = []
-                else:
-                    current_seq.append(line)
-            
-            if current_id:
-                sequences.append({
-                    'id': current_id,
-                    'sequence': ''.join(current_seq)
-                })
+        return [
+            {'id': record_id, 'description': description, 'sequence': seq}
+            for record_id, description, seq in zip(*_parse_fasta(file_path.read_bytes(), as_views))
+        ]
+    
+    if format == 'fastq':
+        return [
+            {'id': record_id, 'description': description, 'sequence': seq, 'quality': qual}
+            for record_id, description, seq, qual in zip(*_parse_fastq(file_path, as_views))
+        ]
+    
+    return []
+
+
+@dataclass
+class SequenceRecords:
+    """Sequence records stored column-wise, one array per field."""
+    ids: np.ndarray           # object array of str
+    descriptions: np.ndarray  # object array of str
+    sequences: np.ndarray     # object array of str
+    lengths: np.ndarray       # int64 sequence lengths
+    qualities: Optional[np.ndarray] = None  # object array of str (FASTQ only)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def load_sequence_arrays(
+    file_path: Union[str, Path],
+    format: str = 'fasta'
+) -> SequenceRecords:
+    """
+    Load sequence data as parallel arrays instead of one dict per record.
     
-    elif format == 'fastq':
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-            for i in range(0, len(lines), 4):
-                if i + 3 < len(lines):
-                    sequences.append({
-                        'id': lines[i].strip()[1:],
-                        'sequence': lines[i+1].strip(),
-                        'quality': lines[i+3].strip()
-                    })
+    Avoids the per-record dictionary of load_sequence_data, which dominates
+    memory for files with millions of short records, and gives vectorized
+    access to fields such as the sequence lengths.
+    
+    Args:
+        file_path: Path to sequence file
+        format: 'fasta' or 'fastq'
+    
+    Returns:
+        SequenceRecords with one entry per record
+    """
+    file_path = Path(file_path)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
     
-    return sequences
+    if format == 'fasta':
+        columns = _parse_fasta(file_path.read_bytes())
+    elif format == 'fastq':
+        columns = _parse_fastq(file_path)
+    else:
+        raise ValueError(f"Unsupported sequence format: {format}")
+    
+    arrays = []
+    for column in columns:
+        arr = np.empty(len(column), dtype=object)
+        arr[:] = column
+        arrays.append(arr)
+    
+    return SequenceRecords(
+        ids=arrays[0],
+        descriptions=arrays[1],
+        sequences=arrays[2],
+        lengths=np.fromiter(map(len, columns[2]), dtype=np.int64, count=len(columns[2])),
+        qualities=arrays[3] if len(arrays) == 4 else None,
+    )
 
 
 def load_image_data(
@@ -318,7 +709,14 @@ def load_image_data(
         # Fallback to matplotlib
         import matplotlib.pyplot as plt
         image = plt.imread(file_path)
-        if as_gray and len(image.shape) == 3:
+        if as_gray and len(image.shape) == 3 and image.shape[2] >= 3:
+            # ITU-R 601 luminance as a single float32 matrix-vector product;
+            # an alpha channel, if any, is ignored
+            gray = image[..., :3].astype(np.float32, copy=False) @ _LUMA_WEIGHTS
+            if image.dtype == np.uint8:
+                gray = np.clip(np.rint(gray), 0, 255).astype(np.uint8)
+            image = gray
+        elif as_gray and len(image.shape) == 3:
             image = np.mean(image, axis=2)
     
     return image
@@ -341,7 +739,22 @@ def load_icpms_data(
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    if file_path.suffix == '.csv':
+    if file_path.suffix == '.csv' and file_path.stat().st_size <= _SMALL_CSV_BYTES:
+        row = _first_csv_row(file_path)
+        if row is None:
+            return {}
+        
+        elements = {}
+        for col, value in row.items():
+            if col not in ['sample_id', 'date', 'time']:
+                try:
+                    elements[col] = _csv_float(value)
+                except (ValueError, TypeError):
+                    pass
+        
+        return elements
+    
+    elif file_path.suffix == '.csv':
         df = pd.read_csv(file_path)
         if len(df) == 0:
             return {}
@@ -360,8 +773,7 @@ def load_icpms_data(
         return elements
     
     elif file_path.suffix == '.json':
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return _thaw(_read_json_cached(*_file_key(file_path)))
     
     else:
         raise ValueError(f"Unsupported file format: {file_path.suffix}")
@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Union, Tuple, Any
 from dataclasses import dataclass
 import json
 import pickle
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 # Try importing ML libraries - gracefully handle if not available
@@ -31,6 +33,27 @@ try:
 except ImportError:
     XGBOOST_AVAILABLE = False
 
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# TF, XGBoost and onnxruntime release the GIL, so the three models can run
+# concurrently; one executor serves every ensemble and starts with the first
+# concurrent prediction
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _model_pool() -> ThreadPoolExecutor:
+    """Shared executor for running ensemble members concurrently."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(max_workers=3)
+        return _POOL
+
 
 @dataclass
 class EnsembleConfig:
@@ -44,6 +67,12 @@ class EnsembleConfig:
     xgb_model_path: Optional[str] = None
     lstm_model_path: Optional[str] = None
     
+    # ONNX models (e.g. from AIEnsemble.export_onnx) take precedence over the
+    # native ones when onnxruntime is installed
+    cnn_onnx_path: Optional[str] = None
+    xgb_onnx_path: Optional[str] = None
+    lstm_onnx_path: Optional[str] = None
+    
     use_gpu: bool = False
     batch_size: int = 32
     threshold: float = 0.5
@@ -72,6 +101,10 @@ class AIEnsemble:
         3. LSTM: Predicts from time series history
     """
     
+    # Shared read-only neutral predictions for models that are not loaded
+    _DUMMY = np.full(1024, 0.5)
+    _DUMMY.flags.writeable = False
+    
     def __init__(self, config: Optional[EnsembleConfig] = None):
         """
         Initialize the AI ensemble.
@@ -85,6 +118,15 @@ class AIEnsemble:
         self.xgb_model = None
         self.lstm_model = None
         
+        # onnxruntime sessions, used instead of the models above when set
+        self._cnn_session = None
+        self._xgb_session = None
+        self._lstm_session = None
+        
+        # Traced graph functions for the Keras models, built on load
+        self._cnn_fn = None
+        self._lstm_fn = None
+        
         self.is_loaded = False
     
     def load_models(self):
@@ -98,6 +140,8 @@ class AIEnsemble:
                 self.cnn_model = keras.models.load_model(self.config.cnn_model_path)
             except Exception as e:
                 print(f"Warning: Could not load CNN model: {e}")
+            else:
+                self._cnn_fn = self._concrete_function(self.cnn_model)
         
         # Load XGBoost model
         if self.config.xgb_model_path and XGBOOST_AVAILABLE:
@@ -113,9 +157,119 @@ class AIEnsemble:
                 self.lstm_model = keras.models.load_model(self.config.lstm_model_path)
             except Exception as e:
                 print(f"Warning: Could not load LSTM model: {e}")
+            else:
+                self._lstm_fn = self._concrete_function(self.lstm_model)
+        
+        # Load ONNX sessions
+        if ONNXRUNTIME_AVAILABLE:
+            for name in ('cnn', 'xgb', 'lstm'):
+                onnx_path = getattr(self.config, f'{name}_onnx_path')
+                if not onnx_path:
+                    continue
+                try:
+                    session = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+                    setattr(self, f'_{name}_session', session)
+                except Exception as e:
+                    print(f"Warning: Could not load ONNX {name} model: {e}")
         
         self.is_loaded = True
     
+    @classmethod
+    def _dummy_prediction(cls, n: int) -> np.ndarray:
+        """Return a read-only array of n neutral (0.5) predictions without allocating."""
+        if n <= len(cls._DUMMY):
+            return cls._DUMMY[:n]
+        return np.broadcast_to(np.float64(0.5), (n,))
+    
+    @staticmethod
+    def _concrete_function(model):
+        """
+        Trace a Keras model into a graph function with a fixed signature.
+        
+        Calling the concrete function skips Keras's predict() loop (data
+        adapter, callbacks, batching), which dominates small-batch latency.
+        Returns None if the model cannot be traced.
+        """
+        try:
+            spec = tf.TensorSpec((None, *model.input_shape[1:]), tf.float32)
+            return tf.function(
+                lambda x: model(x, training=False), input_signature=[spec]
+            ).get_concrete_function()
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _run_session(session, x: np.ndarray) -> np.ndarray:
+        """Run a single-input onnxruntime session on float32 data."""
+        input_name = session.get_inputs()[0].name
+        return session.run(None, {input_name: np.ascontiguousarray(x, dtype=np.float32)})[0]
+    
+    def export_onnx(self, output_dir: Union[str, Path], quantize: bool = True) -> Dict[str, str]:
+        """
+        Export the loaded models to ONNX, optionally with int8 weights.
+        
+        Keras models are converted with tf2onnx and the XGBoost booster with
+        onnxmltools; with quantize=True each file is then passed through
+        onnxruntime's dynamic int8 quantization. The exported paths are set
+        on the config so the next load_models() runs them with onnxruntime.
+        
+        Args:
+            output_dir: Directory for the .onnx files
+            quantize: Apply dynamic int8 weight quantization
+        
+        Returns:
+            Dictionary of model name -> exported file path
+        """
+        self.load_models()
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        exported = {}
+        for name, model in (('cnn', self.cnn_model), ('lstm', self.lstm_model)):
+            if model is None:
+                continue
+            try:
+                import tf2onnx
+            except ImportError:
+                raise ImportError("tf2onnx is not available")
+            
+            onnx_path = output_dir / f'{name}_model.onnx'
+            spec = [tf.TensorSpec((None, *model.input_shape[1:]), tf.float32)]
+            tf2onnx.convert.from_keras(model, input_signature=spec, output_path=str(onnx_path))
+            exported[name] = onnx_path
+        
+        if self.xgb_model is not None:
+            try:
+                import onnxmltools
+                from onnxmltools.convert.common.data_types import FloatTensorType
+            except ImportError:
+                raise ImportError("onnxmltools is not available")
+            
+            onnx_path = output_dir / 'xgb_model.onnx'
+            n_features = self.xgb_model.num_features()
+            onnx_model = onnxmltools.convert_xgboost(
+                self.xgb_model, initial_types=[('input', FloatTensorType([None, n_features]))])
+            onnxmltools.utils.save_model(onnx_model, str(onnx_path))
+            exported['xgb'] = onnx_path
+        
+        if quantize and exported:
+            try:
+                from onnxruntime.quantization import QuantType, quantize_dynamic
+            except ImportError:
+                raise ImportError("onnxruntime is not available")
+            
+            for name, onnx_path in exported.items():
+                quantized_path = onnx_path.with_name(f'{onnx_path.stem}.int8.onnx')
+                quantize_dynamic(str(onnx_path), str(quantized_path), weight_type=QuantType.QInt8)
+                exported[name] = quantized_path
+        
+        for name, onnx_path in exported.items():
+            setattr(self.config, f'{name}_onnx_path', str(onnx_path))
+        self.is_loaded = False
+        
+        return {name: str(onnx_path) for name, onnx_path in exported.items()}
+    
     def predict_cnn(
         self,
         spike_data: np.ndarray  # [batch, time, electrodes]
@@ -129,14 +283,20 @@ class AIEnsemble:
         Returns:
             CNN predictions
         """
-        if self.cnn_model is None:
+        if self.cnn_model is None and self._cnn_session is None:
             # Return dummy prediction if model not loaded
-            return np.full(len(spike_data), 0.5)
+            return self._dummy_prediction(len(spike_data))
         
         # Ensure correct shape
         if len(spike_data.shape) == 2:
             spike_data = spike_data.reshape(1, *spike_data.shape)
         
+        if self._cnn_session is not None:
+            return self._run_session(self._cnn_session, spike_data)
+        
+        if self._cnn_fn is not None:
+            return self._cnn_fn(tf.constant(spike_data, dtype=tf.float32)).numpy()
+        
         return self.cnn_model.predict(spike_data, batch_size=self.config.batch_size)
     
     def predict_xgboost(
@@ -152,12 +312,21 @@ class AIEnsemble:
         Returns:
             XGBoost predictions
         """
-        if self.xgb_model is None:
-            return np.full(len(parameters), 0.5)
+        if self.xgb_model is None and self._xgb_session is None:
+            return self._dummy_prediction(len(parameters))
         
         if len(parameters.shape) == 1:
             parameters = parameters.reshape(1, -1)
         
+        if self._xgb_session is not None:
+            return self._run_session(self._xgb_session, parameters)
+        
+        # inplace_predict reads the array directly, skipping DMatrix
+        # construction (a full copy) that dominates small-batch latency
+        if hasattr(self.xgb_model, 'inplace_predict'):
+            return self.xgb_model.inplace_predict(
+                np.ascontiguousarray(parameters, dtype=np.float32))
+        
         dmatrix = xgb.DMatrix(parameters)
         return self.xgb_model.predict(dmatrix)
     
@@ -174,12 +343,18 @@ class AIEnsemble:
         Returns:
             LSTM predictions
         """
-        if self.lstm_model is None:
-            return np.full(len(history), 0.5)
+        if self.lstm_model is None and self._lstm_session is None:
+            return self._dummy_prediction(len(history))
         
         if len(history.shape) == 2:
             history = history.reshape(1, *history.shape)
         
+        if self._lstm_session is not None:
+            return self._run_session(self._lstm_session, history)
+        
+        if self._lstm_fn is not None:
+            return self._lstm_fn(tf.constant(history, dtype=tf.float32)).numpy()
+        
         return self.lstm_model.predict(history, batch_size=self.config.batch_size)
     
     def predict(
@@ -199,78 +374,143 @@ class AIEnsemble:
         Returns:
             EnsembleResult with predictions
         """
-        self.load_models()
+        # Run as a batch of one; already-batched inputs use their first sample
+        if spike_data is not None:
+            spike_data = np.asarray(spike_data)
+            if spike_data.ndim == 2:
+                spike_data = spike_data[np.newaxis]
+            spike_data = spike_data[:1]
+        if parameters is not None:
+            parameters = np.asarray(parameters)
+            if parameters.ndim == 1:
+                parameters = parameters[np.newaxis]
+            parameters = parameters[:1]
+        if history is not None:
+            history = np.asarray(history)
+            if history.ndim == 2:
+                history = history[np.newaxis]
+            history = history[:1]
         
-        predictions = []
-        weights = []
+        return self.predict_batch(spike_data, parameters, history)[0]
+    
+    def predict_batch(
+        self,
+        spike_data: Optional[np.ndarray] = None,  # [batch, time, electrodes]
+        parameters: Optional[np.ndarray] = None,  # [batch, 8]
+        history: Optional[np.ndarray] = None      # [batch, time_steps, features]
+    ) -> List[EnsembleResult]:
+        """
+        Make ensemble predictions for a batch of samples.
         
-        # CNN prediction
-        if spike_data is not None:
-            cnn_pred = self.predict_cnn(spike_data)[0]
-            predictions.append(cnn_pred)
-            weights.append(self.config.cnn_weight)
-        else:
-            cnn_pred = 0.0
+        Each model is called once with the whole batch and the results are
+        combined with array operations.
         
-        # XGBoost prediction
-        if parameters is not None:
-            xgb_pred = self.predict_xgboost(parameters)[0]
-            predictions.append(xgb_pred)
-            weights.append(self.config.xgb_weight)
-        else:
-            xgb_pred = 0.0
+        Args:
+            spike_data: Raw bioelectrical data for CNN
+            parameters: Parameter values for XGBoost
+            history: Time series history for LSTM
         
-        # LSTM prediction
-        if history is not None:
-            lstm_pred = self.predict_lstm(history)[0]
-            predictions.append(lstm_pred)
-            weights.append(self.config.lstm_weight)
-        else:
-            lstm_pred = 0.0
+        Returns:
+            List of EnsembleResult, one per sample. With no inputs at all, a
+            single neutral result is returned.
+        
+        Raises:
+            ValueError: If the inputs have different batch sizes
+        """
+        self.load_models()
+        
+        inputs = [x for x in (spike_data, parameters, history) if x is not None]
+        sizes = {len(x) for x in inputs}
+        if len(sizes) > 1:
+            raise ValueError(f"Inputs have different batch sizes: {sorted(sizes)}")
+        n = sizes.pop() if sizes else 1
+        
+        jobs = [
+            (self.predict_cnn, spike_data, self.config.cnn_weight,
+             self.cnn_model is not None or self._cnn_session is not None),
+            (self.predict_xgboost, parameters, self.config.xgb_weight,
+             self.xgb_model is not None or self._xgb_session is not None),
+            (self.predict_lstm, history, self.config.lstm_weight,
+             self.lstm_model is not None or self._lstm_session is not None),
+        ]
+        
+        # Run the models concurrently when more than one loaded model has
+        # input; dummy predictions for missing models are cheap and run inline
+        concurrent = sum(x is not None and loaded for _, x, _, loaded in jobs) > 1
+        outputs = []
+        for fn, x, _, loaded in jobs:
+            if x is None:
+                outputs.append(None)
+            elif concurrent and loaded:
+                outputs.append(_model_pool().submit(fn, x))
+            else:
+                outputs.append(fn(x))
+        outputs = [out.result() if isinstance(out, Future) else out for out in outputs]
+        
+        # One row per model; rows of models without input stay zero and get
+        # zero weight, so the combine is a single dot product
+        preds = np.zeros((3, n))
+        w = np.zeros(3)
+        active = np.zeros(3, dtype=bool)
+        for k, ((_, _, weight, _), out) in enumerate(zip(jobs, outputs)):
+            if out is not None:
+                preds[k] = np.asarray(out, dtype=np.float64).reshape(n)
+                w[k] = weight
+                active[k] = True
+        cnn_pred, xgb_pred, lstm_pred = preds
+        n_active = int(active.sum())
         
         # Weighted ensemble
-        if predictions:
-            total_weight = sum(weights)
+        if n_active:
+            total_weight = w.sum()
             if total_weight > 0:
-                ensemble_pred = sum(p * w for p, w in zip(predictions, weights)) / total_weight
+                ensemble_pred = w @ preds / total_weight
             else:
-                ensemble_pred = 0.5
+                ensemble_pred = np.full(n, 0.5)
             
             # Calculate confidence (agreement between models)
-            if len(predictions) > 1:
-                confidence = 1.0 - np.std(predictions)
+            if n_active == 3:
+                confidence = 1.0 - preds.std(axis=0)
+            elif n_active > 1:
+                confidence = 1.0 - preds[active].std(axis=0)
             else:
-                confidence = 0.7
+                confidence = np.full(n, 0.7)
         else:
-            ensemble_pred = 0.5
-            confidence = 0.0
-        
-        # Feature importance (simplified)
-        feature_importance = {
-            'cnn': self.config.cnn_weight,
-            'xgboost': self.config.xgb_weight,
-            'lstm': self.config.lstm_weight,
-        }
-        
-        # Generate warnings
-        warnings = []
-        if confidence < 0.5:
-            warnings.append("Low model agreement - prediction may be unreliable")
-        
-        if ensemble_pred < 0.25:
-            warnings.append("Ensemble predicts EXCELLENT network state")
-        elif ensemble_pred > 0.8:
-            warnings.append("Ensemble predicts COLLAPSE risk")
-        
-        return EnsembleResult(
-            mnis_prediction=float(ensemble_pred),
-            cnn_prediction=float(cnn_pred),
-            xgb_prediction=float(xgb_pred),
-            lstm_prediction=float(lstm_pred),
-            confidence=float(confidence),
-            feature_importance=feature_importance,
-            warnings=warnings
-        )
+            ensemble_pred = np.full(n, 0.5)
+            confidence = np.zeros(n)
+        
+        results = []
+        for ens, cnn, xgb_p, lstm, conf in zip(ensemble_pred.tolist(), cnn_pred.tolist(),
+                                               xgb_pred.tolist(), lstm_pred.tolist(),
+                                               confidence.tolist()):
+            # Feature importance (simplified)
+            feature_importance = {
+                'cnn': self.config.cnn_weight,
+                'xgboost': self.config.xgb_weight,
+                'lstm': self.config.lstm_weight,
+            }
+            
+            # Generate warnings
+            warnings = []
+            if conf < 0.5:
+                warnings.append("Low model agreement - prediction may be unreliable")
+            
+            if ens < 0.25:
+                warnings.append("Ensemble predicts EXCELLENT network state")
+            elif ens > 0.8:
+                warnings.append("Ensemble predicts COLLAPSE risk")
+            
+            results.append(EnsembleResult(
+                mnis_prediction=ens,
+                cnn_prediction=cnn,
+                xgb_prediction=xgb_p,
+                lstm_prediction=lstm,
+                confidence=conf,
+                feature_importance=feature_importance,
+                warnings=warnings
+            ))
+        
+        return results
     
     def save(self, path: Union[str, Path]):
         """Save ensemble configuration."""
@@ -15,8 +15,13 @@ Reference range: 1.00 - 2.20 (mean intact sites: 1.84)
 import numpy as np
 from typing import Dict, Optional, Union, Tuple, List
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import fsum, log
 import warnings
 
+from fungi_mycel._numba import NUMBA_AVAILABLE, njit, prange
+
 try:
     from skbio.diversity import alpha_diversity
     from skbio import read as read_sequence
@@ -26,6 +31,77 @@ except ImportError:
     warnings.warn("scikit-bio not available - using simplified diversity calculations")
 
 
+# Lists up to this length skip NumPy in calculate_shannon
+_SCALAR_SHANNON_MAX = 32
+
+# Counts up to this value use the precomputed log table in Shannon sums
+_LOG_TABLE_SIZE = 65536
+
+
+@lru_cache(maxsize=1)
+def _log_table() -> np.ndarray:
+    """ln(c) for c = 1.._LOG_TABLE_SIZE, built on first use (512 KiB)."""
+    table = np.log(np.arange(1, _LOG_TABLE_SIZE + 1, dtype=np.float64))
+    table.flags.writeable = False
+    return table
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _shannon_kernel(counts, shannons, richness):
+    """
+    Fill H' = ln(N) - Σ c·ln(c) / N and the OTU richness for every row of
+    counts, in parallel over rows.
+    """
+    for s in prange(counts.shape[0]):
+        total = 0.0
+        c_log_c = 0.0
+        n_present = 0
+        for j in range(counts.shape[1]):
+            c = counts[s, j]
+            if c > 0:
+                total += c
+                c_log_c += c * np.log(c)
+                n_present += 1
+        richness[s] = n_present
+        # One OTU has H' = 0 exactly; rounding can leave a ±1 ulp residue
+        if n_present > 1:
+            shannons[s] = max(0.0, np.log(total) - c_log_c / total)
+        else:
+            shannons[s] = 0.0
+
+
+def _rarefy_one(
+    sample: np.ndarray,
+    depth: int,
+    seed: np.random.SeedSequence
+) -> np.ndarray:
+    """Rarefy one sample that holds more than depth reads."""
+    # Subsampling reads without replacement is a multivariate
+    # hypergeometric draw, taken directly from the OTU counts
+    rng = np.random.default_rng(seed)
+    return rng.multivariate_hypergeometric(sample, depth).astype(sample.dtype, copy=False)
+
+
+def _as_count_matrix(
+    samples: Union[List[List[int]], np.ndarray]
+) -> Union[List[List[int]], np.ndarray]:
+    """
+    Convert samples to an (n_samples, n_otus) array, int32 for integer counts.
+    
+    Ragged or empty input is returned unchanged.
+    """
+    try:
+        counts = np.asarray(samples)
+    except ValueError:
+        return samples
+    if counts.ndim != 2 or counts.dtype.kind not in 'iuf':
+        return samples
+    
+    if counts.dtype.kind in 'iu' and (counts.size == 0 or counts.max() < 2**31):
+        return counts.astype(np.int32, copy=False)
+    return counts
+
+
 @dataclass
 class BiodiversityResult:
     """Container for biodiversity calculations."""
@@ -41,6 +117,7 @@ class BiodiversityResult:
     n_samples_bulk: int
     sequencing_depth: int
     warnings: List[str] = None
+    rarefaction_seed: Optional[int] = None  # seed used for rarefaction, if any
 
 
 class ABICalculator:
@@ -53,14 +130,16 @@ class ABICalculator:
     metabarcoding of matched rhizosphere and bulk soil samples.
     """
     
-    def __init__(self, sequencing_depth: int = 50000):
+    def __init__(self, sequencing_depth: int = 50000, seed: Optional[int] = None):
         """
         Initialize ABI calculator.
         
         Args:
             sequencing_depth: Target sequencing depth for rarefaction
+            seed: Default random seed for rarefaction
         """
         self.sequencing_depth = sequencing_depth
+        self.seed = seed
     
     def calculate_shannon(
         self,
@@ -72,18 +151,51 @@ class ABICalculator:
         H' = -Σ p_i · ln(p_i)
         where p_i = proportion of species i
         """
-        total = sum(abundance_counts)
-        if total == 0:
+        if not isinstance(abundance_counts, np.ndarray) and len(abundance_counts) <= _SCALAR_SHANNON_MAX:
+            # Short lists: plain math.log/fsum beats the array round trip
+            total = fsum(abundance_counts)
+            if total <= 0:
+                return 0.0
+            inv_total = 1.0 / total
+            return -fsum(c * inv_total * log(c * inv_total) for c in abundance_counts if c > 0)
+        
+        counts = np.asarray(abundance_counts)
+        counts = counts[counts > 0]
+        if counts.size <= 1:
             return 0.0
         
-        proportions = [c / total for c in abundance_counts if c > 0]
+        total = counts.sum()
+        if counts.dtype.kind in 'iu' and counts.max() <= _LOG_TABLE_SIZE:
+            # For integer counts H' = ln(N) - Σ c·ln(c) / N, with ln(c)
+            # gathered from the table instead of computed; clamped because
+            # the difference can round to just below zero
+            return max(0.0, float(np.log(total) - (counts * _log_table()[counts - 1]).sum() / total))
         
-        if not proportions:
+        proportions = counts / total
+        return float(-(proportions * np.log(proportions)).sum())
+    
+    def calculate_shannon_from_reads(
+        self,
+        reads: Union[List, np.ndarray]
+    ) -> float:
+        """
+        Calculate Shannon diversity index from per-read OTU assignments.
+        
+        Args:
+            reads: One OTU label (int or str) per sequencing read
+        
+        Returns:
+            Shannon index of the label frequencies
+        """
+        reads = np.asarray(reads)
+        if reads.size == 0:
             return 0.0
         
-        shannon = -sum(p * np.log(p) for p in proportions)
-        return shannon
-    
+        # Sort-based counting needs no histogram over the label space,
+        # so sparse or string labels cost the same as dense ones
+        _, counts = np.unique(reads, return_counts=True)
+        return self.calculate_shannon(counts)
+        
     def calculate_evenness(
         self,
         shannon: float,
@@ -92,103 +204,175 @@ class ABICalculator:
         """Calculate Pielou's evenness (J' = H' / ln(S))."""
         if n_species <= 1:
             return 1.0
-        return shannon / np.log(n_species)
+        if n_species <= _LOG_TABLE_SIZE and n_species == int(n_species):
+            return shannon / _log_table()[int(n_species) - 1]
+        # Mean richness across samples need not be an integer
+        return shannon / log(n_species)
+    
+    def _resolve_seed(self, seed: Optional[int]) -> int:
+        """Return seed, falling back to self.seed and then the global random state."""
+        if seed is None:
+            seed = self.seed
+        if seed is None:
+            seed = int(np.random.randint(2**31))
+        return seed
     
     def rarefy(
         self,
-        counts: List[List[int]],
-        depth: Optional[int] = None
-    ) -> List[List[int]]:
+        counts: Union[List[List[int]], np.ndarray],
+        depth: Optional[int] = None,
+        seed: Optional[int] = None,
+        n_jobs: int = 1
+    ) -> Union[List[List[int]], np.ndarray]:
         """
         Perform rarefaction to standardize sequencing depth.
         
         Args:
-            counts: List of samples, each with list of OTU abundances
+            counts: List of samples, each with list of OTU abundances, or an
+                    (n_samples, n_otus) array
             depth: Target depth (default: self.sequencing_depth)
+            seed: Random seed (default: self.seed, or if that is None one
+                  drawn from NumPy's global random state, so np.random.seed()
+                  keeps results reproducible)
+            n_jobs: Number of worker threads (-1 for one per CPU). Each
+                    sample gets its own seed, so results do not depend on
+                    n_jobs.
         
         Returns:
-            Rarefied counts
+            Rarefied counts, as an array of the same dtype for array input
+            and as lists otherwise
         """
         if depth is None:
             depth = self.sequencing_depth
+        seed = self._resolve_seed(seed)
+        seeds = np.random.SeedSequence(seed).spawn(len(counts))
         
-        rarefied = []
-        for sample in counts:
-            total = sum(sample)
-            if total < depth:
-                # Sample too shallow - use original
-                rarefied.append(sample)
-                continue
-            
-            # Simple rarefaction by random subsampling
-            # In production, use skbio's rarefaction
-            indices = []
-            for i, count in enumerate(sample):
-                indices.extend([i] * count)
-            
-            if len(indices) > depth:
-                subsample = np.random.choice(indices, size=depth, replace=False)
-                new_counts = [0] * len(sample)
-                for idx in subsample:
-                    new_counts[idx] += 1
-                rarefied.append(new_counts)
-            else:
-                rarefied.append(sample)
+        is_matrix = isinstance(counts, np.ndarray)
+        samples = counts if is_matrix else [np.asarray(sample) for sample in counts]
+        
+        # Only samples deeper than the target need subsampling; the rest are
+        # kept as they are
+        totals = counts.sum(axis=1) if is_matrix else np.array([s.sum() for s in samples])
+        deep = np.flatnonzero(totals > depth)
         
+        if n_jobs == 1 or len(deep) < 2:
+            subsampled = [_rarefy_one(samples[i], depth, seeds[i]) for i in deep]
+        else:
+            max_workers = None if n_jobs == -1 else n_jobs
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                subsampled = list(pool.map(
+                    _rarefy_one,
+                    [samples[i] for i in deep],
+                    [depth] * len(deep),
+                    [seeds[i] for i in deep]
+                ))
+        
+        if is_matrix:
+            rarefied = counts.copy()
+            if len(deep):
+                rarefied[deep] = subsampled
+            return rarefied
+        
+        rarefied = [list(sample) for sample in counts]
+        for i, sample in zip(deep, subsampled):
+            rarefied[i] = sample.tolist()
         return rarefied
     
+    def _sample_diversity(
+        self,
+        samples: List[List[int]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Shannon index and richness of every sample with at least one OTU.
+        
+        Samples of equal length are processed together as one
+        (n_samples, n_otus) array; ragged input falls back to one
+        calculate_shannon call per sample.
+        """
+        try:
+            counts = np.asarray(samples)
+        except ValueError:
+            counts = None
+        
+        if counts is None or counts.ndim != 2 or counts.dtype.kind not in 'iuf':
+            non_empty = [s for s in samples if any(c > 0 for c in s)]
+            shannons = np.array([self.calculate_shannon(s) for s in non_empty])
+            richness = np.array([sum(1 for c in s if c > 0) for s in non_empty])
+            return shannons, richness
+        
+        if NUMBA_AVAILABLE:
+            shannons = np.empty(len(counts))
+            richness = np.empty(len(counts), dtype=np.int64)
+            _shannon_kernel(counts, shannons, richness)
+            non_empty = richness > 0
+            return shannons[non_empty], richness[non_empty]
+        
+        present = counts > 0
+        richness = present.sum(axis=1)
+        non_empty = richness > 0
+        counts, present, richness = counts[non_empty], present[non_empty], richness[non_empty]
+        
+        totals = counts.sum(axis=1)
+        if counts.dtype.kind in 'iu' and counts.max(initial=0) <= _LOG_TABLE_SIZE:
+            # Integer counts: H' = ln(N) - Σ c·ln(c) / N via the log table;
+            # absent OTUs gather table[-1] but are multiplied by c = 0
+            c_log_c = (counts * _log_table()[counts - 1]).sum(axis=1)
+            shannons = np.maximum(0.0, np.log(totals) - c_log_c / totals)
+            # Single-OTU samples have H' = 0 exactly, not a rounding residue
+            shannons[richness == 1] = 0.0
+            return shannons, richness
+        
+        proportions = counts / totals[:, np.newaxis]
+        # Absent OTUs have p = 0 and contribute 0 * log(1) = 0
+        log_p = np.log(np.where(present, proportions, 1.0))
+        shannons = -(proportions * log_p).sum(axis=1)
+        return shannons, richness
+    
     def compute_from_counts(
         self,
-        rhizosphere_counts: List[List[int]],  # Multiple samples
-        bulk_counts: List[List[int]],  # Multiple samples
+        rhizosphere_counts: Union[List[List[int]], np.ndarray],  # Multiple samples
+        bulk_counts: Union[List[List[int]], np.ndarray],  # Multiple samples
         otu_names: Optional[List[str]] = None,
         rarefy: bool = True
     ) -> BiodiversityResult:
         """
         Compute ABI from OTU/ASV abundance counts.
         
+        Count lists are converted once to (n_samples, n_otus) int32 arrays;
+        arrays can also be passed directly.
+        
         Args:
-            rhizosphere_counts: List of samples from rhizosphere
-            bulk_counts: List of samples from bulk soil
+            rhizosphere_counts: Samples from rhizosphere
+            bulk_counts: Samples from bulk soil
             otu_names: Names of OTUs/ASVs
             rarefy: Whether to rarefy to standard depth
         
         Returns:
             BiodiversityResult object
         """
+        rhizosphere_counts = _as_count_matrix(rhizosphere_counts)
+        bulk_counts = _as_count_matrix(bulk_counts)
+        
+        seed = None
         if rarefy:
             # Combine all samples for rarefaction
-            all_counts = rhizosphere_counts + bulk_counts
-            rarefied_all = self.rarefy(all_counts)
+            seed = self._resolve_seed(None)
+            if (isinstance(rhizosphere_counts, np.ndarray) and isinstance(bulk_counts, np.ndarray)
+                    and rhizosphere_counts.shape[1] == bulk_counts.shape[1]):
+                all_counts = np.concatenate([rhizosphere_counts, bulk_counts])
+            else:
+                all_counts = list(rhizosphere_counts) + list(bulk_counts)
+            rarefied_all = self.rarefy(all_counts, seed=seed)
             n_rhizo = len(rhizosphere_counts)
             rhizosphere_counts = rarefied_all[:n_rhizo]
             bulk_counts = rarefied_all[n_rhizo:]
         
         # Calculate diversity for each sample
-        rhizo_shannons = []
-        rhizo_richness = []
-        bulk_shannons = []
-        bulk_richness = []
-        
-        for sample in rhizosphere_counts:
-            # Remove zeros
-            non_zero = [c for c in sample if c > 0]
-            if non_zero:
-                shannon = self.calculate_shannon(non_zero)
-                richness = len(non_zero)
-                rhizo_shannons.append(shannon)
-                rhizo_richness.append(richness)
-        
-        for sample in bulk_counts:
-            non_zero = [c for c in sample if c > 0]
-            if non_zero:
-                shannon = self.calculate_shannon(non_zero)
-                richness = len(non_zero)
-                bulk_shannons.append(shannon)
-                bulk_richness.append(richness)
+        rhizo_shannons, rhizo_richness = self._sample_diversity(rhizosphere_counts)
+        bulk_shannons, bulk_richness = self._sample_diversity(bulk_counts)
         
         # Average across samples
-        if rhizo_shannons:
+        if rhizo_shannons.size:
             mean_rhizo_shannon = np.mean(rhizo_shannons)
             mean_rhizo_richness = np.mean(rhizo_richness)
             rhizo_evenness = self.calculate_evenness(
@@ -199,7 +383,7 @@ class ABICalculator:
             mean_rhizo_richness = 0
             rhizo_evenness = 0
         
-        if bulk_shannons:
+        if bulk_shannons.size:
             mean_bulk_shannon = np.mean(bulk_shannons)
             mean_bulk_richness = np.mean(bulk_richness)
             bulk_evenness = self.calculate_evenness(
@@ -242,7 +426,8 @@ class ABICalculator:
             n_samples_rhizosphere=len(rhizosphere_counts),
             n_samples_bulk=len(bulk_counts),
             sequencing_depth=self.sequencing_depth,
-            warnings=warnings
+            warnings=warnings,
+            rarefaction_seed=seed
         )
     
     def estimate_from_soil_parameters(
@@ -275,7 +460,7 @@ class ABICalculator:
         
         estimated = base_abi * om_factor * ph_factor * n_factor * biomass_factor
         
-        return min(2.5, max(1.0, estimated))
+        return 2.5 if estimated > 2.5 else (estimated if estimated > 1.0 else 1.0)
     
     @staticmethod
     def generate_test_data(
@@ -290,26 +475,20 @@ class ABICalculator:
         """
         np.random.seed(42)
         
-        rhizosphere = []
-        bulk = []
-        
-        # Rhizosphere: more OTUs, more even distribution
-        for _ in range(n_rhizo):
-            # Log-normal distribution
-            abundances = np.random.lognormal(mean=2, sigma=1, size=n_otus)
-            # Add zeros (some OTUs absent)
-            abundances[np.random.random(n_otus) < 0.3] = 0
-            abundances = (abundances / abundances.sum() * 50000).astype(int)
-            rhizosphere.append(abundances.tolist())
+        # Rhizosphere: more OTUs, more even distribution (log-normal,
+        # ~30% of OTUs absent)
+        rhizosphere = np.random.lognormal(mean=2, sigma=1, size=(n_rhizo, n_otus))
+        rhizosphere[np.random.random((n_rhizo, n_otus)) < 0.3] = 0
+        rhizosphere = (
+            rhizosphere / rhizosphere.sum(axis=1, keepdims=True) * 50000
+        ).astype(np.int32)
         
         # Bulk soil: fewer OTUs, more skewed
-        for _ in range(n_bulk):
-            abundances = np.random.lognormal(mean=1.5, sigma=1.5, size=n_otus)
-            abundances[np.random.random(n_otus) < 0.5] = 0
-            abundances = (abundances / abundances.sum() * 30000).astype(int)
-            bulk.append(abundances.tolist())
+        bulk = np.random.lognormal(mean=1.5, sigma=1.5, size=(n_bulk, n_otus))
+        bulk[np.random.random((n_bulk, n_otus)) < 0.5] = 0
+        bulk = (bulk / bulk.sum(axis=1, keepdims=True) * 30000).astype(np.int32)
         
-        return rhizosphere, bulk
+        return rhizosphere.tolist(), bulk.tolist()
 
 
 # Convenience function
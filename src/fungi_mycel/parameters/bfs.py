@@ -17,7 +17,144 @@ Reference range: 0.28 - 0.85
 import numpy as np
 from typing import Dict, Optional, Union, Tuple, List
 from dataclasses import dataclass
-from scipy import stats
+
+from fungi_mycel._numba import NUMBA_AVAILABLE, njit
+
+# Number of most recent points used for the AR1 estimate
+_AR1_WINDOW = 10
+
+# Residual sums of squares at or below this fraction of sum(values**2) are
+# rounding noise (e.g. a constant or exactly linear series) and give AR1 = 0
+_AR1_VAR_RTOL = 1e-12
+
+
+def _slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Least-squares slope of y against x (0.0 if x is constant)."""
+    x_centered = x - x.mean()
+    sxx = x_centered @ x_centered
+    if sxx == 0:
+        return 0.0
+    return float(x_centered @ (y - y.mean()) / sxx)
+
+
+def _skew(a: np.ndarray) -> float:
+    """Biased sample skewness m3 / m2**1.5 (0.0 for constant input)."""
+    d = a - a.mean()
+    d2 = d * d
+    m2 = d2.mean()
+    if m2 <= 0:
+        return 0.0
+    return float((d2 * d).mean() / m2**1.5)
+
+
+@njit(cache=True)
+def _detrended_ar1(values):
+    """Lag-1 autocorrelation of values after removing a least-squares line."""
+    n = values.shape[0]
+    if n < 3:
+        return 0.0
+    
+    # Linear fit against x = 0..n-1
+    x_mean = (n - 1) / 2.0
+    y_mean = 0.0
+    ss = 0.0
+    for i in range(n):
+        y_mean += values[i]
+        ss += values[i] * values[i]
+    y_mean /= n
+    sxx = 0.0
+    sxy = 0.0
+    for i in range(n):
+        sxx += (i - x_mean) * (i - x_mean)
+        sxy += (i - x_mean) * (values[i] - y_mean)
+    slope = sxy / sxx
+    intercept = y_mean - slope * x_mean
+    
+    # Pearson correlation between consecutive residuals
+    m = n - 1
+    a_mean = 0.0
+    b_mean = 0.0
+    for i in range(m):
+        a_mean += values[i] - (intercept + slope * i)
+        b_mean += values[i + 1] - (intercept + slope * (i + 1))
+    a_mean /= m
+    b_mean /= m
+    saa = 0.0
+    sbb = 0.0
+    sab = 0.0
+    for i in range(m):
+        a = values[i] - (intercept + slope * i) - a_mean
+        b = values[i + 1] - (intercept + slope * (i + 1)) - b_mean
+        saa += a * a
+        sbb += b * b
+        sab += a * b
+    # Written so NaN sums also fail: min/max would clamp a NaN r to 1.0
+    tol = _AR1_VAR_RTOL * ss
+    if not (saa > tol and sbb > tol):
+        return 0.0
+    return max(-1.0, min(1.0, sab / np.sqrt(saa * sbb)))
+
+
+@njit(cache=True)
+def _bfs_stats(values, times):
+    """
+    Mean, population std, AR1 of the last _AR1_WINDOW points and the
+    per-year trend slope of values over times (in days).
+    """
+    n = values.shape[0]
+    v_mean = 0.0
+    t_mean = 0.0
+    for i in range(n):
+        v_mean += values[i]
+        t_mean += times[i]
+    v_mean /= n
+    t_mean /= n
+    
+    svv = 0.0
+    stt = 0.0
+    stv = 0.0
+    for i in range(n):
+        dv = values[i] - v_mean
+        dt = times[i] - t_mean
+        svv += dv * dv
+        stt += dt * dt
+        stv += dt * dv
+    
+    slope = stv / stt * 365.0 if stt > 0.0 else 0.0
+    ar1 = _detrended_ar1(values[max(0, n - _AR1_WINDOW):])
+    return v_mean, np.sqrt(svv / n), ar1, slope
+
+
+@njit(cache=True)
+def _window_stats(values, w):
+    """
+    Population variance, detrended AR1 and skewness of the first and the
+    last w values, as (var_early, var_late, ar1_early, ar1_late,
+    skew_early, skew_late).
+    """
+    n = values.shape[0]
+    var = np.zeros(2)
+    ar1 = np.zeros(2)
+    skew = np.zeros(2)
+    for k in range(2):
+        start = 0 if k == 0 else n - w
+        mean = 0.0
+        for i in range(start, start + w):
+            mean += values[i]
+        mean /= w
+        m2 = 0.0
+        m3 = 0.0
+        for i in range(start, start + w):
+            d = values[i] - mean
+            m2 += d * d
+            m3 += d * d * d
+        m2 /= w
+        m3 /= w
+        var[k] = m2
+        if m2 > 0.0:
+            skew[k] = m3 / m2**1.5
+        ar1[k] = _detrended_ar1(values[start:start + w])
+    return var[0], var[1], ar1[0], ar1[1], skew[0], skew[1]
 
 
 @dataclass
@@ -31,6 +168,42 @@ class TimeSeriesPoint:
     confidence: float  # measurement confidence
 
 
+@dataclass
+class TimeSeries:
+    """
+    MNIS time series stored column-wise, one array per TimeSeriesPoint field.
+    
+    Accumulating measurements into arrays avoids converting a list of
+    TimeSeriesPoint objects on every BFS computation.
+    """
+    
+    timestamps: np.ndarray  # days since start
+    mnis_values: np.ndarray  # MNIS scores
+    confidences: Optional[np.ndarray] = None
+    site_ids: Optional[np.ndarray] = None
+    seasons: Optional[np.ndarray] = None
+    
+    def __post_init__(self):
+        self.timestamps = np.asarray(self.timestamps, dtype=np.float64)
+        self.mnis_values = np.asarray(self.mnis_values, dtype=np.float64)
+        if self.confidences is not None:
+            self.confidences = np.asarray(self.confidences, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self.mnis_values)
+    
+    @classmethod
+    def from_points(cls, points: List[TimeSeriesPoint]) -> 'TimeSeries':
+        """Build a TimeSeries from a list of TimeSeriesPoint."""
+        return cls(
+            timestamps=np.fromiter((p.timestamp for p in points), dtype=np.float64, count=len(points)),
+            mnis_values=np.fromiter((p.mnis_value for p in points), dtype=np.float64, count=len(points)),
+            confidences=np.fromiter((p.confidence for p in points), dtype=np.float64, count=len(points)),
+            site_ids=np.array([p.site_id for p in points], dtype=object),
+            seasons=np.array([p.season for p in points], dtype=object),
+        )
+
+
 @dataclass
 class BFSResult:
     """Container for BFS calculation results."""
@@ -98,61 +271,101 @@ class BFSCalculator:
         if len(values) < 3:
             return 0.0
         
-        # Remove trend
-        x = np.arange(len(values))
-        z = np.polyfit(x, values, 1)
-        trend = np.polyval(z, x)
-        detrended = values - trend
+        if NUMBA_AVAILABLE:
+            return _detrended_ar1(np.asarray(values, dtype=np.float64))
+        
+        # Remove trend with the closed-form least-squares line against
+        # x = 0..n-1, whose sums are known in advance
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        x = np.arange(n)
+        sx = n * (n - 1) / 2
+        sxx = (n - 1) * n * (2 * n - 1) / 6
+        sy = values.sum()
+        slope = (n * (x @ values) - sx * sy) / (n * sxx - sx * sx)
+        intercept = (sy - slope * sx) / n
+        detrended = values - (slope * x + intercept)
         
-        # Compute AR1
-        ar1 = np.corrcoef(detrended[:-1], detrended[1:])[0, 1]
-        return max(-1.0, min(1.0, ar1)) if not np.isnan(ar1) else 0.0
+        # Pearson correlation between consecutive residuals
+        a = detrended[:-1] - detrended[:-1].mean()
+        b = detrended[1:] - detrended[1:].mean()
+        saa = a @ a
+        sbb = b @ b
+        tol = _AR1_VAR_RTOL * (values @ values)
+        if not (saa > tol and sbb > tol):
+            return 0.0
+        ar1 = (a @ b) / np.sqrt(saa * sbb)
+        return 1.0 if ar1 > 1.0 else (ar1 if ar1 > -1.0 else -1.0)
     
     def compute_trend(self, values: List[float], times: List[float]) -> float:
         """Compute linear trend (slope) over time."""
         if len(values) < 2:
             return 0.0
         
+        if NUMBA_AVAILABLE:
+            return _bfs_stats(np.asarray(values, dtype=np.float64),
+                              np.asarray(times, dtype=np.float64))[3]
+        
         # Convert times to years for interpretable slope
-        times_years = np.array(times) / 365
+        times_years = np.asarray(times, dtype=np.float64) / 365
         
-        slope, _, _, _, _ = stats.linregress(times_years, values)
-        return slope
+        return _slope(times_years, np.asarray(values, dtype=np.float64))
     
     def compute_from_timeseries(
         self,
-        mnis_values: List[float],
-        timestamps: List[float],
+        mnis_values: Union[List[float], np.ndarray, TimeSeries],
+        timestamps: Optional[Union[List[float], np.ndarray]] = None,
         site_id: Optional[str] = None
     ) -> BFSResult:
         """
         Compute BFS from MNIS time series.
         
         Args:
-            mnis_values: List of MNIS scores
-            timestamps: List of timestamps (days since start)
+            mnis_values: MNIS scores, or a TimeSeries (then timestamps are
+                         taken from it)
+            timestamps: Timestamps (days since start), required unless
+                        mnis_values is a TimeSeries
             site_id: Site identifier
         
         Returns:
             BFSResult object
+        
+        Raises:
+            ValueError: If timestamps is missing for a plain sequence of scores
         """
+        if isinstance(mnis_values, TimeSeries):
+            timestamps = mnis_values.timestamps
+            mnis_values = mnis_values.mnis_values
+        elif timestamps is None:
+            raise ValueError("timestamps are required unless mnis_values is a TimeSeries")
+        
+        # Work on contiguous float64 arrays from here on
+        mnis_values = np.asarray(mnis_values, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        
         if len(mnis_values) < 4:
             return BFSResult(
                 value=0.0,
                 cv=0.0,
-                mean_mnis=np.mean(mnis_values) if mnis_values else 0,
-                std_mnis=np.std(mnis_values) if mnis_values else 0,
+                mean_mnis=np.mean(mnis_values) if len(mnis_values) else 0,
+                std_mnis=np.std(mnis_values) if len(mnis_values) else 0,
                 n_points=len(mnis_values),
-                time_span_days=max(timestamps) - min(timestamps) if timestamps else 0,
+                time_span_days=timestamps.max() - timestamps.min() if len(timestamps) else 0,
                 trend_slope=0.0,
                 ar1_coefficient=0.0,
                 stability_class='INSUFFICIENT_DATA',
                 warnings=["Insufficient data for stability analysis"]
             )
         
-        # Calculate basic statistics
-        mean_mnis = np.mean(mnis_values)
-        std_mnis = np.std(mnis_values)
+        if NUMBA_AVAILABLE:
+            # Mean, std, AR1 and trend in one compiled pass
+            mean_mnis, std_mnis, ar1, trend = _bfs_stats(mnis_values, timestamps)
+        else:
+            mean_mnis = np.mean(mnis_values)
+            std_mnis = np.std(mnis_values)
+            trend = self.compute_trend(mnis_values, timestamps)
+            # AR1 over the most recent points only
+            ar1 = self.compute_ar1(mnis_values[-_AR1_WINDOW:])
         
         # Coefficient of variation (handle zero mean)
         if mean_mnis != 0:
@@ -162,21 +375,11 @@ class BFSCalculator:
             cv = 0
             bfs = 0
         
-        # Compute trend
-        trend = self.compute_trend(mnis_values, timestamps)
-        
-        # Compute AR1 for recent data (last 3 years or all if shorter)
-        if len(mnis_values) > 10:
-            # Use last 10 points for AR1
-            ar1 = self.compute_ar1(mnis_values[-10:])
-        else:
-            ar1 = self.compute_ar1(mnis_values)
-        
         # Classify stability
         stability_class = self.classify_stability(bfs, ar1, trend)
         
         # Calculate time span
-        time_span = max(timestamps) - min(timestamps)
+        time_span = timestamps.max() - timestamps.min()
         
         # Generate warnings
         warnings = []
@@ -197,7 +400,7 @@ class BFSCalculator:
             warnings.append("Time series shorter than 2 years - BFS may be unreliable")
         
         # Cap BFS at reasonable values
-        bfs = min(2.0, max(0.0, bfs))
+        bfs = 2.0 if bfs > 2.0 else (bfs if bfs > 0.0 else 0.0)
         
         return BFSResult(
             value=bfs,
@@ -230,24 +433,48 @@ class BFSCalculator:
         if len(mnis_values) < 2 * window_size:
             return {}
         
-        # Split into early and late periods
-        early = mnis_values[:window_size]
-        late = mnis_values[-window_size:]
+        values = np.asarray(mnis_values, dtype=np.float64)
         
-        # Variance ratio
-        var_early = np.var(early)
-        var_late = np.var(late)
-        variance_ratio = var_late / var_early if var_early > 0 else 1.0
+        if NUMBA_AVAILABLE:
+            # Both windows' statistics in one compiled pass
+            (var_early, var_late, ar1_early, ar1_late,
+             skew_early, skew_late) = _window_stats(values, window_size)
+        else:
+            # Early and late periods as the rows of one (2, window_size)
+            # array, so each statistic is a single vectorized reduction
+            windows = np.stack((values[:window_size], values[-window_size:]))
+            
+            # Variance and skewness from the central moments
+            d = windows - windows.mean(axis=1, keepdims=True)
+            m2 = (d * d).mean(axis=1)
+            m3 = (d * d * d).mean(axis=1)
+            var_early, var_late = m2
+            skew = np.divide(m3, m2**1.5, out=np.zeros(2), where=m2 > 0)
+            skew_early, skew_late = skew
+            
+            # AR1 of each row after removing its least-squares line
+            if window_size < 3:
+                ar1_early = ar1_late = 0.0
+            else:
+                x = np.arange(window_size)
+                sx = window_size * (window_size - 1) / 2
+                sxx = (window_size - 1) * window_size * (2 * window_size - 1) / 6
+                sy = windows.sum(axis=1)
+                slope = (window_size * (windows @ x) - sx * sy) / (window_size * sxx - sx * sx)
+                intercept = (sy - slope * sx) / window_size
+                detrended = windows - (slope[:, None] * x + intercept[:, None])
+                a = detrended[:, :-1] - detrended[:, :-1].mean(axis=1, keepdims=True)
+                b = detrended[:, 1:] - detrended[:, 1:].mean(axis=1, keepdims=True)
+                saa = (a * a).sum(axis=1)
+                sbb = (b * b).sum(axis=1)
+                tol = _AR1_VAR_RTOL * (windows * windows).sum(axis=1)
+                ar1 = np.divide((a * b).sum(axis=1), np.sqrt(saa * sbb), out=np.zeros(2),
+                                where=(saa > tol) & (sbb > tol))
+                ar1_early, ar1_late = np.clip(ar1, -1.0, 1.0)
         
-        # Autocorrelation ratio
-        ar1_early = self.compute_ar1(early)
-        ar1_late = self.compute_ar1(late)
+        variance_ratio = var_late / var_early if var_early > 0 else 1.0
         ar1_ratio = ar1_late / ar1_early if ar1_early != 0 else 1.0
         
-        # Skewness
-        skew_early = stats.skew(early)
-        skew_late = stats.skew(late)
-        
         return {
             'variance_ratio': variance_ratio,
             'ar1_ratio': ar1_ratio,
@@ -56,6 +56,11 @@ class EACalculator:
         t_stress = duration of stress exposure
     """
     
+    # Temperature factors for 0-50 °C in 0.5 °C steps (lab protocol settings)
+    _TEMP_STEP = 0.5
+    _TEMP_TABLE = np.exp(-0.5 * ((np.arange(0, 50.5, 0.5) - 15) / 10)**2)
+    _TEMP_TABLE.flags.writeable = False
+    
     def __init__(self):
         """Initialize E_a calculator."""
         pass
@@ -83,15 +88,18 @@ class EACalculator:
             return 0.5  # default
         
         # Normalize rates
-        rates = np.array(recovery_rates)
-        times = np.array(time_points)
+        rates = np.asarray(recovery_rates, dtype=np.float64)
+        times = np.asarray(time_points, dtype=np.float64)
         
         # Fit exponential decay: rate = rate0 * exp(-λ * t)
         log_rates = np.log(rates + 1e-6)
         
-        # Linear regression on log-transformed data
-        coeffs = np.polyfit(times, log_rates, 1)
-        lambda_coeff = -coeffs[0]
+        # Closed-form least-squares slope on log-transformed data
+        t_centered = times - times.mean()
+        sxx = t_centered @ t_centered
+        if sxx == 0:
+            return 0.5  # all measurements at one time point
+        lambda_coeff = -(t_centered @ (log_rates - log_rates.mean())) / sxx
         
         return max(0.01, min(2.0, lambda_coeff))
     
@@ -159,11 +167,15 @@ class EACalculator:
         # Apply temperature correction if needed
         if temperature != 15:
             # Optimal temperature ~15°C for most fungi
-            temp_factor = np.exp(-0.5 * ((temperature - 15) / 10)**2)
+            steps = float(temperature) / self._TEMP_STEP
+            if steps.is_integer() and 0 <= steps < self._TEMP_TABLE.size:
+                temp_factor = self._TEMP_TABLE[int(steps)]
+            else:
+                temp_factor = np.exp(-0.5 * ((temperature - 15) / 10)**2)
             e_a *= temp_factor
         
         # Clamp to valid range
-        e_a = min(1.0, max(0.0, e_a))
+        e_a = 1.0 if e_a > 1.0 else (e_a if e_a > 0.0 else 0.0)
         
         # Classify resilience
         resilience_class = self.classify_resilience(e_a)
@@ -224,7 +236,7 @@ class EACalculator:
         # Combined estimate
         estimated = base_resilience * disturbance_impact * drought_impact
         
-        return min(1.0, max(0.1, estimated))
+        return 1.0 if estimated > 1.0 else (estimated if estimated > 0.1 else 0.1)
 
 
 # Convenience function
@@ -12,9 +12,56 @@ Reference range: 0.48 - 2.3 μg·μL⁻¹·cm⁻²·day⁻¹
 """
 
 import numpy as np
-from typing import Dict, Optional, Union, Tuple
+from functools import lru_cache
+from math import exp
+from types import MappingProxyType
+from typing import Dict, Optional, Sequence, Union, Tuple
 from dataclasses import dataclass
 
+from fungi_mycel._numba import NUMBA_AVAILABLE, njit, vectorize
+
+
+# Default calibration factors per mineral substrate, shared by every
+# calculator
+_MINERAL_FACTORS = MappingProxyType({
+    'apatite': 1.0,
+    'feldspar': 0.85,
+    'biotite': 1.2,
+    'quartz': 0.3,
+    'calcite': 1.5,
+    'olivine': 1.1,
+})
+
+
+@njit(cache=True)
+def _ph_factor(ph):
+    """
+    pH correction: 1 over the optimal range 4.5-6.5, reduced outside it.
+    
+    Works on floats and arrays alike; np.fmax takes the 0.5 floor for a NaN
+    pH, as the builtin max did.
+    """
+    deviation = abs(ph - 5.5)
+    reduced = np.fmax(0.5, 1.0 - 0.2 * deviation)
+    # Select 1.0 inside the band arithmetically, so the compiled ufunc loop
+    # has no data-dependent branch; 1.0 - reduced is exact there
+    return reduced + (1.0 - reduced) * (deviation <= 1.0)
+
+
+if NUMBA_AVAILABLE:
+    @vectorize(['f8(f8,f8,f8,f8,f8,f8,f8)'], nopython=True, cache=True)
+    def _eta_nw_core(dissolution_rate, acid_production, contact_area,
+                     incubation_time, mineral_factor, temperature, ph):
+        """η_NW with mineral, temperature and pH corrections applied."""
+        base_value = dissolution_rate / (acid_production * contact_area * incubation_time)
+        return base_value * mineral_factor * exp(0.05 * (temperature - 15)) * _ph_factor(ph)
+else:
+    def _eta_nw_core(dissolution_rate, acid_production, contact_area,
+                     incubation_time, mineral_factor, temperature, ph):
+        """η_NW with mineral, temperature and pH corrections applied."""
+        base_value = dissolution_rate / (acid_production * contact_area * incubation_time)
+        return base_value * mineral_factor * np.exp(0.05 * (temperature - 15)) * _ph_factor(ph)
+
 
 @dataclass
 class EtaNWResult:
@@ -42,22 +89,11 @@ class EtaNWCalculator:
         T = incubation time (days)
     """
     
+    mineral_factors = _MINERAL_FACTORS
+    
     def __init__(self, calibration_file: Optional[str] = None):
         """Initialize η_NW calculator."""
         self.calibration_file = calibration_file
-        self._load_calibration()
-    
-    def _load_calibration(self):
-        """Load calibration data if available."""
-        # Default calibration factors
-        self.mineral_factors = {
-            'apatite': 1.0,
-            'feldspar': 0.85,
-            'biotite': 1.2,
-            'quartz': 0.3,
-            'calcite': 1.5,
-            'olivine': 1.1,
-        }
     
     def compute(
         self,
@@ -84,21 +120,10 @@ class EtaNWCalculator:
         Returns:
             EtaNWResult object with calculated value and metadata
         """
-        # Apply mineral-specific correction
-        mineral_factor = self.mineral_factors.get(mineral_type, 1.0)
-        
-        # Temperature correction (Arrhenius-type)
-        temp_factor = np.exp(0.05 * (temperature - 15))
-        
-        # pH correction (optimal range 4.5-6.5)
-        if 4.5 <= ph <= 6.5:
-            ph_factor = 1.0
-        else:
-            ph_factor = max(0.5, 1.0 - 0.2 * abs(ph - 5.5))
-        
-        # Calculate η_NW
-        base_value = dissolution_rate / (acid_production * contact_area * incubation_time)
-        eta_nw = base_value * mineral_factor * temp_factor * ph_factor
+        eta_nw = self._compute_value(
+            dissolution_rate, acid_production, contact_area,
+            incubation_time, mineral_type, temperature, ph
+        )
         
         # Calculate confidence based on measurement quality
         confidence = self._calculate_confidence(
@@ -127,6 +152,74 @@ class EtaNWCalculator:
             warnings=warnings
         )
     
+    def _compute_value(
+        self,
+        dissolution_rate: float,
+        acid_production: float,
+        contact_area: float,
+        incubation_time: float = 1.0,
+        mineral_type: str = 'apatite',
+        temperature: float = 15.0,
+        ph: float = 5.5,
+    ) -> float:
+        """η_NW value alone, without confidence, warnings or a result object."""
+        # Apply mineral-specific correction
+        mineral_factor = self.mineral_factors.get(mineral_type, 1.0)
+        
+        # Temperature correction (Arrhenius-type)
+        temp_factor = exp(0.05 * (temperature - 15))
+        
+        # pH correction (optimal range 4.5-6.5)
+        ph_factor = _ph_factor(ph)
+        
+        # Calculate η_NW
+        base_value = dissolution_rate / (acid_production * contact_area * incubation_time)
+        return float(base_value * mineral_factor * temp_factor * ph_factor)
+    
+    def compute_array(
+        self,
+        dissolution_rate: np.ndarray,
+        acid_production: np.ndarray,
+        contact_area: np.ndarray,
+        incubation_time: Union[float, np.ndarray] = 1.0,
+        mineral_type: Union[str, Sequence[str]] = 'apatite',
+        temperature: Union[float, np.ndarray] = 15.0,
+        ph: Union[float, np.ndarray] = 5.5,
+    ) -> np.ndarray:
+        """
+        Compute η_NW element-wise over arrays of measurements.
+        
+        Arguments broadcast against each other, e.g. one dissolution rate
+        per cell of a soil grid with a single temperature. Only the values
+        are returned; use compute() for confidence and warnings.
+        
+        Args:
+            dissolution_rate: Rates of mineral mass dissolution (μg/day)
+            acid_production: Volumetric exudate production rates (μL·cm⁻²·day⁻¹)
+            contact_area: Hyphal-mineral contact surface areas (cm²)
+            incubation_time: Durations of incubation (days)
+            mineral_type: Mineral substrate, one for all or one per element
+            temperature: Soil temperatures (°C)
+            ph: Soil pH values
+        
+        Returns:
+            Array of η_NW values
+        """
+        if isinstance(mineral_type, str):
+            mineral_factor = self.mineral_factors.get(mineral_type, 1.0)
+        else:
+            mineral_factor = np.array([self.mineral_factors.get(m, 1.0) for m in mineral_type])
+        
+        return _eta_nw_core(
+            np.asarray(dissolution_rate, dtype=np.float64),
+            np.asarray(acid_production, dtype=np.float64),
+            np.asarray(contact_area, dtype=np.float64),
+            np.asarray(incubation_time, dtype=np.float64),
+            np.asarray(mineral_factor, dtype=np.float64),
+            np.asarray(temperature, dtype=np.float64),
+            np.asarray(ph, dtype=np.float64),
+        )
+    
     def _calculate_confidence(
         self,
         dissolution_rate: float,
@@ -143,6 +236,7 @@ class EtaNWCalculator:
             return 0.7
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def estimate_from_soil_chemistry(
         phosphorus: float,        # μg P/g soil
         calcium: float,           # μg Ca/g soil
@@ -153,12 +247,14 @@ class EtaNWCalculator:
         Estimate η_NW from soil chemistry when direct measurements unavailable.
         
         This is a simplified estimation for preliminary assessments.
+        Results are memoized on the exact inputs, as Monte Carlo and
+        sensitivity sweeps revisit the same soil profiles.
         """
         # Empirical formula based on soil properties
         base_rate = 0.5
         
         # Phosphorus limitation increases weathering
-        p_factor = np.exp(-phosphorus / 100) if phosphorus > 0 else 2.0
+        p_factor = exp(-phosphorus / 100) if phosphorus > 0 else 2.0
         
         # Organic matter supports fungal activity
         om_factor = 1.0 + 0.1 * organic_matter
@@ -171,6 +267,10 @@ class EtaNWCalculator:
         return min(max(estimated, 0.3), 2.5)
 
 
+# Shared calculator for the convenience function; it holds no per-call state
+_DEFAULT_CALCULATOR = EtaNWCalculator()
+
+
 # Convenience function
 def compute_eta_nw(
     dissolution_rate: float,
@@ -190,11 +290,9 @@ def compute_eta_nw(
     Returns:
         η_NW value
     """
-    calculator = EtaNWCalculator()
-    result = calculator.compute(
+    return _DEFAULT_CALCULATOR._compute_value(
         dissolution_rate=dissolution_rate,
         acid_production=acid_production,
         contact_area=contact_area,
         **kwargs
     )
-    return result.value
@@ -14,9 +14,34 @@ Reference range: 0.78 - 0.96 normalized (0°-12° deviation)
 """
 
 import numpy as np
+from itertools import chain
+from math import hypot, pi
 from typing import Dict, Optional, Union, Tuple, List
 from dataclasses import dataclass
 
+from fungi_mycel._numba import NUMBA_AVAILABLE, vectorize
+
+# Radian/degree conversion factors
+_DEG = 180.0 / pi
+_RAD = pi / 180.0
+
+
+def _seg_angle(dx, dy, dz, gx, gy, gz):
+    """Angle in degrees between segment (dx, dy, dz) and direction g."""
+    # atan2(|d x g|, d . g) is accurate for small angles, where arccos of
+    # the normalized dot product loses precision, and needs no norms
+    cx = dy*gz - dz*gy
+    cy = dz*gx - dx*gz
+    cz = dx*gy - dy*gx
+    return np.arctan2(np.sqrt(cx*cx + cy*cy + cz*cz), dx*gx + dy*gy + dz*gz) * _DEG
+
+
+if NUMBA_AVAILABLE:
+    # Compiled ufunc; the plain function above already broadcasts with NumPy
+    _seg_angle = vectorize(
+        ['f8(f8,f8,f8,f8,f8,f8)'], nopython=True, fastmath=True, cache=True
+    )(_seg_angle)
+
 
 @dataclass
 class TrajectoryPoint:
@@ -37,6 +62,14 @@ class GradientField:
     magnitude: float  # μM/μm
     chemical: str  # e.g., 'phosphate', 'ammonium', 'glucose'
     source_location: Tuple[float, float, float]
+    
+    def __post_init__(self):
+        # Array forms used by the segment kernels, built once per field;
+        # the direction is normalized (a zero vector is kept as is)
+        direction = np.asarray(self.direction, dtype=np.float64)
+        norm = hypot(*direction)
+        self._direction_arr = direction / norm if norm > 0 else direction
+        self._source_arr = np.asarray(self.source_location, dtype=np.float64)
 
 
 @dataclass
@@ -66,44 +99,109 @@ class GradCCalculator:
     θ_error = arccos( (v_actual · v_gradient) / (|v_actual|·|v_gradient|) )
     """
     
-    def __init__(self):
-        """Initialize ∇C calculator."""
-        pass
+    def __init__(self, dtype: type = np.float64):
+        """
+        Initialize ∇C calculator.
+        
+        Args:
+            dtype: Floating type trajectories are stored in. np.float32
+                   halves memory traffic on very long trajectories, at the
+                   cost of precision for positions far from the origin
+                   relative to the step size.
+        """
+        self.dtype = dtype
     
     def load_trajectory(
         self,
-        points: List[Tuple[float, float, float, float]]
-    ) -> List[TrajectoryPoint]:
+        points: Union[List[Tuple[float, ...]], np.ndarray],
+        confidence: Optional[Union[List[float], np.ndarray]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Load hyphal tip tracking data.
         
         Args:
-            points: List of (x, y, z, t) tuples or (x, y, t) for 2D
+            points: List of (x, y, z, t) tuples or (x, y, t) for 2D, or an
+                    (N, 4) / (N, 3) array of them
+            confidence: Per-point tracking confidence (0-1), aligned with
+                        points (default: 0.95 for 3D and 0.9 for 2D points)
         
         Returns:
-            List of TrajectoryPoint objects
+            (points, confidence): an (N, 4) array of self.dtype with
+            columns x, y, z, t (z = 0 for 2D points) and the per-point
+            tracking confidence
+        
+        Raises:
+            ValueError: If confidence does not have one value per point
         """
-        trajectory = []
+        if not isinstance(points, (np.ndarray, list, tuple)):
+            points = list(points)
+        if confidence is not None:
+            confidence = np.asarray(confidence, dtype=np.float64)
+            if confidence.shape != (len(points),):
+                raise ValueError(
+                    f"confidence has shape {confidence.shape}, expected one "
+                    f"value per point ({len(points)})"
+                )
+        
+        # Arrays and sequences of equal-length points convert in one pass,
+        # streaming the coordinates without building per-point objects
+        uniform = None
+        if isinstance(points, np.ndarray):
+            if points.ndim == 2 and points.shape[1] in (3, 4):
+                uniform = np.asarray(points, dtype=self.dtype)
+        else:
+            lengths = set(map(len, points))
+            if len(lengths) == 1 and lengths <= {3, 4}:
+                width = lengths.pop()
+                uniform = np.fromiter(
+                    chain.from_iterable(points), dtype=self.dtype, count=width * len(points)
+                ).reshape(-1, width)
+        
+        if uniform is not None:
+            if uniform.shape[1] == 3:
+                trajectory = np.zeros((len(uniform), 4), dtype=self.dtype)
+                trajectory[:, [0, 1, 3]] = uniform
+                default_confidence = 0.9
+            else:
+                trajectory = uniform
+                default_confidence = 0.95
+            if confidence is not None:
+                return trajectory, confidence
+            return trajectory, np.full(len(trajectory), default_confidence)
+        
+        # Mixed 2D/3D points; malformed points are skipped
+        rows = []
+        point_confidence = []
+        kept = []
         for i, point in enumerate(points):
             if len(point) == 4:
-                x, y, z, t = point
-                confidence = 0.95  # Default confidence
+                rows.append(point)
+                point_confidence.append(0.95)  # Default confidence
             elif len(point) == 3:
                 x, y, t = point
-                z = 0.0
-                confidence = 0.9
+                rows.append((x, y, 0.0, t))
+                point_confidence.append(0.9)
             else:
                 continue
-            
-            trajectory.append(TrajectoryPoint(
-                x=x, y=y, z=z, t=t, confidence=confidence
-            ))
+            kept.append(i)
         
-        return trajectory
+        trajectory = np.array(rows, dtype=self.dtype).reshape(-1, 4)
+        if confidence is not None:
+            return trajectory, confidence[kept]
+        return trajectory, np.array(point_confidence, dtype=np.float64)
+    
+    def _positions(
+        self,
+        trajectory: Union[List[Tuple[float, ...]], np.ndarray]
+    ) -> np.ndarray:
+        """(N, 3) positions of a loaded (N, 4) trajectory or of raw points."""
+        if isinstance(trajectory, np.ndarray) and trajectory.ndim == 2 and trajectory.shape[1] == 4:
+            return trajectory[:, :3]
+        return self.load_trajectory(trajectory)[0][:, :3]
     
     def estimate_gradient(
         self,
-        trajectory: List[TrajectoryPoint],
+        trajectory: Union[List[Tuple[float, ...]], np.ndarray],
         chemical: str = 'phosphate'
     ) -> GradientField:
         """
@@ -112,7 +210,8 @@ class GradCCalculator:
         In real applications, this would use direct measurements from
         microsampling arrays. Here we estimate from trajectory if needed.
         """
-        if len(trajectory) < 2:
+        xyz = self._positions(trajectory)
+        if len(xyz) < 2:
             return GradientField(
                 direction=(1.0, 0.0, 0.0),
                 magnitude=0.0,
@@ -121,13 +220,11 @@ class GradCCalculator:
             )
         
         # Use overall direction of movement as proxy for gradient
-        start = trajectory[0]
-        end = trajectory[-1]
+        start = xyz[0]
+        end = xyz[-1]
         
-        dx = end.x - start.x
-        dy = end.y - start.y
-        dz = end.z - start.z
-        dist = np.sqrt(dx*dx + dy*dy + dz*dz)
+        dx, dy, dz = end - start
+        dist = hypot(dx, dy, dz)
         
         if dist > 0:
             direction = (dx/dist, dy/dist, dz/dist)
@@ -138,60 +235,41 @@ class GradCCalculator:
             direction=direction,
             magnitude=0.1,  # placeholder
             chemical=chemical,
-            source_location=(end.x, end.y, end.z)
+            source_location=tuple(end)
         )
     
     def compute_angular_error(
         self,
-        trajectory: List[TrajectoryPoint],
+        trajectory: Union[List[Tuple[float, ...]], np.ndarray],
         gradient: GradientField
-    ) -> Tuple[float, float, List[float]]:
+    ) -> Tuple[float, float, np.ndarray]:
         """
         Compute angular deviation between growth and gradient.
         
         Returns:
-            (mean_error, max_error, all_errors)
+            (mean_error, max_error, all_errors), errors in degrees for
+            every segment longer than 1e-6 μm
         """
-        if len(trajectory) < 2:
-            return 0.0, 0.0, []
-        
-        errors = []
-        
-        for i in range(1, len(trajectory)):
-            # Growth direction at this segment
-            p1 = trajectory[i-1]
-            p2 = trajectory[i]
-            
-            dx = p2.x - p1.x
-            dy = p2.y - p1.y
-            dz = p2.z - p1.z
-            dist = np.sqrt(dx*dx + dy*dy + dz*dz)
-            
-            if dist < 1e-6:
-                continue
-            
-            growth_dir = (dx/dist, dy/dist, dz/dist)
-            
-            # Calculate angle between growth and gradient
-            dot = (growth_dir[0]*gradient.direction[0] +
-                   growth_dir[1]*gradient.direction[1] +
-                   growth_dir[2]*gradient.direction[2])
-            
-            # Clamp to avoid numerical issues
-            dot = max(-1.0, min(1.0, dot))
-            
-            angle_rad = np.arccos(dot)
-            angle_deg = np.degrees(angle_rad)
-            errors.append(angle_deg)
-        
-        if not errors:
-            return 0.0, 0.0, []
-        
-        return np.mean(errors), np.max(errors), errors
+        xyz = self._positions(trajectory)
+        if len(xyz) < 2:
+            return 0.0, 0.0, np.empty(0)
+        
+        # Growth vector of every segment; too-short segments have no
+        # meaningful direction
+        d = np.diff(xyz, axis=0)
+        d = d[np.linalg.norm(d, axis=1) >= 1e-6]
+        if len(d) == 0:
+            return 0.0, 0.0, np.empty(0)
+        
+        # Angle between growth and gradient, one ufunc call over all segments
+        gx, gy, gz = gradient._direction_arr
+        errors = _seg_angle(d[:, 0], d[:, 1], d[:, 2], gx, gy, gz)
+        
+        return float(errors.mean()), float(errors.max()), errors
     
     def compute_chemotactic_index(
         self,
-        trajectory: List[TrajectoryPoint],
+        trajectory: Union[List[Tuple[float, ...]], np.ndarray],
         gradient: GradientField
     ) -> float:
         """
@@ -199,59 +277,120 @@ class GradCCalculator:
         
         CI = (distance_toward_source) / (total_path_length)
         """
-        if len(trajectory) < 2:
+        xyz = self._positions(trajectory)
+        if len(xyz) < 2:
             return 0.0
         
-        # Calculate source direction
-        start = trajectory[0]
-        
-        # Assume source is at gradient source location
-        sx, sy, sz = gradient.source_location
-        
-        # Direction from start to source
-        dx = sx - start.x
-        dy = sy - start.y
-        dz = sz - start.z
-        dist_to_source = np.sqrt(dx*dx + dy*dy + dz*dz)
+        # Direction from start to source (assumed at the gradient source
+        # location)
+        dx, dy, dz = gradient._source_arr - xyz[0]
+        dist_to_source = hypot(dx, dy, dz)
         
         if dist_to_source < 1e-6:
             return 1.0
         
-        source_dir = (dx/dist_to_source, dy/dist_to_source, dz/dist_to_source)
-        
-        # Calculate net displacement toward source
-        net_displacement = 0.0
-        total_path = 0.0
-        
-        for i in range(1, len(trajectory)):
-            p1 = trajectory[i-1]
-            p2 = trajectory[i]
-            
-            # Path segment vector
-            dx = p2.x - p1.x
-            dy = p2.y - p1.y
-            dz = p2.z - p1.z
-            segment_length = np.sqrt(dx*dx + dy*dy + dz*dz)
-            total_path += segment_length
-            
-            if segment_length > 0:
-                # Project segment onto source direction
-                segment_dir = (dx/segment_length, dy/segment_length, dz/segment_length)
-                dot = (segment_dir[0]*source_dir[0] +
-                       segment_dir[1]*source_dir[1] +
-                       segment_dir[2]*source_dir[2])
-                net_displacement += segment_length * max(0, dot)
+        source_dir = np.array([dx, dy, dz]) / dist_to_source
+        
+        # Net displacement toward source: each segment projected onto the
+        # source direction, backward motion counting as zero
+        d = np.diff(xyz, axis=0)
+        seg_len = np.linalg.norm(d, axis=1)
+        total_path = seg_len.sum()
         
         if total_path > 0:
-            return net_displacement / total_path
+            net_displacement = np.maximum(0.0, d @ source_dir).sum()
+            return float(net_displacement / total_path)
+        else:
+            return 0.0
+    
+    def _segment_metrics(
+        self,
+        xyz: np.ndarray,
+        gradient: GradientField
+    ) -> Tuple[float, np.ndarray, float]:
+        """
+        Trajectory length, per-segment angular errors and chemotactic index
+        of (N, 3) positions, all derived from one set of segment vectors.
+        
+        Matches compute_angular_error and compute_chemotactic_index.
+        """
+        d = np.diff(xyz, axis=0)
+        seg_len = np.linalg.norm(d, axis=1)
+        length = float(seg_len.sum())
+        
+        # Angular errors over segments long enough to have a direction
+        grown = d[seg_len >= 1e-6]
+        gx, gy, gz = gradient._direction_arr
+        errors = _seg_angle(grown[:, 0], grown[:, 1], grown[:, 2], gx, gy, gz)
+        
+        # Chemotactic index from the same segment vectors
+        to_source = gradient._source_arr - xyz[0]
+        dist_to_source = hypot(*to_source)
+        if dist_to_source < 1e-6:
+            chem_index = 1.0
+        elif length > 0:
+            chem_index = float(np.maximum(0.0, d @ (to_source / dist_to_source)).sum() / length)
+        else:
+            chem_index = 0.0
+        
+        return length, errors, chem_index
+    
+    def _reliable_trajectory(
+        self,
+        trajectory_points: List[Tuple[float, float, float, float]],
+        confidence: Optional[Union[List[float], np.ndarray]],
+        min_confidence: float
+    ) -> Tuple[np.ndarray, int]:
+        """Load points, dropping those below min_confidence; returns (trajectory, n_dropped)."""
+        trajectory, point_confidence = self.load_trajectory(trajectory_points, confidence)
+        reliable = point_confidence >= min_confidence
+        n_dropped = len(trajectory) - int(reliable.sum())
+        if n_dropped:
+            trajectory = trajectory[reliable]
+        return trajectory, n_dropped
+    
+    @staticmethod
+    def _navigation_value(mean_error: float, chem_index: float) -> float:
+        """Normalized navigation accuracy before clamping to [0, 1]."""
+        # ∇C_norm = 1 - (mean_error / 180)
+        # But typical range is 0-20 degrees, so we scale
+        if mean_error < 20:
+            # Excellent navigation (<20° error) maps to 0.89-1.0
+            value = 1.0 - (mean_error / 180)
         else:
+            # Poor navigation maps to lower values
+            value = max(0, 1.0 - (mean_error / 90))
+        
+        # Adjust based on chemotactic index
+        return value * (0.5 + 0.5 * chem_index)
+    
+    def _compute_value(
+        self,
+        trajectory_points: List[Tuple[float, float, float, float]],
+        gradient: Optional[GradientField] = None,
+        chemical: str = 'phosphate',
+        confidence: Optional[Union[List[float], np.ndarray]] = None,
+        min_confidence: float = 0.5
+    ) -> float:
+        """∇C value alone, without metadata, warnings or a result object."""
+        trajectory, _ = self._reliable_trajectory(trajectory_points, confidence, min_confidence)
+        if len(trajectory) < 2:
             return 0.0
+        
+        if gradient is None:
+            gradient = self.estimate_gradient(trajectory, chemical)
+        
+        _, errors, chem_index = self._segment_metrics(trajectory[:, :3], gradient)
+        mean_error = float(errors.mean()) if len(errors) else 0.0
+        return min(1.0, max(0.0, self._navigation_value(mean_error, chem_index)))
     
     def compute(
         self,
         trajectory_points: List[Tuple[float, float, float, float]],
         gradient: Optional[GradientField] = None,
-        chemical: str = 'phosphate'
+        chemical: str = 'phosphate',
+        confidence: Optional[Union[List[float], np.ndarray]] = None,
+        min_confidence: float = 0.5
     ) -> GradCResult:
         """
         Compute ∇C from hyphal tip tracking data.
@@ -260,12 +399,17 @@ class GradCCalculator:
             trajectory_points: List of (x, y, z, t) points
             gradient: Known gradient field (if None, estimated)
             chemical: Target chemical gradient
+            confidence: Per-point tracking confidence (see load_trajectory)
+            min_confidence: Points tracked with lower confidence are dropped
+                            before any segment is formed
         
         Returns:
             GradCResult object with calculated value and metadata
         """
-        # Load trajectory
-        trajectory = self.load_trajectory(trajectory_points)
+        # Load trajectory, keeping only reliably tracked points
+        trajectory, n_dropped = self._reliable_trajectory(
+            trajectory_points, confidence, min_confidence
+        )
         
         if len(trajectory) < 2:
             return GradCResult(
@@ -284,36 +428,16 @@ class GradCCalculator:
         if gradient is None:
             gradient = self.estimate_gradient(trajectory, chemical)
         
-        # Calculate trajectory length
-        length = 0.0
-        for i in range(1, len(trajectory)):
-            p1 = trajectory[i-1]
-            p2 = trajectory[i]
-            dx = p2.x - p1.x
-            dy = p2.y - p1.y
-            dz = p2.z - p1.z
-            length += np.sqrt(dx*dx + dy*dy + dz*dz)
-        
-        # Compute angular errors
-        mean_error, max_error, all_errors = self.compute_angular_error(
-            trajectory, gradient
-        )
-        
-        # Compute chemotactic index
-        chem_index = self.compute_chemotactic_index(trajectory, gradient)
-        
-        # Calculate normalized navigation accuracy
-        # ∇C_norm = 1 - (mean_error / 180)
-        # But typical range is 0-20 degrees, so we scale
-        if mean_error < 20:
-            # Excellent navigation (<20° error) maps to 0.89-1.0
-            value = 1.0 - (mean_error / 180)
+        # Length, angular errors and chemotactic index in one pass over the
+        # segments
+        length, errors, chem_index = self._segment_metrics(trajectory[:, :3], gradient)
+        if len(errors):
+            mean_error, max_error = float(errors.mean()), float(errors.max())
         else:
-            # Poor navigation maps to lower values
-            value = max(0, 1.0 - (mean_error / 90))
+            mean_error, max_error = 0.0, 0.0
         
-        # Adjust based on chemotactic index
-        value = value * (0.5 + 0.5 * chem_index)
+        # Calculate normalized navigation accuracy
+        value = self._navigation_value(mean_error, chem_index)
         
         # Generate warnings
         warnings = []
@@ -328,6 +452,9 @@ class GradCCalculator:
         if mean_error > 30:
             warnings.append(f"Large navigation error ({mean_error:.1f}°)")
         
+        if n_dropped:
+            warnings.append(f"{n_dropped} low-confidence points excluded")
+        
         return GradCResult(
             value=min(1.0, max(0.0, value)),
             angular_error=mean_error,
@@ -359,39 +486,33 @@ class GradCCalculator:
         Returns:
             List of (x, y, z, t) points
         """
-        points = [(0.0, 0.0, 0.0, 0.0)]
-        current_pos = np.array([0.0, 0.0, 0.0])
-        target_dir = np.array(target_direction)
+        n_steps = max(length - 1, 0)
+        target_dir = np.array(target_direction, dtype=np.float64)
         target_dir = target_dir / np.linalg.norm(target_dir)
         
-        for i in range(1, length):
-            # Add noise to direction
-            noise_rad = np.radians(np.random.normal(0, noise_level))
-            
-            # Create rotation matrix around random axis
-            axis = np.random.randn(3)
-            axis = axis / np.linalg.norm(axis)
-            
-            # Rodrigues rotation formula
-            cos_theta = np.cos(noise_rad)
-            sin_theta = np.sin(noise_rad)
-            
-            direction = (target_dir * cos_theta +
-                        np.cross(axis, target_dir) * sin_theta +
-                        axis * np.dot(axis, target_dir) * (1 - cos_theta))
-            direction = direction / np.linalg.norm(direction)
-            
-            # Take step
-            current_pos += direction * step_size
-            
-            points.append((
-                current_pos[0],
-                current_pos[1],
-                current_pos[2],
-                i * 60.0  # 1 minute per step
-            ))
-        
-        return points
+        # Angular noise and random rotation axes for all steps at once
+        noise_rad = np.random.normal(0, noise_level, size=n_steps) * _RAD
+        axes = np.random.randn(n_steps, 3)
+        axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+        
+        # Rodrigues rotation of the target direction about each axis
+        cos_theta = np.cos(noise_rad)[:, None]
+        sin_theta = np.sin(noise_rad)[:, None]
+        directions = (target_dir * cos_theta +
+                      np.cross(axes, target_dir) * sin_theta +
+                      axes * (axes @ target_dir)[:, None] * (1 - cos_theta))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        
+        # Positions are the running sum of steps, starting at the origin
+        points = np.zeros((n_steps + 1, 4))
+        np.cumsum(directions * step_size, axis=0, out=points[1:, :3])
+        points[:, 3] = np.arange(n_steps + 1) * 60.0  # 1 minute per step
+        
+        return [tuple(point) for point in points.tolist()]
+
+
+# Shared calculator for the convenience function; it holds no per-call state
+_DEFAULT_CALCULATOR = GradCCalculator()
 
 
 # Convenience function
@@ -409,6 +530,4 @@ def compute_grad_c(
     Returns:
         Normalized navigation accuracy
     """
-    calculator = GradCCalculator()
-    result = calculator.compute(trajectory_points, **kwargs)
-    return result.value
+    return _DEFAULT_CALCULATOR._compute_value(trajectory_points, **kwargs)
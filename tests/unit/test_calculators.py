@@ -0,0 +1,125 @@
+"""
+Unit tests for parameter calculator internals.
+"""
+
+import pytest
+import numpy as np
+from fungi_mycel.parameters import abi, bfs
+from fungi_mycel.parameters.eta_nw import EtaNWCalculator
+
+
+class TestBFS:
+    """Tests for BFS - Biological Field Stability helpers."""
+    
+    def test_detrended_ar1_nan(self):
+        """Test that a NaN in the series does not read as AR1 = 1."""
+        values = np.sin(np.arange(30.0))
+        values[5] = np.nan
+        assert bfs._detrended_ar1(values) == 0.0
+    
+    @pytest.mark.parametrize('use_kernel', [True, False])
+    @pytest.mark.parametrize('values', [
+        np.full(12, 0.62),
+        0.5 + 0.01 * np.arange(12),
+    ])
+    def test_ar1_without_residuals(self, values, use_kernel, monkeypatch):
+        """Test that constant or linear series give AR1 = 0 on both paths."""
+        if not use_kernel:
+            monkeypatch.setattr(bfs, 'NUMBA_AVAILABLE', False)
+        calculator = bfs.BFSCalculator()
+        assert calculator.compute_ar1(values) == 0.0
+        
+        indicators = calculator.detect_tipping_point(values, np.arange(12.0))
+        assert indicators['ar1_ratio'] == 1.0
+    
+    def test_timestamps_required(self):
+        """Test that plain scores without timestamps raise ValueError."""
+        calculator = bfs.BFSCalculator()
+        with pytest.raises(ValueError, match="timestamps"):
+            calculator.compute_from_timeseries([0.3, 0.4, 0.35, 0.38, 0.41])
+        
+        series = bfs.TimeSeries(np.arange(5.0), [0.3, 0.4, 0.35, 0.38, 0.41])
+        assert calculator.compute_from_timeseries(series).n_points == 5
+
+
+class TestABI:
+    """Tests for ABI - AMF Bioindicator Index."""
+    
+    @pytest.mark.parametrize('counts', [[6], [114], [0, 37, 0], np.array([5000])])
+    def test_single_otu_shannon(self, counts):
+        """Test that one OTU gives H' = 0 exactly."""
+        assert abi.ABICalculator().calculate_shannon(counts) == 0.0
+    
+    @pytest.mark.parametrize('use_kernel', [True, False])
+    def test_single_otu_samples(self, use_kernel, monkeypatch):
+        """Test that single-OTU samples do not divide a rounding residue."""
+        if not use_kernel:
+            monkeypatch.setattr(abi, 'NUMBA_AVAILABLE', False)
+        result = abi.ABICalculator().compute_from_counts(
+            [[0], [0], [6], [0]], [[0], [5], [114], [37]], rarefy=False
+        )
+        assert result.shannon_rhizosphere == 0.0
+        assert result.shannon_bulk == 0.0
+        assert result.abi_value == 1.0
+
+
+class TestEtaNW:
+    """Tests for η_NW - Natural Weathering Efficiency."""
+    
+    def test_eta_nw_compute_array(self):
+        """Test array computation matches scalar compute."""
+        calculator = EtaNWCalculator()
+        ph = np.array([3.5, 5.5, 7.0, 8.5])
+        temperature = np.array([5.0, 15.0, 20.0, 25.0])
+        values = calculator.compute_array(
+            dissolution_rate=50.0,
+            acid_production=2.0,
+            contact_area=10.0,
+            mineral_type='feldspar',
+            temperature=temperature,
+            ph=ph
+        )
+        expected = [
+            calculator.compute(50.0, 2.0, 10.0, mineral_type='feldspar',
+                               temperature=t, ph=p).value
+            for t, p in zip(temperature, ph)
+        ]
+        np.testing.assert_allclose(values, expected)
+    
+    def test_eta_nw_compute_array_nan_ph(self):
+        """Test that a NaN pH gets the same floor in compute and compute_array."""
+        calculator = EtaNWCalculator()
+        ph = np.array([np.nan, np.inf, 4.5, 6.6])
+        values = calculator.compute_array(50.0, 2.0, 10.0, ph=ph)
+        expected = [calculator.compute(50.0, 2.0, 10.0, ph=p).value for p in ph]
+        np.testing.assert_allclose(values, expected)
+        assert values[0] == 1.25
+
+
+class TestGradC:
+    """Tests for ∇C - Chemotropic Navigation."""
+    
+    def test_grad_c_low_confidence_points(self):
+        """Test that low-confidence points are excluded."""
+        from fungi_mycel.parameters.grad_c import GradCCalculator
+        
+        calculator = GradCCalculator()
+        trajectory = calculator.simulate_trajectory(length=20)
+        confidence = np.full(20, 0.9)
+        confidence[[3, 7, 8]] = 0.2
+        
+        result = calculator.compute(trajectory, confidence=confidence)
+        assert result.n_points == 17
+        assert any('low-confidence' in w for w in result.warnings)
+    
+    def test_grad_c_confidence_length(self):
+        """Test that a confidence array of the wrong length raises ValueError."""
+        from fungi_mycel.parameters.grad_c import GradCCalculator
+        
+        calculator = GradCCalculator()
+        trajectory = calculator.simulate_trajectory(length=20)
+        with pytest.raises(ValueError, match="confidence"):
+            calculator.load_trajectory(trajectory, confidence=np.full(19, 0.9))
+        with pytest.raises(ValueError, match="confidence"):
+            calculator.load_trajectory([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 1.0)],
+                                       confidence=[0.9])
@@ -4,7 +4,8 @@ Unit tests for core MNIS functionality.
 
 import pytest
 import numpy as np
-from fungi_mycel.core import MNIS, compute_mnis, MNISResult
+from fungi_mycel import core
+from fungi_mycel.core import MNIS, compute_mnis, MNISResult, BIOME_REFERENCES
 from fungi_mycel.utils.constants import PARAMETERS, BIOMES
 
 
@@ -89,6 +90,22 @@ class TestMNISCore:
         assert len(results) == 2
         assert all(isinstance(r, MNISResult) for r in results)
     
+    def test_batch_compute_array(self, sample_parameters):
+        """Test array batch computation matches per-sample compute."""
+        mnis = MNIS()
+        order = ['eta_nw', 'e_a', 'rho_e', 'grad_c', 'ser', 'k_topo', 'abi', 'bfs']
+        rng = np.random.default_rng(42)
+        X = rng.uniform(0.0, 2.5, size=(50, 8))
+        X[0] = [sample_parameters[p] for p in order]
+        
+        scores, classes = mnis.batch_compute_array(X)
+        
+        assert scores.shape == (50,)
+        for row, score, cls in zip(X, scores, classes):
+            expected = mnis.compute(dict(zip(order, row)))
+            assert score == pytest.approx(expected.mnis_score)
+            assert cls == expected.class_name
+    
     def test_result_to_dict(self, sample_parameters):
         """Test MNISResult to_dict method."""
         mnis = MNIS()
@@ -138,3 +155,54 @@ class TestMNISCore:
         
         result = mnis.compute(extreme_params)
         assert len(result.warning_flags) > 0
+    
+    @pytest.mark.parametrize('biome', list(BIOME_REFERENCES))
+    def test_minimum_thresholds(self, biome):
+        """Test that inputs at every minimum score exactly 0 on both paths."""
+        mnis = MNIS(biome=biome)
+        params = {p: ref['min'] for p, ref in BIOME_REFERENCES[biome].items()}
+        expected = [f"{p} at minimum threshold" for p in mnis.weights]
+        
+        result = mnis.compute(params)
+        assert result.mnis_score == 0.0
+        assert sorted(result.warning_flags) == sorted(expected)
+        
+        batch_result, = mnis.batch_compute([params])
+        assert batch_result.mnis_score == 0.0
+        assert sorted(batch_result.warning_flags) == sorted(expected)
+    
+    @pytest.mark.parametrize('biome', list(BIOME_REFERENCES))
+    @pytest.mark.parametrize('use_kernel', [True, False])
+    def test_maximum_thresholds(self, biome, use_kernel, monkeypatch):
+        """Test inputs at every max_ref on the scalar, kernel and NumPy paths."""
+        if not use_kernel:
+            monkeypatch.setattr(core, '_batch_kernel', lambda: None)
+        mnis = MNIS(biome=biome)
+        params = {p: ref['max_ref'] for p, ref in BIOME_REFERENCES[biome].items()}
+        # SER falls off above its optimal range and reaches 0 at max_ref
+        expected = sorted(
+            'ser at minimum threshold' if p == 'ser' else f"{p} at maximum threshold"
+            for p in mnis.weights
+        )
+        
+        result = mnis.compute(params)
+        batch_result, = mnis.batch_compute([params])
+        assert sorted(result.warning_flags) == expected
+        assert sorted(batch_result.warning_flags) == expected
+        assert dict(batch_result.normalized_params) == result.normalized_params
+    
+    @pytest.mark.parametrize('use_kernel', [True, False])
+    def test_nan_score_unknown(self, sample_parameters, use_kernel, monkeypatch):
+        """Test that a NaN parameter gives class UNKNOWN, not COLLAPSE."""
+        if not use_kernel:
+            monkeypatch.setattr(core, '_batch_kernel', lambda: None)
+        mnis = MNIS()
+        params = {**sample_parameters, 'eta_nw': float('nan')}
+        
+        assert mnis.compute(params).class_name == 'UNKNOWN'
+        assert mnis.batch_compute([params])[0].class_name == 'UNKNOWN'
+        X = np.array([[params[p] for p in core._PARAM_ORDER]])
+        for dtype in (np.float64, np.float32):
+            scores, classes = mnis.batch_compute_array(X, dtype=dtype)
+            assert np.isnan(scores[0])
+            assert classes.tolist() == ['UNKNOWN']
@@ -0,0 +1,193 @@
+"""
+Unit tests for data loaders and exporters.
+"""
+
+import os
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from fungi_mycel.io import loaders, exporters
+from fungi_mycel.io.loaders import (
+    load_parameters, load_icpms_data, load_electrode_data
+)
+
+
+def _pandas_first_row(file_path):
+    """First CSV row as floats, parsed by pandas; non-numeric columns dropped."""
+    row = pd.read_csv(file_path).iloc[0]
+    values = {}
+    for col, value in row.items():
+        try:
+            values[col] = float(value)
+        except (ValueError, TypeError):
+            pass
+    return values
+
+
+def _assert_same_floats(actual, expected):
+    assert actual.keys() == expected.keys()
+    np.testing.assert_array_equal(
+        [actual[k] for k in expected], [expected[k] for k in expected]
+    )
+
+
+class TestSmallCSV:
+    """The csv-module path for small files must match pandas."""
+
+    @pytest.fixture(params=['NA', 'N/A', 'null', 'NaN', '', 'n/a', '#N/A'])
+    def na_csv(self, request, tmp_path):
+        """Parameter CSV with one missing value."""
+        path = tmp_path / 'params.csv'
+        path.write_text(f"site_id,eta_nw,rho_e,Fe\ns1,{request.param},0.4,1.5\n")
+        return path
+
+    @pytest.fixture
+    def bom_csv(self, tmp_path):
+        """Parameter CSV saved with a UTF-8 byte order mark."""
+        path = tmp_path / 'bom.csv'
+        path.write_bytes(b'\xef\xbb\xbfeta_nw,rho_e,Fe\n0.8,0.4,1.5\n')
+        return path
+
+    def test_icpms_na_values(self, na_csv):
+        """Test that missing ICP-MS values load as NaN like pd.read_csv."""
+        _assert_same_floats(load_icpms_data(na_csv), _pandas_first_row(na_csv))
+
+    def test_icpms_bom(self, bom_csv):
+        """Test that a BOM does not rename the first ICP-MS column."""
+        _assert_same_floats(load_icpms_data(bom_csv), _pandas_first_row(bom_csv))
+
+    def test_parameters_na_values(self, na_csv, monkeypatch):
+        """Test that missing parameters load as NaN like the pandas path."""
+        small = load_parameters(na_csv)
+        assert np.isnan(small['eta_nw'])
+        monkeypatch.setattr(loaders, '_SMALL_CSV_BYTES', 0)
+        _assert_same_floats(small, load_parameters(na_csv))
+
+    def test_parameters_bom(self, bom_csv, monkeypatch):
+        """Test that a BOM does not rename the first parameter column."""
+        small = load_parameters(bom_csv)
+        assert small['eta_nw'] == 0.8
+        monkeypatch.setattr(loaders, '_SMALL_CSV_BYTES', 0)
+        _assert_same_floats(small, load_parameters(bom_csv))
+
+
+class TestParsedFileCache:
+    """Cached parses of small CSV and JSON files."""
+    
+    def test_rewrite_with_same_mtime(self, tmp_path):
+        """Test that a rewrite keeping the mtime but not the size is reread."""
+        path = tmp_path / 'params.csv'
+        path.write_text('eta_nw,rho_e\n0.8,0.4\n')
+        stat = path.stat()
+        assert load_parameters(path)['eta_nw'] == 0.8
+        
+        path.write_text('eta_nw,rho_e\n0.85,0.4\n')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert load_parameters(path)['eta_nw'] == 0.85
+    
+    def test_icpms_json_copies(self, tmp_path):
+        """Test that ICP-MS JSON results are plain, independent dicts and lists."""
+        path = tmp_path / 'icpms.json'
+        path.write_text('{"Fe": 1.5, "Ca": [2.0, 2.5]}')
+        data = load_icpms_data(path)
+        assert type(data) is dict and type(data['Ca']) is list
+        data['Fe'] = 0.0
+        data['Ca'].append(3.0)
+        assert load_icpms_data(path) == {'Fe': 1.5, 'Ca': [2.0, 2.5]}
+
+
+class TestElectrodeFiles:
+    """Header handling and archive keys of electrode recordings."""
+    
+    def test_numeric_header(self, tmp_path):
+        """Test that a numeric header row is not read as a sample."""
+        path = tmp_path / 'electrodes.csv'
+        path.write_text('0,1,2\n0.1,0.2,0.3\n0.4,0.5,0.6\n')
+        data, _ = load_electrode_data(path)
+        np.testing.assert_array_equal(data, [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+    
+    @pytest.mark.parametrize('text, n_rows', [
+        ('e0,e1\n0.1,0.2\n', 1),
+        ('0.1,0.2\n0.3,0.4\n', 2),
+    ])
+    def test_infer_header(self, text, n_rows, tmp_path):
+        """Test that csv_header='infer' keeps the first sample of headerless files."""
+        path = tmp_path / 'electrodes.csv'
+        path.write_text(text)
+        data, _ = load_electrode_data(path, csv_header='infer')
+        assert data.shape == (n_rows, 2)
+    
+    def test_headerless(self, tmp_path):
+        """Test csv_header=None."""
+        path = tmp_path / 'electrodes.csv'
+        path.write_text('0,1,2\n0.1,0.2,0.3\n')
+        data, _ = load_electrode_data(path, csv_header=None)
+        assert data.shape == (2, 3)
+
+    def test_npz_missing_array(self, tmp_path):
+        """Test that an .npz without electrode data names the expected keys."""
+        path = tmp_path / 'electrodes.npz'
+        np.savez(path, voltages=np.zeros(3), sampling_rate=500.0)
+        with pytest.raises(ValueError, match="'electrode_data' or 'data'.*voltages"):
+            load_electrode_data(path)
+
+
+class TestCSVExport:
+    """The pandas path for large exports must match csv.DictWriter."""
+    
+    @pytest.fixture
+    def records(self):
+        """Records with more rows than the pandas threshold and gaps."""
+        rows = [
+            {'site_id': f's{i}', 'n_samples': i, 'mnis_score': i / 3}
+            for i in range(exporters._CSV_PANDAS_MIN_ROWS + 10)
+        ]
+        del rows[3]['n_samples']
+        rows[4]['mnis_score'] = None
+        rows[5]['note'] = 'a,b'
+        return rows
+    
+    def test_pandas_path_matches_dictwriter(self, records, tmp_path, monkeypatch):
+        """Test that ints with missing keys are not written as floats."""
+        exporters.export_to_csv(records, tmp_path / 'pandas.csv')
+        monkeypatch.setattr(exporters, '_CSV_PANDAS_MIN_ROWS', len(records))
+        exporters.export_to_csv(records, tmp_path / 'dictwriter.csv')
+        
+        written = (tmp_path / 'pandas.csv').read_text()
+        assert written == (tmp_path / 'dictwriter.csv').read_text()
+        assert '\n0.0,0,,s0\n' in written
+        assert '\n1.0,,,s3\n' in written
+    
+    def test_batch_csv(self, records, tmp_path, monkeypatch):
+        """Test export_mnis_batch CSV output against csv.DictWriter."""
+        exporters.export_mnis_batch(records, tmp_path / 'batch', formats=['csv'])
+        monkeypatch.setattr(exporters, '_CSV_PANDAS_MIN_ROWS', len(records))
+        exporters.export_to_csv(records, tmp_path / 'single.csv')
+        batch_csv, = (tmp_path / 'batch').glob('mnis_batch_*.csv')
+        assert batch_csv.read_text() == (tmp_path / 'single.csv').read_text()
+
+
+class TestJSONExport:
+    """orjson output must match the json module fallback."""
+    
+    @pytest.mark.parametrize('value', [
+        float('nan'),
+        float('inf'),
+        [0.5, float('-inf')],
+        np.float64(np.nan),
+        None,
+        datetime(2024, 5, 1, 12, 30),
+        2**70,
+        np.float64(0.25),
+        'site A',
+    ])
+    def test_backends_match(self, value, tmp_path, monkeypatch):
+        """Test that both backends write the same file."""
+        data = {'results': [{'site_id': 's1', 'value': value}], 'n': 1}
+        exporters.export_to_json(data, tmp_path / 'default.json')
+        monkeypatch.setattr(exporters, 'ORJSON_AVAILABLE', False)
+        exporters.export_to_json(data, tmp_path / 'json.json')
+        
+        written = (tmp_path / 'default.json').read_text()
+        assert written == (tmp_path / 'json.json').read_text()